@@ -1,91 +1,445 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-import openai
-import anthropic
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+import asyncio
+import hashlib
+import math
+import random
+import threading
+import time
+import weakref
+from types import SimpleNamespace
 from config import get_config
+from rate_limit import get_rate_limiter, estimate_request_tokens
+from token_usage import TokenUsage, record_usage
 
 class AIProvider(ABC):
-    """Abstract base class for AI providers"""
+    """Abstract base class for AI providers
+
+    Messages are dicts with "role" and "content". A message may also set
+    "cache": True to mark the end of a stable prompt prefix (such as the resume
+    context) that providers with prompt caching should cache.
+    """
     
     @abstractmethod
     def generate_response(self, messages: List[Dict[str, str]], **kwargs) -> str:
         """Generate a response from the AI provider"""
         pass
+    
+    async def agenerate_response(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        """Generate a response without blocking the event loop.
+
+        Providers with a native async client override this; the default runs the
+        blocking call in a worker thread.
+        """
+        return await asyncio.to_thread(self.generate_response, messages, **kwargs)
+    
+    def stream_response(self, messages: List[Dict[str, str]], **kwargs) -> Iterator[str]:
+        """Yield the response text in chunks as the provider produces it"""
+        yield self.generate_response(messages, **kwargs)
+    
+    async def aclose(self) -> None:
+        """Release async resources bound to the running event loop; call before the loop ends"""
+        pass
 
-class OpenAIProvider(AIProvider):
+class PooledAsyncClientMixin:
+    """Keeps one async SDK client, and so one keep-alive connection pool, per event loop.
+
+    Async HTTP connections are bound to the loop that opened them, so a client
+    cannot be shared across separate asyncio.run() calls; aclose() closes the
+    running loop's client before the loop ends.
+    """
+    
+    def _init_async_clients(self) -> None:
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._async_clients_lock = threading.Lock()
+    
+    def _create_async_client(self):
+        raise NotImplementedError
+    
+    @property
+    def rate_limiter(self):
+        return get_rate_limiter(self.name, self.model)
+    
+    def _estimate_tokens(self, params: Dict[str, Any]) -> int:
+        messages = list(params["messages"])
+        system = params.get("system")
+        if isinstance(system, list):
+            messages.extend({"content": block["text"]} for block in system)
+        elif system:
+            messages.append({"content": system})
+        return estimate_request_tokens(messages, params["max_tokens"])
+    
+    @property
+    def async_client(self):
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = self._create_async_client()
+                self._async_clients[loop] = client
+            return client
+    
+    async def aclose(self) -> None:
+        with self._async_clients_lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+class OpenAIProvider(PooledAsyncClientMixin, AIProvider):
     """OpenAI provider implementation"""
     
+    name = "openai"
+    
     def __init__(self, api_key: Optional[str] = None):
         config = get_config()
-        self.client = openai.OpenAI(api_key=api_key or config.openai_api_key)
+        self.api_key = api_key or config.openai_api_key
+        import openai
+        
+        # Retries are handled by the shared rate limiter, not the SDK
+        self.client = openai.OpenAI(api_key=self.api_key, max_retries=0)
         self.model = config.openai_model
+        self._init_async_clients()
+    
+    def _create_async_client(self):
+        import openai
         
-    def generate_response(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        return openai.AsyncOpenAI(api_key=self.api_key, max_retries=0)
+    
+    def _request_params(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
         config = get_config()
-        
+        # OpenAI caches long prompt prefixes automatically, so the cache marker is just dropped
+        return {
+            "model": self.model,
+            "messages": [{"role": msg["role"], "content": msg["content"]} for msg in messages],
+            "max_tokens": kwargs.get('max_tokens', config.max_tokens),
+            "temperature": kwargs.get('temperature', config.temperature)
+        }
+    
+    @staticmethod
+    def _record_usage(usage) -> None:
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        record_usage(TokenUsage(
+            input_tokens=usage.prompt_tokens or 0,
+            output_tokens=usage.completion_tokens or 0,
+            cached_tokens=(getattr(details, "cached_tokens", None) or 0) if details else 0
+        ))
+    
+    def generate_response(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        params = self._request_params(messages, **kwargs)
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=kwargs.get('max_tokens', config.max_tokens),
-                temperature=kwargs.get('temperature', config.temperature)
+            response = self.rate_limiter.call(
+                lambda: self.client.chat.completions.create(**params),
+                self._estimate_tokens(params)
             )
+            self._record_usage(response.usage)
             return response.choices[0].message.content
         except Exception as e:
             raise Exception(f"OpenAI API error: {str(e)}")
+    
+    async def agenerate_response(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        params = self._request_params(messages, **kwargs)
+        try:
+            response = await self.rate_limiter.acall(
+                lambda: self.async_client.chat.completions.create(**params),
+                self._estimate_tokens(params)
+            )
+            self._record_usage(response.usage)
+            return response.choices[0].message.content
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
+    
+    def stream_response(self, messages: List[Dict[str, str]], **kwargs) -> Iterator[str]:
+        params = self._request_params(messages, **kwargs)
+        try:
+            stream = self.rate_limiter.stream(
+                lambda: self.client.chat.completions.create(
+                    **params, stream=True, stream_options={"include_usage": True}
+                ),
+                self._estimate_tokens(params)
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                # Usage arrives on a final chunk with no choices
+                if getattr(chunk, "usage", None):
+                    self._record_usage(chunk.usage)
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
 
-class AnthropicProvider(AIProvider):
+class AnthropicProvider(PooledAsyncClientMixin, AIProvider):
     """Anthropic provider implementation"""
     
+    name = "anthropic"
+    
     def __init__(self, api_key: Optional[str] = None):
         config = get_config()
-        self.client = anthropic.Anthropic(api_key=api_key or config.anthropic_api_key)
+        self.api_key = api_key or config.anthropic_api_key
+        import anthropic
+        
+        # Retries are handled by the shared rate limiter, not the SDK
+        self.client = anthropic.Anthropic(api_key=self.api_key, max_retries=0)
         self.model = config.anthropic_model
+        self._init_async_clients()
+    
+    def _create_async_client(self):
+        import anthropic
         
-    def generate_response(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        return anthropic.AsyncAnthropic(api_key=self.api_key, max_retries=0)
+    
+    def _request_params(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
         config = get_config()
         
+        # Convert messages to Anthropic format; system messages become system blocks
+        # and a cache marker becomes a prompt caching breakpoint
+        system_blocks = []
+        user_messages = []
+        
+        for msg in messages:
+            if msg["role"] == "system":
+                block = {"type": "text", "text": msg["content"]}
+                if msg.get("cache"):
+                    block["cache_control"] = {"type": "ephemeral"}
+                system_blocks.append(block)
+            else:
+                user_messages.append({"role": msg["role"], "content": msg["content"]})
+        
+        return {
+            "model": self.model,
+            "max_tokens": kwargs.get('max_tokens', config.max_tokens),
+            "temperature": kwargs.get('temperature', config.temperature),
+            "system": system_blocks or "",
+            "messages": user_messages
+        }
+    
+    @staticmethod
+    def _usage(usage) -> TokenUsage:
+        # Anthropic's input_tokens excludes prompt cache reads and writes
+        cached = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        return TokenUsage(
+            input_tokens=(usage.input_tokens or 0) + cached + cache_write,
+            output_tokens=usage.output_tokens or 0,
+            cached_tokens=cached,
+            cache_write_tokens=cache_write
+        )
+    
+    def generate_response(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        params = self._request_params(messages, **kwargs)
         try:
-            # Convert messages to Anthropic format
-            system_message = ""
-            user_messages = []
-            
-            for msg in messages:
-                if msg["role"] == "system":
-                    system_message = msg["content"]
-                else:
-                    user_messages.append(msg)
-            
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=kwargs.get('max_tokens', config.max_tokens),
-                temperature=kwargs.get('temperature', config.temperature),
-                system=system_message,
-                messages=user_messages
+            response = self.rate_limiter.call(
+                lambda: self.client.messages.create(**params),
+                self._estimate_tokens(params)
+            )
+            record_usage(self._usage(response.usage))
+            return response.content[0].text
+        except Exception as e:
+            raise Exception(f"Anthropic API error: {str(e)}")
+    
+    async def agenerate_response(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        params = self._request_params(messages, **kwargs)
+        try:
+            response = await self.rate_limiter.acall(
+                lambda: self.async_client.messages.create(**params),
+                self._estimate_tokens(params)
             )
+            record_usage(self._usage(response.usage))
             return response.content[0].text
         except Exception as e:
             raise Exception(f"Anthropic API error: {str(e)}")
+    
+    def stream_response(self, messages: List[Dict[str, str]], **kwargs) -> Iterator[str]:
+        params = self._request_params(messages, **kwargs)
+        try:
+            stream = self.rate_limiter.stream(
+                lambda: self.client.messages.create(**params, stream=True),
+                self._estimate_tokens(params)
+            )
+            usage = None
+            for event in stream:
+                if event.type == "content_block_delta" and event.delta.type == "text_delta":
+                    yield event.delta.text
+                elif event.type == "message_start":
+                    usage = self._usage(event.message.usage)
+                elif event.type == "message_delta" and usage is not None:
+                    # Output tokens so far; the last delta carries the final count
+                    usage.output_tokens = event.usage.output_tokens
+            if usage is not None:
+                record_usage(usage)
+        except Exception as e:
+            raise Exception(f"Anthropic API error: {str(e)}")
+
+class LocalRateLimitError(Exception):
+    """Simulated 429, shaped like an SDK error so the rate limiter retries it"""
+    
+    status_code = 429
+    
+    def __init__(self, retry_after_ms: float):
+        super().__init__("429 Too Many Requests (simulated by the local provider)")
+        self.response = SimpleNamespace(status_code=429, headers={"retry-after-ms": str(retry_after_ms)})
+
+# Filler vocabulary for simulated responses; each word counts as one output token
+_LOCAL_WORDS = (
+    "tailor quantify impact lead ship measure improve deliver analyze design build scale "
+    "python sql pipeline model team product customer metric launch review mentor"
+).split()
+
+class LocalProvider(AIProvider):
+    """Offline stand-in that simulates a provider's latency, token rate, streaming and 429s.
+
+    Time to first token is drawn from a lognormal distribution around
+    local_latency_ms, then output arrives at local_tokens_per_second (0 means
+    all at once). A share of requests, local_error_rate, are answered with a
+    retryable 429. Responses go through the shared rate limiter like the real
+    providers, so retries and adaptive concurrency are exercised too.
+    """
+    
+    name = "local"
+    
+    def __init__(self):
+        config = get_config()
+        self.model = config.local_model
+        self.latency_ms = config.local_latency_ms
+        self.latency_sigma = config.local_latency_sigma
+        self.tokens_per_second = config.local_tokens_per_second
+        self.output_tokens = config.local_output_tokens
+        self.error_rate = config.local_error_rate
+        self.retry_after_ms = config.local_retry_after_ms
+        self._random = random.Random(config.local_seed)
+        self._lock = threading.Lock()
+        # Hashes of prompt prefixes marked for caching, to report cache hits like Anthropic
+        self._cached_prefixes = set()
+    
+    @property
+    def rate_limiter(self):
+        return get_rate_limiter(self.name, self.model)
+    
+    def _tokens(self, max_tokens: int) -> List[str]:
+        count = min(self.output_tokens, max_tokens)
+        words = [
+            _LOCAL_WORDS[i % len(_LOCAL_WORDS)] + ("\n\n" if i % 40 == 39 else " ")
+            for i in range(max(count - 1, 0))
+        ]
+        return ["# Simulated response\n\n"] + words if count else []
+    
+    def _start(self) -> float:
+        """Decide one attempt's outcome: raise a 429, or return the time to first token"""
+        with self._lock:
+            if self.error_rate > 0 and self._random.random() < self.error_rate:
+                raise LocalRateLimitError(self.retry_after_ms)
+            if self.latency_ms <= 0:
+                return 0.0
+            return self._random.lognormvariate(math.log(self.latency_ms / 1000), self.latency_sigma)
+    
+    def _generation_seconds(self, tokens: int) -> float:
+        return tokens / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+    
+    def _usage(self, messages: List[Dict[str, str]], output_tokens: int) -> TokenUsage:
+        usage = TokenUsage(
+            input_tokens=sum(len(str(msg["content"])) for msg in messages) // 4,
+            output_tokens=output_tokens
+        )
+        
+        prefix = hashlib.sha256()
+        for index, msg in enumerate(messages):
+            prefix.update(str(msg["content"]).encode('utf-8'))
+            if not msg.get("cache"):
+                continue
+            prefix_tokens = sum(len(str(m["content"])) for m in messages[:index + 1]) // 4
+            with self._lock:
+                if prefix.hexdigest() in self._cached_prefixes:
+                    usage.cached_tokens = prefix_tokens
+                else:
+                    self._cached_prefixes.add(prefix.hexdigest())
+                    usage.cache_write_tokens = prefix_tokens
+        return usage
+    
+    def _call_params(self, messages: List[Dict[str, str]], **kwargs) -> Tuple[List[str], int]:
+        max_tokens = kwargs.get('max_tokens', get_config().max_tokens)
+        return self._tokens(max_tokens), estimate_request_tokens(messages, max_tokens)
+    
+    def generate_response(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        tokens, estimated_tokens = self._call_params(messages, **kwargs)
+        
+        def complete() -> None:
+            time.sleep(self._start() + self._generation_seconds(len(tokens)))
+        
+        self.rate_limiter.call(complete, estimated_tokens)
+        record_usage(self._usage(messages, len(tokens)))
+        return "".join(tokens)
+    
+    async def agenerate_response(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        tokens, estimated_tokens = self._call_params(messages, **kwargs)
+        
+        async def complete() -> None:
+            await asyncio.sleep(self._start() + self._generation_seconds(len(tokens)))
+        
+        await self.rate_limiter.acall(complete, estimated_tokens)
+        record_usage(self._usage(messages, len(tokens)))
+        return "".join(tokens)
+    
+    def _paced(self, tokens: List[str], first_token_delay: float) -> Iterator[str]:
+        time.sleep(first_token_delay)
+        started = time.monotonic()
+        for index, token in enumerate(tokens):
+            # Sleep to a schedule rather than a fixed gap so sleep overhead does not add up
+            wait = started + self._generation_seconds(index + 1) - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            yield token
+    
+    def stream_response(self, messages: List[Dict[str, str]], **kwargs) -> Iterator[str]:
+        tokens, estimated_tokens = self._call_params(messages, **kwargs)
+        
+        # _start raises the simulated 429s when the stream is opened, so they are retried like the real providers'
+        yield from self.rate_limiter.stream(lambda: self._paced(tokens, self._start()), estimated_tokens)
+        record_usage(self._usage(messages, len(tokens)))
 
 class AIProviderFactory:
-    """Factory for creating AI providers"""
+    """Factory for creating AI providers
+
+    Providers are process-wide singletons per (provider, model, API key), so every
+    CareerAgent shares the same SDK clients and their keep-alive connection pools.
+    """
+    
+    _instances: Dict[Tuple[str, str, str], AIProvider] = {}
+    _lock = threading.Lock()
     
     @staticmethod
     def create_provider(provider_name: Optional[str] = None) -> AIProvider:
         config = get_config()
-        provider = provider_name or config.default_provider
+        provider = (provider_name or config.default_provider).lower()
         
-        if provider.lower() == "openai":
+        if provider == "openai":
             if not config.openai_api_key:
                 raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY environment variable.")
-            return OpenAIProvider()
-        elif provider.lower() == "anthropic":
+            key = (provider, config.openai_model, config.openai_api_key)
+            provider_class = OpenAIProvider
+        elif provider == "anthropic":
             if not config.anthropic_api_key:
                 raise ValueError("Anthropic API key not found. Please set ANTHROPIC_API_KEY environment variable.")
-            return AnthropicProvider()
+            key = (provider, config.anthropic_model, config.anthropic_api_key)
+            provider_class = AnthropicProvider
+        elif provider == "local":
+            key = (provider, config.local_model, "")
+            provider_class = LocalProvider
         else:
             raise ValueError(f"Unsupported provider: {provider}")
+        
+        with AIProviderFactory._lock:
+            instance = AIProviderFactory._instances.get(key)
+            if instance is None:
+                instance = provider_class()
+                AIProviderFactory._instances[key] = instance
+            return instance
+    
+    @staticmethod
+    def reset() -> None:
+        """Drop all cached provider instances"""
+        with AIProviderFactory._lock:
+            AIProviderFactory._instances.clear()
 
 def get_ai_provider(provider_name: Optional[str] = None) -> AIProvider:
     """Get an AI provider instance"""
-    return AIProviderFactory.create_provider(provider_name)
\ No newline at end of file
+    return AIProviderFactory.create_provider(provider_name)
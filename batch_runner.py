@@ -0,0 +1,164 @@
+import os
+import re
+import json
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Dict, Optional, Callable, Set, Tuple, TYPE_CHECKING
+
+from output_writer import set_record_labels
+from job_queue import read_job_records
+
+if TYPE_CHECKING:
+    from career_agent import CareerAgent
+
+BATCH_TASKS = ['optimize', 'cover_letter']
+
+# Columns that carry free-text context about a role, in the order they are included
+DESCRIPTION_COLUMNS = ['role', 'text', 'location', 'remote', 'salary', 'fit_reason', 'next_action', 'notes']
+
+@dataclass
+class JobRow:
+    """One role from a job queue CSV"""
+    key: str
+    company: str
+    role: str
+    job_description: str
+    # The posting's own text and links, used to spot the same job listed twice
+    text: str = ''
+    urls: List[str] = field(default_factory=list)
+
+def slugify(value: str, max_length: int = 60) -> str:
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', value).strip('_')
+    return slug[:max_length] or "row"
+
+def load_job_queue(csv_path: str) -> List[JobRow]:
+    """Read a job queue CSV (tracker, target queue or HN queue) into JobRows"""
+    rows = []
+    for key, company, role, record in read_job_records(csv_path):
+        description_parts = []
+        for column in DESCRIPTION_COLUMNS:
+            value = (record.get(column) or '').strip()
+            if value:
+                label = column.replace('_', ' ').title()
+                description_parts.append(f"{label}: {value}")
+        
+        urls = []
+        for column in ('urls', 'job_link', 'url'):
+            urls.extend(url.strip() for url in (record.get(column) or '').split(';') if url.strip())
+        
+        rows.append(JobRow(
+            key=key,
+            company=company or "Unknown company",
+            role=role,
+            job_description="\n".join(description_parts),
+            text=(record.get('text') or '').strip(),
+            urls=urls
+        ))
+    
+    return rows
+
+class BatchCheckpoint:
+    """Append-only JSONL record of completed (row key, task) pairs"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.completed: Set[Tuple[str, str]] = set()
+        self._lock = threading.Lock()
+        
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A crash mid-write can leave a truncated last line
+                        continue
+                    self.completed.add((entry['key'], entry['task']))
+    
+    def is_done(self, key: str, task: str) -> bool:
+        return (key, task) in self.completed
+    
+    def mark_done(self, key: str, task: str, output_path: str) -> None:
+        """Record a completed task durably before moving on"""
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({"key": key, "task": task, "output_path": output_path}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self.completed.add((key, task))
+
+class BatchRunner:
+    """Fans resume optimization and cover letters out over a job queue under a concurrency limit"""
+    
+    def __init__(self, agent: "CareerAgent", output_dir: str, concurrency: int = 4,
+                 checkpoint_path: Optional[str] = None):
+        self.agent = agent
+        self.output_dir = Path(output_dir)
+        self.concurrency = concurrency
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.checkpoint = BatchCheckpoint(checkpoint_path or str(self.output_dir / "checkpoint.jsonl"))
+    
+    def output_path(self, row: JobRow, task: str) -> Path:
+        key_hash = hashlib.sha1(row.key.encode('utf-8')).hexdigest()[:10]
+        filename = f"{slugify(row.company)}_{key_hash}_{task}.md"
+        return self.output_dir / filename
+    
+    async def _run_task(self, row: JobRow, task: str) -> str:
+        if task == 'optimize':
+            return await self.agent.aoptimize_resume_for_job(row.job_description)
+        elif task == 'cover_letter':
+            return await self.agent.agenerate_cover_letter(row.job_description, row.company)
+        else:
+            raise ValueError(f"Unsupported batch task: {task}")
+    
+    async def run(self, rows: List[JobRow], tasks: List[str],
+                  on_progress: Optional[Callable[[JobRow, str, Optional[Exception]], None]] = None) -> Dict[str, int]:
+        """Run every pending (row, task) pair; completed pairs from the checkpoint are skipped"""
+        import asyncio
+        
+        # Parse the resume once up front so concurrent tasks share it
+        if not self.agent.resume_data:
+            self.agent.load_resume()
+        
+        semaphore = asyncio.Semaphore(self.concurrency)
+        stats = {"completed": 0, "skipped": 0, "failed": 0}
+        
+        async def process(row: JobRow, task: str) -> None:
+            async with semaphore:
+                error = None
+                try:
+                    set_record_labels(row_key=row.key, company=row.company)
+                    content = await self._run_task(row, task)
+                    if self.agent.output_log is not None:
+                        # jsonl mode: the agent already appended the response to its log; it must
+                        # be on disk before the checkpoint says so, or a crash would lose it for good
+                        self.agent.output_log.sync()
+                        output_path = self.agent.output_log.path
+                    else:
+                        output_path = self.output_path(row, task)
+                        with open(output_path, 'w', encoding='utf-8') as f:
+                            f.write(content)
+                    self.checkpoint.mark_done(row.key, task, str(output_path))
+                    stats["completed"] += 1
+                except Exception as e:
+                    error = e
+                    stats["failed"] += 1
+                
+                if on_progress:
+                    on_progress(row, task, error)
+        
+        pending = []
+        for row in rows:
+            for task in tasks:
+                if self.checkpoint.is_done(row.key, task):
+                    stats["skipped"] += 1
+                else:
+                    pending.append(process(row, task))
+        
+        try:
+            await asyncio.gather(*pending)
+        finally:
+            await self.agent.ai_provider.aclose()
+        return stats
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the line extraction engine.
+
+Scales the bundled resume_plaintext.txt up (1000x by default) and reports
+lines/sec for the legacy per-line re.search loops and for the precompiled
+LineClassifier used by ResumeLineConsumer.
+
+    python benchmarks/bench_extraction.py [--scale 1000] [--repeat 3]
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+import click
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from document_parser import ResumeLineConsumer, SECTION_PATTERNS, DEGREE_PATTERNS, JOB_PATTERNS  # noqa: E402
+
+def legacy_extract(lines):
+    """The original three passes: uncompiled (?i) patterns searched per line in nested loops"""
+    section_patterns = {name: f'(?i)({pattern})' for name, pattern in SECTION_PATTERNS.items()}
+    degree_patterns = [f'(?i)({pattern})' for pattern in DEGREE_PATTERNS]
+    job_patterns = [f'(?i)({pattern})' for pattern in JOB_PATTERNS]
+    
+    sections = {}
+    current_section = None
+    section_content = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        for section_name, pattern in section_patterns.items():
+            if re.search(pattern, line) and len(line) < 50:
+                if current_section and section_content:
+                    sections[current_section] = '\n'.join(section_content)
+                current_section = section_name
+                section_content = []
+                break
+        else:
+            if current_section:
+                section_content.append(line)
+    if current_section and section_content:
+        sections[current_section] = '\n'.join(section_content)
+    
+    education = []
+    for line in lines:
+        for pattern in degree_patterns:
+            if re.search(pattern, line):
+                education.append(line.strip())
+                break
+    
+    experience = []
+    for line in lines:
+        line = line.strip()
+        if len(line) > 10 and len(line) < 100:
+            for pattern in job_patterns:
+                if re.search(pattern, line):
+                    experience.append(line)
+                    break
+    
+    return sections, education, experience
+
+def engine_extract(lines):
+    consumer = ResumeLineConsumer()
+    for line in lines:
+        consumer.feed(line)
+    consumer.finish()
+    return consumer.sections, consumer.education, consumer.experience
+
+def best_of(func, lines, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(lines)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+@click.command()
+@click.option('--source', default=str(ROOT / 'resume_plaintext.txt'), help='Text file to scale up')
+@click.option('--scale', default=1000, help='How many times to repeat the source text')
+@click.option('--repeat', default=3, help='Runs per implementation; the best is reported')
+def main(source, scale, repeat):
+    with open(source, 'r', encoding='utf-8') as f:
+        lines = f.read().split('\n') * scale
+    
+    legacy_time, legacy_result = best_of(legacy_extract, lines, repeat)
+    engine_time, engine_result = best_of(engine_extract, lines, repeat)
+    
+    if legacy_result != engine_result:
+        raise SystemExit("Engine output differs from the legacy extraction")
+    
+    print(f"lines:   {len(lines):,}")
+    print(f"legacy:  {len(lines) / legacy_time:>12,.0f} lines/sec ({legacy_time:.2f}s)")
+    print(f"engine:  {len(lines) / engine_time:>12,.0f} lines/sec ({engine_time:.2f}s)")
+    print(f"speedup: {legacy_time / engine_time:.1f}x")
+
+if __name__ == '__main__':
+    main()
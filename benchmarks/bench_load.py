@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+End-to-end load benchmark on the offline local provider.
+
+Drives every CareerAgent task (and, with --cli, the matching CLI commands as
+subprocesses) at a fixed concurrency against the simulated provider and
+reports p50/p95/p99 latency, throughput and peak RSS per task. Nothing needs
+an API key, so runs are reproducible. Set --latency-ms 0 --tokens-per-second 0
+to measure the agent's own overhead alone.
+
+    python benchmarks/bench_load.py [--requests 20] [--concurrency 4] [--warmup 1] [--task optimize]
+        [--stream] [--cli] [--latency-ms 300] [--tokens-per-second 80] [--error-rate 0.05]
+        [--json results.json]
+"""
+
+import os
+import sys
+import json
+import time
+import resource
+import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Callable
+
+import click
+
+ROOT = Path(__file__).resolve().parent.parent
+CLI = str(ROOT / 'cli.py')
+sys.path.insert(0, str(ROOT))
+
+JOB_DESCRIPTION = """Senior Machine Learning Engineer
+Build data pipelines in Python and SQL and deploy models to production on AWS.
+Partner with product and analytics teams on experimentation and metrics.
+Mentor engineers and review designs for reliability and scale.
+"""
+
+# Agent calls per task; each takes the agent and whether to stream
+AGENT_TASKS: Dict[str, Callable[[Any, bool], Any]] = {
+    'analyze': lambda agent, stream: agent.analyze_resume(stream=stream),
+    'advice': lambda agent, stream: agent.get_career_advice("How do I move into ML platform work?", stream=stream),
+    'optimize': lambda agent, stream: agent.optimize_resume_for_job(JOB_DESCRIPTION, stream=stream),
+    'cover_letter': lambda agent, stream: agent.generate_cover_letter(JOB_DESCRIPTION, "Acme", stream=stream),
+    'interview': lambda agent, stream: agent.prepare_interview_questions(JOB_DESCRIPTION, "technical", stream=stream),
+    'skills': lambda agent, stream: agent.suggest_skill_improvements("ML engineer", stream=stream),
+    'apply_pack': lambda agent, stream: agent.generate_application_packet(JOB_DESCRIPTION, "Acme", "ML Engineer"),
+}
+
+# Matching CLI arguments; {job_file} is replaced with a file holding JOB_DESCRIPTION
+CLI_TASKS: Dict[str, List[str]] = {
+    'analyze': ['analyze'],
+    'advice': ['advice', 'How do I move into ML platform work?'],
+    'optimize': ['optimize', '--job-file', '{job_file}'],
+    'cover_letter': ['cover-letter', '--job-file', '{job_file}', '--company', 'Acme'],
+    'interview': ['interview', '--job-file', '{job_file}', '--type', 'technical'],
+    'skills': ['skills', '--target-role', 'ML engineer'],
+    'apply_pack': ['apply-pack', '--job-file', '{job_file}', '--company', 'Acme'],
+}
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of values (0-100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+def peak_rss_mb(who: int = resource.RUSAGE_SELF) -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(who).ru_maxrss / scale
+
+def run_load(call: Callable[[], Any], requests: int, concurrency: int, warmup: int = 0) -> Dict[str, Any]:
+    """Make requests calls with concurrency workers, timing each after warmup untimed calls"""
+    for _ in range(warmup):
+        call()
+    
+    latencies = []
+    errors = []
+    
+    def timed() -> None:
+        started = time.perf_counter()
+        try:
+            call()
+        except Exception as e:
+            errors.append(str(e))
+            return
+        latencies.append(time.perf_counter() - started)
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(timed) for _ in range(requests)]:
+            future.result()
+    elapsed = time.perf_counter() - started
+    
+    return {
+        "requests": requests,
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "throughput_rps": len(latencies) / elapsed if elapsed else 0.0
+    }
+
+def agent_call(agent, task: str, stream: bool) -> Callable[[], Any]:
+    def call() -> None:
+        result = AGENT_TASKS[task](agent, stream)
+        if not isinstance(result, str):
+            for _ in result:
+                pass
+    return call
+
+def cli_call(task: str, job_file: str, stream: bool, env: Dict[str, str]) -> Callable[[], Any]:
+    args = [arg.format(job_file=job_file) for arg in CLI_TASKS[task]]
+    command = [sys.executable, CLI, '--provider', 'local', '--no-cache', '--no-daemon',
+               '--stream' if stream else '--no-stream', *args]
+    
+    def call() -> None:
+        result = subprocess.run(command, capture_output=True, text=True, cwd=ROOT, env=env)
+        # The CLI reports errors on stdout and still exits 0
+        if result.returncode != 0 or 'Error:' in result.stdout:
+            raise RuntimeError((result.stdout + result.stderr).strip().splitlines()[-1])
+    return call
+
+def print_results(title: str, results: Dict[str, Dict[str, Any]]) -> None:
+    print(f"\n{title}")
+    print(f"  {'task':<14}{'ok':>6}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>9}")
+    for task, result in results.items():
+        print(
+            f"  {task:<14}{result['requests'] - result['errors']:>6}{result['errors']:>8}"
+            f"{result['p50_ms']:>10.1f}{result['p95_ms']:>10.1f}{result['p99_ms']:>10.1f}"
+            f"{result['throughput_rps']:>9.2f}"
+        )
+        if result['first_error']:
+            print(f"    first error: {result['first_error']}")
+
+@click.command()
+@click.option('--task', 'tasks', multiple=True, type=click.Choice(list(AGENT_TASKS)),
+              help='Task to benchmark (repeatable, default all)')
+@click.option('--requests', default=20, help='Requests per task')
+@click.option('--concurrency', default=4, help='Concurrent requests')
+@click.option('--warmup', default=1, help='Untimed calls per task first, so one-off loading is not measured')
+@click.option('--stream', is_flag=True, help='Stream responses instead of waiting for the full text')
+@click.option('--cli', 'include_cli', is_flag=True, help='Also run the CLI commands as subprocesses')
+@click.option('--resume-path', default=str(ROOT / 'Ian_Alloway_Resume_CV.pdf'), help='Resume to load')
+@click.option('--latency-ms', default=300.0, help='Simulated median time to first token')
+@click.option('--latency-sigma', default=0.5, help='Spread of the lognormal latency distribution')
+@click.option('--tokens-per-second', default=80.0, help='Simulated output rate (0 = instant)')
+@click.option('--output-tokens', default=400, help='Simulated response length in tokens')
+@click.option('--error-rate', default=0.0, help='Share of requests answered with a retryable 429')
+@click.option('--seed', default=0, help='Random seed for the simulated provider')
+@click.option('--json', 'json_path', type=click.Path(dir_okay=False), help='Write the results to this JSON file')
+def main(tasks, requests, concurrency, warmup, stream, include_cli, resume_path, latency_ms, latency_sigma,
+         tokens_per_second, output_tokens, error_rate, seed, json_path):
+    tasks = list(tasks) or list(AGENT_TASKS)
+    work_dir = tempfile.mkdtemp(prefix='bench_load_')
+    
+    # The local provider and agent read these through AgentConfig, here and in CLI subprocesses
+    settings = {
+        'DEFAULT_PROVIDER': 'local',
+        'LOCAL_LATENCY_MS': latency_ms,
+        'LOCAL_LATENCY_SIGMA': latency_sigma,
+        'LOCAL_TOKENS_PER_SECOND': tokens_per_second,
+        'LOCAL_OUTPUT_TOKENS': output_tokens,
+        'LOCAL_ERROR_RATE': error_rate,
+        'LOCAL_SEED': seed,
+        'LOCAL_RETRY_AFTER_MS': 50,
+        'MAX_CONCURRENCY': max(concurrency, 1) * 4,
+        'RESUME_PATH': resume_path,
+        'OUTPUT_DIR': os.path.join(work_dir, 'output'),
+    }
+    os.environ.update({name: str(value) for name, value in settings.items()})
+    
+    from career_agent import CareerAgent
+    
+    print(f"local provider: {latency_ms:g} ms median latency, {tokens_per_second:g} tokens/s, "
+          f"{output_tokens} tokens, {error_rate:.0%} 429s; {requests} requests per task at concurrency {concurrency}")
+    
+    agent = CareerAgent('local', use_cache=False)
+    agent.load_resume(resume_path)
+    
+    report: Dict[str, Any] = {"settings": settings, "stream": stream, "concurrency": concurrency}
+    report["agent"] = {
+        task: run_load(agent_call(agent, task, stream), requests, concurrency, warmup) for task in tasks
+    }
+    report["peak_rss_mb"] = peak_rss_mb()
+    print_results("CareerAgent tasks (in-process)", report["agent"])
+    print(f"  peak RSS: {report['peak_rss_mb']:.1f} MB")
+    
+    if include_cli:
+        job_file = os.path.join(work_dir, 'job.txt')
+        with open(job_file, 'w', encoding='utf-8') as f:
+            f.write(JOB_DESCRIPTION)
+        env = dict(os.environ)
+        
+        report["cli"] = {
+            task: run_load(cli_call(task, job_file, stream, env), requests, concurrency, warmup) for task in tasks
+        }
+        report["cli_peak_rss_mb"] = peak_rss_mb(resource.RUSAGE_CHILDREN)
+        print_results("CLI commands (subprocess per request)", report["cli"])
+        print(f"  peak RSS of a CLI process: {report['cli_peak_rss_mb']:.1f} MB")
+    
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nresults written to {json_path}")
+    
+    failed = [result for section in ("agent", "cli") for result in report.get(section, {}).values() if result["errors"]]
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
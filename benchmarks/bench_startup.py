@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+CLI startup benchmark.
+
+Runs cli.py under `python -X importtime` for --help and real non-LLM commands
+(tracker queries, job scoring, daemon status) and reports, per command, the module import time attributable to the CLI and
+the wall-clock time above a bare `python -c pass`. Exits non-zero when any
+command fails or exceeds the target (150 ms by default); commands in
+REPORT_ONLY_COMMANDS are timed but not held to the target.
+
+    python benchmarks/bench_startup.py [--runs 5] [--target-ms 150] [--top 10]
+"""
+
+import re
+import sys
+import subprocess
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+import click
+
+ROOT = Path(__file__).resolve().parent.parent
+CLI = str(ROOT / 'cli.py')
+
+# Real commands catch imports that --help never triggers, such as the config or provider stack
+DEFAULT_COMMANDS = [
+    '--help',
+    'analyze --help',
+    'optimize --help',
+    'batch --help',
+    'tracker due',
+    'tracker dedupe',
+    'tracker by-status',
+    'daemon status',
+    'score job-search/hn_candidate_queue.csv --top 5',
+]
+
+# score parses the resume (PyPDF2, AgentConfig for the parse cache) and scores with numpy, which alone
+# is past the startup budget; it is benchmarked to catch regressions, but not failed for the budget
+REPORT_ONLY_COMMANDS = {
+    'score job-search/hn_candidate_queue.csv --top 5',
+}
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int]]:
+    """Return (module, cumulative_us) for top-level imports made after interpreter startup"""
+    modules = []
+    after_site = False
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        
+        _, cumulative, indent, module = match.groups()
+        if indent:
+            continue
+        if module == 'site':
+            # Everything up to and including site is interpreter startup, not the CLI
+            after_site = True
+            continue
+        if after_site:
+            modules.append((module, int(cumulative)))
+    return modules
+
+def wall_time(args: List[str], runs: int) -> float:
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], capture_output=True, cwd=ROOT)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+@click.command()
+@click.option('--command', 'commands', multiple=True, help='CLI arguments to benchmark (repeatable)')
+@click.option('--runs', default=5, help='Runs per command; the fastest is reported')
+@click.option('--target-ms', default=150.0, help='Startup budget per command in milliseconds')
+@click.option('--top', default=10, help='Show the N slowest top-level imports for each command')
+def main(commands, runs, target_ms, top):
+    commands = list(commands) or DEFAULT_COMMANDS
+    baseline = wall_time(['-c', 'pass'], runs)
+    print(f"interpreter baseline: {baseline * 1000:.0f} ms")
+    
+    failures = 0
+    for command in commands:
+        args = command.split()
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', CLI, *args],
+            capture_output=True, text=True, cwd=ROOT
+        )
+        modules = parse_importtime(result.stderr)
+        import_ms = sum(cumulative for _, cumulative in modules) / 1000
+        startup_ms = (wall_time([CLI, *args], runs) - baseline) * 1000
+        
+        failed = result.returncode != 0
+        over_target = startup_ms > target_ms and command not in REPORT_ONLY_COMMANDS
+        if failed:
+            status = f"FAILED, exit {result.returncode}"
+        elif startup_ms <= target_ms:
+            status = "ok"
+        else:
+            status = "OVER TARGET" if over_target else "over target, not enforced"
+        if failed or over_target:
+            failures += 1
+        
+        print(f"\ncli.py {command}: {startup_ms:.0f} ms over baseline, {import_ms:.0f} ms in imports [{status}]")
+        if failed:
+            errors = [line for line in result.stderr.splitlines() if not line.startswith('import time:')]
+            print("\n".join(f"  {line}" for line in errors[-3:]))
+        for module, cumulative in sorted(modules, key=lambda m: m[1], reverse=True)[:top]:
+            print(f"  {cumulative / 1000:8.1f} ms  {module}")
+    
+    sys.exit(1 if failures else 0)
+
+if __name__ == '__main__':
+    main()
@@ -1,25 +1,101 @@
 import os
-import json
-from typing import Dict, List, Any, Optional
+import time
+import threading
 from datetime import datetime
-from pathlib import Path
+from typing import Dict, List, Any, Optional, Union, Iterable, Iterator, Callable
 
-from ai_providers import get_ai_provider
-from document_parser import ResumeParser
+from ai_providers import AIProvider, get_ai_provider
+from document_parser import create_resume_parser
+from response_cache import ResponseCache, CachedProvider
+from token_budget import TokenBudget, dedupe_items
+from output_writer import save_output_file, get_jsonl_log, inputs_hash, get_record_labels
+from token_usage import get_last_usage, reset_last_usage, report_savings
+from tracing import tracer, traced
 from config import get_config
 
+def _bullets(items: List[str]) -> str:
+    return "\n".join(f"- {item}" for item in items) or "- none found"
+
+# Sections of an application packet, in the order they are written
+PACKET_SECTIONS = [
+    ('analysis', 'Resume Analysis'),
+    ('optimization', 'Resume Optimization'),
+    ('cover_letter', 'Cover Letter'),
+    ('interview_prep', 'Interview Prep')
+]
+
+OUTPUT_FORMATS = ['markdown', 'jsonl']
+
 class CareerAgent:
     """AI-powered career assistance agent"""
     
-    def __init__(self, provider_name: Optional[str] = None):
-        self.ai_provider = get_ai_provider(provider_name)
-        self.resume_parser = ResumeParser()
+    @traced("agent.init")
+    def __init__(self, provider_name: Optional[str] = None, use_cache: bool = True,
+                 output_format: Optional[str] = None, cassette_path: Optional[str] = None,
+                 cassette_mode: Optional[str] = None):
         self.config = get_config()
+        self.ai_provider = self._create_provider(
+            provider_name,
+            use_cache,
+            cassette_path or self.config.cassette_path,
+            cassette_mode or self.config.cassette_mode
+        )
+        self.resume_parser = create_resume_parser()
+        self.token_budget = TokenBudget(
+            self.ai_provider.model,
+            self.config.max_tokens,
+            prompt_budget=self.config.prompt_token_budget,
+            job_description_max_tokens=self.config.job_description_max_tokens
+        )
         self.resume_data = None
+        self._embedder = None
+        self._bullet_index = None
+        self._bullet_index_text = None
+        self._bullet_index_lock = threading.Lock()
         
         # Ensure output directory exists
         os.makedirs(self.config.output_dir, exist_ok=True)
+        
+        # In jsonl mode every response is appended to one log instead of markdown files
+        self.output_format = output_format or self.config.output_format
+        if self.output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {self.output_format}")
+        self.output_log = None
+        if self.output_format == "jsonl":
+            self.output_log = get_jsonl_log(
+                os.path.join(self.config.output_dir, self.config.output_log_filename),
+                flush_interval=self.config.output_log_flush_interval,
+                max_buffered=self.config.output_log_max_buffered
+            )
     
+    def _create_provider(self, provider_name: Optional[str], use_cache: bool,
+                         cassette_path: Optional[str] = None, cassette_mode: str = "auto") -> AIProvider:
+        """Get the AI provider, fronted by the response cache if enabled and by a cassette if given.
+
+        Replaying a cassette needs no provider, so none is created (or API key
+        required) in replay mode.
+        """
+        if cassette_path and cassette_mode == "replay":
+            from cassette import CassetteProvider, get_cassette
+            
+            return CassetteProvider(get_cassette(cassette_path), mode=cassette_mode)
+        
+        provider = get_ai_provider(provider_name)
+        if use_cache and self.config.response_cache_enabled:
+            cache = ResponseCache(
+                os.path.join(self.config.cache_dir, "responses.sqlite3"),
+                ttl_seconds=self.config.response_cache_ttl_seconds,
+                max_entries=self.config.response_cache_max_entries
+            )
+            provider = CachedProvider(provider, cache)
+        
+        if cassette_path:
+            from cassette import CassetteProvider, get_cassette
+            
+            provider = CassetteProvider(get_cassette(cassette_path), provider, mode=cassette_mode)
+        return provider
+    
+    @traced("agent.load_resume")
     def load_resume(self, file_path: Optional[str] = None) -> Dict[str, Any]:
         """Load and parse resume"""
         resume_path = file_path or self.config.resume_path
@@ -32,115 +108,366 @@ class CareerAgent:
         
         return self.resume_data
     
-    def analyze_resume(self, detailed: bool = True) -> str:
+    def analyze_resume(self, detailed: bool = True, stream: bool = False) -> Union[str, Iterator[str]]:
         """Analyze resume and provide feedback"""
-        if not self.resume_data:
-            self.load_resume()
+        return self._respond('analyze_resume', self._analysis_messages(detailed), stream)
+    
+    def get_career_advice(self, query: str, context: Optional[str] = None, stream: bool = False) -> Union[str, Iterator[str]]:
+        """Get personalized career advice"""
+        return self._respond('get_career_advice', self._career_advice_messages(query, context), stream)
+    
+    def optimize_resume_for_job(self, job_description: str, stream: bool = False) -> Union[str, Iterator[str]]:
+        """Optimize resume for a specific job"""
+        return self._respond('optimize_resume_for_job', self._optimization_messages(job_description), stream)
+    
+    async def aoptimize_resume_for_job(self, job_description: str) -> str:
+        """Optimize resume for a specific job without blocking the event loop"""
+        return await self._arespond('optimize_resume_for_job', self._optimization_messages(job_description))
+    
+    def generate_cover_letter(self, job_description: str, company_name: str, additional_info: Optional[str] = None, stream: bool = False) -> Union[str, Iterator[str]]:
+        """Generate a tailored cover letter"""
+        return self._respond('generate_cover_letter', self._cover_letter_messages(job_description, company_name, additional_info), stream)
+    
+    async def agenerate_cover_letter(self, job_description: str, company_name: str, additional_info: Optional[str] = None) -> str:
+        """Generate a tailored cover letter without blocking the event loop"""
+        return await self._arespond('generate_cover_letter', self._cover_letter_messages(job_description, company_name, additional_info))
+    
+    def prepare_interview_questions(self, job_description: str, interview_type: str = "general", stream: bool = False) -> Union[str, Iterator[str]]:
+        """Generate likely interview questions and answers"""
+        return self._respond('prepare_interview_questions', self._interview_prep_messages(job_description, interview_type), stream)
+    
+    def suggest_skill_improvements(self, target_role: Optional[str] = None, stream: bool = False) -> Union[str, Iterator[str]]:
+        """Suggest skills to develop"""
+        return self._respond('suggest_skill_improvements', self._skills_improvement_messages(target_role), stream)
+    
+    def generate_application_packet(self, job_description: str, company_name: str, role: Optional[str] = None,
+                                    interview_type: str = "general") -> str:
+        """Generate a complete application packet for one job as markdown"""
+        import asyncio
         
-        analysis_prompt = self._create_resume_analysis_prompt(detailed)
+        async def run() -> Dict[str, str]:
+            try:
+                return await self.agenerate_application_packet(job_description, company_name, interview_type)
+            finally:
+                # The pooled async client belongs to this loop, which asyncio.run() is about to close
+                await self.ai_provider.aclose()
         
-        messages = [
-            {"role": "system", "content": "You are an expert career consultant and resume reviewer with deep knowledge of hiring practices across industries."},
-            {"role": "user", "content": analysis_prompt}
-        ]
+        sections = asyncio.run(run())
+        return self._format_application_packet(company_name, role, sections)
+    
+    async def agenerate_application_packet(self, job_description: str, company_name: str,
+                                           interview_type: str = "general") -> Dict[str, str]:
+        """Run the analysis, optimization, cover letter and interview prep prompts concurrently.
+
+        All four share the parsed resume, so the total time is that of the
+        slowest call rather than the sum.
+        """
+        import asyncio
         
-        return self.ai_provider.generate_response(messages)
+        messages = {
+            'analysis': self._analysis_messages(),
+            'optimization': self._optimization_messages(job_description),
+            'cover_letter': self._cover_letter_messages(job_description, company_name),
+            'interview_prep': self._interview_prep_messages(job_description, interview_type)
+        }
+        responses = await asyncio.gather(*(
+            self._arespond(f"application_packet.{key}", messages[key]) for key, _ in PACKET_SECTIONS
+        ))
+        return {key: response for (key, _), response in zip(PACKET_SECTIONS, responses)}
     
-    def get_career_advice(self, query: str, context: Optional[str] = None) -> str:
-        """Get personalized career advice"""
+    def _format_application_packet(self, company_name: str, role: Optional[str], sections: Dict[str, str]) -> str:
+        """Lay out packet sections in the style of APPLICATION_PACKETS.md"""
+        heading = f"{company_name} - {role}" if role else company_name
+        parts = [f"# Application Packet\n\n## {heading}"]
+        for key, title in PACKET_SECTIONS:
+            parts.append(f"### {title}\n\n{sections[key].strip()}")
+        return "\n\n".join(parts) + "\n"
+    
+    @traced("prompt.analysis")
+    def _analysis_messages(self, detailed: bool = True) -> List[Dict[str, Any]]:
+        """Build the messages for analyze_resume"""
         if not self.resume_data:
             self.load_resume()
         
-        advice_prompt = self._create_career_advice_prompt(query, context)
-        
-        messages = [
-            {"role": "system", "content": "You are a senior career counselor with expertise in various industries. Provide practical, actionable advice tailored to the individual's background."},
-            {"role": "user", "content": advice_prompt}
-        ]
-        
-        return self.ai_provider.generate_response(messages)
+        return self._messages(
+            "You are an expert career consultant and resume reviewer with deep knowledge of hiring practices across industries.",
+            self._create_resume_analysis_prompt(detailed)
+        )
     
-    def optimize_resume_for_job(self, job_description: str) -> str:
-        """Optimize resume for a specific job"""
+    @traced("prompt.career_advice")
+    def _career_advice_messages(self, query: str, context: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Build the messages for get_career_advice"""
         if not self.resume_data:
             self.load_resume()
         
-        optimization_prompt = self._create_optimization_prompt(job_description)
+        return self._messages(
+            "You are a senior career counselor with expertise in various industries. Provide practical, actionable advice tailored to the individual's background.",
+            self._create_career_advice_prompt(query, context)
+        )
+    
+    @traced("prompt.optimization")
+    def _optimization_messages(self, job_description: str) -> List[Dict[str, Any]]:
+        """Build the messages for optimize_resume_for_job"""
+        if not self.resume_data:
+            self.load_resume()
         
-        messages = [
-            {"role": "system", "content": "You are an expert resume writer who specializes in tailoring resumes for specific job opportunities. Focus on highlighting relevant skills and experiences."},
-            {"role": "user", "content": optimization_prompt}
-        ]
+        job_description = self._trim_job_description(job_description)
         
-        return self.ai_provider.generate_response(messages)
+        return self._messages(
+            "You are an expert resume writer who specializes in tailoring resumes for specific job opportunities. Focus on highlighting relevant skills and experiences.",
+            self._create_optimization_prompt(job_description),
+            relevant_bullets=lambda: [match["text"] for match in self.match_bullets(job_description)]
+        )
     
-    def generate_cover_letter(self, job_description: str, company_name: str, additional_info: Optional[str] = None) -> str:
-        """Generate a tailored cover letter"""
+    @traced("prompt.cover_letter")
+    def _cover_letter_messages(self, job_description: str, company_name: str, additional_info: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Build the messages for generate_cover_letter"""
         if not self.resume_data:
             self.load_resume()
         
-        cover_letter_prompt = self._create_cover_letter_prompt(job_description, company_name, additional_info)
-        
-        messages = [
-            {"role": "system", "content": "You are an expert at writing compelling cover letters that showcase candidates' qualifications and enthusiasm for specific roles."},
-            {"role": "user", "content": cover_letter_prompt}
-        ]
+        job_description = self._trim_job_description(job_description)
         
-        return self.ai_provider.generate_response(messages)
+        return self._messages(
+            "You are an expert at writing compelling cover letters that showcase candidates' qualifications and enthusiasm for specific roles.",
+            self._create_cover_letter_prompt(job_description, company_name, additional_info)
+        )
     
-    def prepare_interview_questions(self, job_description: str, interview_type: str = "general") -> str:
-        """Generate likely interview questions and answers"""
+    @traced("prompt.interview_prep")
+    def _interview_prep_messages(self, job_description: str, interview_type: str = "general") -> List[Dict[str, Any]]:
+        """Build the messages for prepare_interview_questions"""
         if not self.resume_data:
             self.load_resume()
         
-        interview_prompt = self._create_interview_prep_prompt(job_description, interview_type)
+        job_description = self._trim_job_description(job_description)
         
-        messages = [
-            {"role": "system", "content": "You are an experienced hiring manager and interview coach. Provide realistic interview questions and strategic answer guidance."},
-            {"role": "user", "content": interview_prompt}
-        ]
+        return self._messages(
+            "You are an experienced hiring manager and interview coach. Provide realistic interview questions and strategic answer guidance.",
+            self._create_interview_prep_prompt(job_description, interview_type)
+        )
+    
+    @traced("prompt.skills_improvement")
+    def _skills_improvement_messages(self, target_role: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Build the messages for suggest_skill_improvements"""
+        if not self.resume_data:
+            self.load_resume()
         
-        return self.ai_provider.generate_response(messages)
+        return self._messages(
+            "You are a career development expert who understands current market trends and skill demands across industries.",
+            self._create_skills_improvement_prompt(target_role)
+        )
     
-    def suggest_skill_improvements(self, target_role: Optional[str] = None) -> str:
-        """Suggest skills to develop"""
+    @traced("embedding.match_bullets")
+    def match_bullets(self, job_description: str, top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Resume lines most similar to any chunk of the job description, best first, with their scores.
+
+        Resume lines are embedded once into an on-disk index under the cache
+        directory and reused until the resume or embedding model changes.
+        """
+        top_k = self.config.embedding_top_k if top_k is None else top_k
+        if top_k <= 0:
+            return []
         if not self.resume_data:
             self.load_resume()
         
-        skills_prompt = self._create_skills_improvement_prompt(target_role)
+        # Imported here so commands that never match bullets skip loading NumPy
+        from embedding_index import get_embedder, load_resume_index, chunk_text, top_relevant
+        
+        # Concurrent requests (batch, daemon) must not build the same index at once
+        with self._bullet_index_lock:
+            if self._embedder is None:
+                self._embedder = get_embedder(self.config.embedding_model)
+            if self._bullet_index is None or self._bullet_index_text != self.resume_data['raw_text']:
+                self._bullet_index = load_resume_index(
+                    os.path.join(self.config.cache_dir, "embeddings"),
+                    self.resume_data['raw_text'],
+                    self._embedder
+                )
+                self._bullet_index_text = self.resume_data['raw_text']
         
+        return top_relevant(self._bullet_index, self._embedder, chunk_text(job_description), k=top_k)
+    
+    def _resume_context(self, compact: bool = False, bullets: Optional[List[str]] = None) -> str:
+        """Resume context shared by every task.
+
+        Built only from the parsed resume so it is byte-identical across calls
+        and can be served from the provider's prompt cache. The compact form
+        leaves out the extracted education and experience, which repeat lines
+        of the raw text; given bullets, the raw text is replaced by them too.
+        """
+        contact = "\n".join(
+            f"- {field}: {' '.join(str(value).split())}"
+            for field, value in self.resume_data['contact_info'].items()
+        )
+        sections = f"""Education:
+{_bullets(dedupe_items(self.resume_data['education']))}
+Experience:
+{_bullets(dedupe_items(self.resume_data['experience']))}
+"""
+        
+        return f"""
+You are assisting the candidate whose resume follows. Use it as the source of truth about their background.
+
+{"RESUME CONTENT:" if bullets is None else "MOST RELEVANT RESUME LINES:"}
+{self.resume_data['raw_text'] if bullets is None else _bullets(bullets)}
+
+EXTRACTED INFORMATION:
+Contact Info:
+{contact or "- none found"}
+Skills: {', '.join(self.resume_data['skills'])}
+{"" if compact else sections}"""
+    
+    def _messages(self, persona: str, prompt: str,
+                  relevant_bullets: Optional[Callable[[], List[str]]] = None) -> List[Dict[str, Any]]:
+        """Lay out a task's messages with the shared resume context as a cacheable prefix.
+
+        Prompts over the token budget drop the extracted resume sections first,
+        then swap the resume text for the relevant bullets when the task has
+        them, then truncate the task prompt and finally the resume text.
+        Bullets are only matched once a prompt is over budget, so prompts that
+        fit keep the full, cacheable resume context, unless
+        EMBEDDING_BULLETS_ONLY opts into sending the bullets alone every time.
+        """
+        bullets = None
+        if relevant_bullets and self.config.embedding_bullets_only:
+            bullets = relevant_bullets() or None
+        if bullets is None:
+            resume = {"role": "system", "content": self._resume_context(), "cache": True}
+        else:
+            # Matched per job, so not worth a prompt cache write
+            resume = {"role": "system", "content": self._resume_context(compact=True, bullets=bullets)}
         messages = [
-            {"role": "system", "content": "You are a career development expert who understands current market trends and skill demands across industries."},
-            {"role": "user", "content": skills_prompt}
+            resume,
+            {"role": "system", "content": persona},
+            {"role": "user", "content": prompt}
         ]
         
-        return self.ai_provider.generate_response(messages)
+        before = self.token_budget.count_messages(messages)
+        if before <= self.token_budget.prompt_budget:
+            return messages
+        
+        if bullets is None:
+            messages[0] = dict(messages[0], content=self._resume_context(compact=True))
+            if relevant_bullets and self.token_budget.count_messages(messages) > self.token_budget.prompt_budget:
+                bullets = relevant_bullets()
+                if bullets:
+                    messages[0] = dict(messages[0], content=self._resume_context(compact=True, bullets=bullets))
+        messages = self.token_budget.fit_messages(messages, trim_order=[2, 0])
+        report_savings("prompt", before, self.token_budget.count_messages(messages))
+        return messages
     
-    def save_output(self, content: str, filename: str) -> str:
-        """Save output to file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = os.path.join(self.config.output_dir, f"{timestamp}_{filename}")
+    def _trim_job_description(self, job_description: str) -> str:
+        """Strip boilerplate and repeated lines from a job description and cap its length"""
+        trimmed = self.token_budget.trim_job_description(job_description)
+        if trimmed != job_description:
+            report_savings(
+                "job description",
+                self.token_budget.count(job_description),
+                self.token_budget.count(trimmed)
+            )
+        return trimmed
+    
+    def _respond(self, task: str, messages: List[Dict[str, str]], stream: bool) -> Union[str, Iterator[str]]:
+        """Send messages to the provider, returning the full text or an iterator of text chunks"""
+        started = time.monotonic()
+        if stream:
+            # The span is opened now so it belongs to the caller's span, not to whoever drains the stream
+            provider_span = tracer.start_span("provider.stream", task=task, provider=self.ai_provider.name,
+                                              model=self.ai_provider.model)
+            return self._record_stream(task, messages, started, self.ai_provider.stream_response(messages), provider_span)
+        
+        with tracer.span("provider.request", task=task, provider=self.ai_provider.name,
+                         model=self.ai_provider.model) as provider_span:
+            reset_last_usage()
+            response = self.ai_provider.generate_response(messages)
+            self._trace_usage(provider_span)
+        self._record(task, messages, started, response)
+        return response
+    
+    async def _arespond(self, task: str, messages: List[Dict[str, str]]) -> str:
+        started = time.monotonic()
+        with tracer.span("provider.request", task=task, provider=self.ai_provider.name,
+                         model=self.ai_provider.model) as provider_span:
+            reset_last_usage()
+            response = await self.ai_provider.agenerate_response(messages)
+            self._trace_usage(provider_span)
+        self._record(task, messages, started, response)
+        return response
+    
+    def _record_stream(self, task: str, messages: List[Dict[str, str]], started: float,
+                       chunks: Iterator[str], provider_span) -> Iterator[str]:
+        """Pass chunks through, recording the whole response and its span once the stream ends"""
+        if self.output_log is None and not tracer.enabled:
+            yield from chunks
+            return
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        reset_last_usage()
+        parts = []
+        first_chunk_ms = None
+        try:
+            for chunk in chunks:
+                if first_chunk_ms is None:
+                    first_chunk_ms = round((time.monotonic() - started) * 1000, 1)
+                    provider_span.set_attribute("ttft_ms", first_chunk_ms)
+                parts.append(chunk)
+                yield chunk
+        except Exception as e:
+            provider_span.record_error(e)
+            raise
+        finally:
+            self._trace_usage(provider_span)
+            tracer.end_span(provider_span)
+        self._record(task, messages, started, "".join(parts), first_chunk_ms=first_chunk_ms)
+    
+    @staticmethod
+    def _trace_usage(provider_span) -> None:
+        usage = get_last_usage()
+        if usage is None:
+            provider_span.set_attribute("response_cached", True)
+            return
+        for key, value in usage.to_dict().items():
+            provider_span.set_attribute(key, value)
+    
+    def _record(self, task: str, messages: List[Dict[str, str]], started: float, content: str, **extra: Any) -> None:
+        """Append a response record to the JSONL log in jsonl mode"""
+        if self.output_log is None:
+            return
         
-        return output_path
+        # No usage means the response came from the local response cache
+        usage = get_last_usage()
+        self.output_log.append({
+            "timestamp": datetime.now().isoformat(timespec='seconds'),
+            "task": task,
+            **get_record_labels(),
+            "inputs_hash": inputs_hash(messages),
+            "provider": self.ai_provider.name,
+            "model": self.ai_provider.model,
+            "latency_ms": round((time.monotonic() - started) * 1000, 1),
+            **extra,
+            "usage": usage.to_dict() if usage else None,
+            "content": content
+        })
+    
+    @traced("output.save")
+    def save_output(self, content: Union[str, Iterable[str]], filename: str) -> str:
+        """Save output to file; an iterable of chunks is written to disk as each chunk arrives.
+
+        In jsonl mode responses are already in the output log, so content is
+        only drained and the log path returned.
+        """
+        if self.output_log is not None:
+            if not isinstance(content, str):
+                for _ in content:
+                    pass
+            return self.output_log.path
+        
+        return save_output_file(self.config.output_dir, content, filename)
     
     def _create_resume_analysis_prompt(self, detailed: bool) -> str:
         """Create prompt for resume analysis"""
         analysis_level = "detailed" if detailed else "summary"
         
         return f"""
-Please provide a {analysis_level} analysis of this resume:
-
-RESUME CONTENT:
-{self.resume_data['raw_text']}
-
-EXTRACTED INFORMATION:
-Contact Info: {json.dumps(self.resume_data['contact_info'], indent=2)}
-Skills: {', '.join(self.resume_data['skills'])}
-Education: {self.resume_data['education']}
-Experience: {self.resume_data['experience']}
+Please provide a {analysis_level} analysis of the resume above.
 
 Please analyze:
 1. Overall structure and formatting
@@ -160,14 +487,9 @@ Provide actionable feedback and specific suggestions for improvement.
         context_section = f"\nADDITIONAL CONTEXT: {context}" if context else ""
         
         return f"""
-Based on this resume and career background, please provide advice for the following query:
+Based on the resume and career background above, please provide advice for the following query:
 
 QUERY: {query}
-
-RESUME SUMMARY:
-Skills: {', '.join(self.resume_data['skills'])}
-Education: {self.resume_data['education']}
-Experience: {self.resume_data['experience']}
 {context_section}
 
 Please provide:
@@ -183,16 +505,11 @@ Make the advice practical and tailored to their background.
     def _create_optimization_prompt(self, job_description: str) -> str:
         """Create prompt for resume optimization"""
         return f"""
-Please help optimize this resume for the following job opportunity:
+Please help optimize the resume above for the following job opportunity:
 
 JOB DESCRIPTION:
 {job_description}
 
-CURRENT RESUME:
-{self.resume_data['raw_text']}
-
-EXTRACTED SKILLS: {', '.join(self.resume_data['skills'])}
-
 Please provide:
 1. Key skills/keywords to emphasize from the job description
 2. Specific resume sections to modify
@@ -215,12 +532,6 @@ COMPANY: {company_name}
 
 JOB DESCRIPTION:
 {job_description}
-
-CANDIDATE BACKGROUND:
-Skills: {', '.join(self.resume_data['skills'])}
-Education: {self.resume_data['education']}
-Experience: {self.resume_data['experience']}
-Contact: {self.resume_data['contact_info']}
 {additional_section}
 
 Please create a cover letter that:
@@ -242,11 +553,6 @@ Help prepare for a {interview_type} interview for this position:
 JOB DESCRIPTION:
 {job_description}
 
-CANDIDATE BACKGROUND:
-Skills: {', '.join(self.resume_data['skills'])}
-Education: {self.resume_data['education']}
-Experience: {self.resume_data['experience']}
-
 Please provide:
 1. 10-15 likely interview questions specific to this role
 2. Strategic answer frameworks for each question
@@ -268,10 +574,7 @@ Suggest skill development priorities for career advancement:
 
 {target_section}
 
-CURRENT SKILLS: {', '.join(self.resume_data['skills'])}
-CURRENT BACKGROUND:
-Education: {self.resume_data['education']}
-Experience: {self.resume_data['experience']}
+Base the suggestions on the current skills and background in the resume above.
 
 Please provide:
 1. Top 5 skills to develop or strengthen
@@ -0,0 +1,250 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator
+
+from ai_providers import AIProvider
+from response_cache import normalize_messages
+from token_usage import get_last_usage, reset_last_usage
+from config import get_config
+
+# record: always call the provider and append; replay: never call it; auto: replay, recording misses
+CASSETTE_MODES = ['auto', 'record', 'replay']
+
+class CassetteMissError(Exception):
+    """Raised in replay mode for a request the cassette has no response for"""
+
+class Cassette:
+    """Append-only JSONL file of request/response pairs with an in-memory key index.
+
+    Opening the cassette reads each line's key and byte offset once; after
+    that a lookup is a dict access plus one seek and line read, so responses
+    stay on disk. When a key was recorded more than once, the latest entry wins.
+    Message contents are stored once as content-addressed blob lines that
+    entries refer to, so the resume context shared by every prompt is not
+    repeated per entry.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._offsets: Dict[str, int] = {}
+        self._blob_offsets: Dict[str, int] = {}
+        # Provider and model of the latest entry, which replay reports so prompts are built for the recording model
+        self.provider: Optional[str] = None
+        self.model: Optional[str] = None
+        
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).touch(exist_ok=True)
+        self._reader = open(path, 'rb')
+        self._writer = open(path, 'ab')
+        self._index()
+    
+    def _index(self) -> None:
+        offset = 0
+        for line in self._reader:
+            try:
+                record = json.loads(line)
+                if "blob" in record:
+                    self._blob_offsets[record["blob"]] = offset
+                else:
+                    self._offsets[record["key"]] = offset
+                    self.provider = record.get("provider", self.provider)
+                    self.model = record.get("model", self.model)
+            except (ValueError, KeyError):
+                # A crash mid-write can leave a truncated last line
+                pass
+            offset += len(line)
+    
+    @staticmethod
+    def make_key(messages: List[Dict[str, str]], temperature: float, max_tokens: int) -> str:
+        """Hash of the normalized request.
+
+        Provider and model are left out so a cassette replays without any API
+        key; they are stored with each entry instead.
+        """
+        payload = json.dumps({
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "messages": normalize_messages(messages)
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def __len__(self) -> int:
+        return len(self._offsets)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._offsets
+    
+    def _read_line(self, offset: int) -> Dict[str, Any]:
+        self._reader.seek(offset)
+        return json.loads(self._reader.readline())
+    
+    def _append_line(self, record: Dict[str, Any]) -> int:
+        self._writer.seek(0, os.SEEK_END)
+        offset = self._writer.tell()
+        self._writer.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b"\n")
+        return offset
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The recorded entry for a key, or None; message contents are left as blob hashes"""
+        with self._lock:
+            offset = self._offsets.get(key)
+            return self._read_line(offset) if offset is not None else None
+    
+    def messages(self, entry: Dict[str, Any]) -> List[Dict[str, str]]:
+        """An entry's request messages with their contents restored, e.g. to diff prompts"""
+        with self._lock:
+            return [
+                {"role": msg["role"], "content": self._read_line(self._blob_offsets[msg["content"]])["content"]}
+                for msg in entry["messages"]
+            ]
+    
+    def put(self, key: str, messages: List[Dict[str, str]], entry: Dict[str, Any]) -> None:
+        """Append an entry; it is flushed right away so an interrupted run keeps what it recorded"""
+        with self._lock:
+            refs = []
+            for msg in messages:
+                blob = hashlib.sha256(msg["content"].encode('utf-8')).hexdigest()
+                if blob not in self._blob_offsets:
+                    self._blob_offsets[blob] = self._append_line({"blob": blob, "content": msg["content"]})
+                refs.append({"role": msg["role"], "content": blob})
+            
+            offset = self._append_line({"key": key, **entry, "messages": refs})
+            self._writer.flush()
+            self._offsets[key] = offset
+            self.provider = entry.get("provider", self.provider)
+            self.model = entry.get("model", self.model)
+    
+    def close(self) -> None:
+        with self._lock:
+            self._reader.close()
+            self._writer.close()
+
+_cassettes: Dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+def get_cassette(path: str) -> Cassette:
+    """Shared Cassette for a path, so agents in one process keep a single index and writer"""
+    path = os.path.abspath(path)
+    with _cassettes_lock:
+        cassette = _cassettes.get(path)
+        if cassette is None:
+            cassette = _cassettes[path] = Cassette(path)
+        return cassette
+
+class CassetteProvider(AIProvider):
+    """Records provider responses to a Cassette and replays them by request hash.
+
+    In replay mode no provider is needed, so regression runs over every prompt
+    builder finish in seconds without API keys or tokens; a request missing
+    from the cassette means its prompt changed since recording.
+    """
+    
+    def __init__(self, cassette: Cassette, provider: Optional[AIProvider] = None, mode: str = "auto"):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        if provider is None and mode != "replay":
+            raise ValueError(f"Cassette mode {mode} needs a provider to record from")
+        self.cassette = cassette
+        self.provider = provider
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+    
+    @property
+    def name(self) -> str:
+        return self.provider.name if self.provider else self.cassette.provider or "cassette"
+    
+    @property
+    def model(self) -> str:
+        # Replay reports the recording model, so the token budget (and so the prompts) match the recording
+        return self.provider.model if self.provider else self.cassette.model or "replay"
+    
+    def __getattr__(self, name: str) -> Any:
+        # Expose the wrapped provider's attributes (client, rate_limiter, ...)
+        provider = self.__dict__.get("provider")
+        if provider is None:
+            raise AttributeError(name)
+        return getattr(provider, name)
+    
+    def _key(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        config = get_config()
+        return self.cassette.make_key(
+            messages,
+            kwargs.get('temperature', config.temperature),
+            kwargs.get('max_tokens', config.max_tokens)
+        )
+    
+    def _replay(self, key: str) -> Optional[str]:
+        if self.mode != "record":
+            entry = self.cassette.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry["response"]
+        self.misses += 1
+        if self.mode == "replay":
+            raise CassetteMissError(
+                f"No recorded response for request {key[:12]} in {self.cassette.path}; "
+                "the prompt is new or changed since recording (re-record with --cassette-mode auto or record)"
+            )
+        return None
+    
+    def _record(self, key: str, messages: List[Dict[str, str]], response: str, started: float) -> None:
+        usage = get_last_usage()
+        self.cassette.put(key, normalize_messages(messages), {
+            "provider": self.provider.name,
+            "model": self.provider.model,
+            "recorded_at": time.time(),
+            "latency_ms": round((time.monotonic() - started) * 1000, 1),
+            "usage": usage.to_dict() if usage else None,
+            "response": response
+        })
+    
+    def generate_response(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        key = self._key(messages, **kwargs)
+        replayed = self._replay(key)
+        if replayed is not None:
+            return replayed
+        
+        started = time.monotonic()
+        reset_last_usage()
+        response = self.provider.generate_response(messages, **kwargs)
+        self._record(key, messages, response, started)
+        return response
+    
+    async def agenerate_response(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        key = self._key(messages, **kwargs)
+        replayed = self._replay(key)
+        if replayed is not None:
+            return replayed
+        
+        started = time.monotonic()
+        reset_last_usage()
+        response = await self.provider.agenerate_response(messages, **kwargs)
+        self._record(key, messages, response, started)
+        return response
+    
+    async def aclose(self) -> None:
+        if self.provider is not None:
+            await self.provider.aclose()
+    
+    def stream_response(self, messages: List[Dict[str, str]], **kwargs) -> Iterator[str]:
+        key = self._key(messages, **kwargs)
+        replayed = self._replay(key)
+        if replayed is not None:
+            yield replayed
+            return
+        
+        started = time.monotonic()
+        reset_last_usage()
+        chunks = []
+        for chunk in self.provider.stream_response(messages, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        
+        # Only complete streams are recorded
+        self._record(key, messages, "".join(chunks), started)
@@ -2,27 +2,203 @@
 import click
 import os
 import sys
-from typing import Optional
+import time
+from pathlib import Path
+from typing import Optional, Callable, Iterable, Iterator, Union, TYPE_CHECKING
 from rich.console import Console
 from rich.panel import Panel
-from rich.markdown import Markdown
 from rich.table import Table
 from rich.prompt import Prompt
 
-from career_agent import CareerAgent
-from config import get_config
+# Heavy modules (AI SDKs, document parsers, pydantic settings, rich.markdown) are
+# imported inside the commands that need them so --help and startup stay fast
+if TYPE_CHECKING:
+    from career_agent import CareerAgent
 
 console = Console()
 
+# Minimum seconds between re-rendering the streamed markdown panel
+LIVE_REFRESH_INTERVAL = 0.1
+
 @click.group()
-@click.option('--provider', type=click.Choice(['openai', 'anthropic']), help='AI provider to use')
+@click.option('--provider', type=click.Choice(['openai', 'anthropic', 'local']), help='AI provider to use (local simulates one offline)')
 @click.option('--config-file', help='Path to configuration file')
+@click.option('--stream/--no-stream', default=True, help='Render responses token by token as they arrive')
+@click.option('--no-cache', is_flag=True, help='Bypass the LLM response cache')
+@click.option('--no-daemon', is_flag=True, help='Run in-process even if the career agent daemon is running')
+@click.option('--format', 'output_format', type=click.Choice(['markdown', 'jsonl']),
+              help='Save responses as markdown files, or append them with their metadata to one JSONL log')
+@click.option('--cassette', 'cassette_path', type=click.Path(dir_okay=False),
+              help='Record responses to this cassette file and replay them for identical requests')
+@click.option('--cassette-mode', type=click.Choice(['auto', 'record', 'replay']),
+              help='auto replays and records misses (default); replay never calls the provider')
+@click.option('--trace', is_flag=True, help='Print a timing breakdown of the command and save its spans to the output directory')
+@click.option('--trace-file', type=click.Path(dir_okay=False),
+              help='Write spans to this file: *.jsonl as span lines, otherwise OTLP/JSON')
+@click.option('--profile', 'profile_mode', type=click.Choice(['cpu', 'sample', 'memory']),
+              help='Profile the command (cProfile, stack sampling or tracemalloc) and save the profile to the output directory')
 @click.pass_context
-def cli(ctx, provider, config_file):
+def cli(ctx, provider, config_file, stream, no_cache, no_daemon, output_format, cassette_path, cassette_mode,
+        trace, trace_file, profile_mode):
     """🚀 Career Agent - Your AI-powered career assistant"""
     ctx.ensure_object(dict)
     ctx.obj['provider'] = provider
     ctx.obj['config_file'] = config_file
+    ctx.obj['stream'] = stream
+    ctx.obj['no_cache'] = no_cache
+    ctx.obj['no_daemon'] = no_daemon
+    ctx.obj['output_format'] = output_format
+    ctx.obj['cassette_path'] = cassette_path
+    ctx.obj['cassette_mode'] = cassette_mode
+    ctx.obj['trace'] = trace or bool(trace_file)
+    ctx.obj['profile'] = profile_mode
+    
+    if ctx.obj['trace']:
+        from tracing import tracer
+        
+        tracer.enable()
+        # Close callbacks run last-registered first, so the root span ends before the report
+        ctx.call_on_close(lambda: _report_trace(trace, trace_file))
+        ctx.with_resource(tracer.span(f"cli.{ctx.invoked_subcommand}"))
+    
+    if profile_mode:
+        from profiling import CommandProfiler
+        
+        profiler = CommandProfiler(profile_mode)
+        # Registered after tracing, so the profiler stops before the trace report runs
+        ctx.call_on_close(lambda: _report_profile(profiler, ctx.invoked_subcommand))
+        profiler.start()
+
+def _report_profile(profiler, command: str) -> None:
+    """Stop the --profile profiler, print its summary and save the profile"""
+    from config import get_config
+    
+    profiler.stop()
+    console.print(f"\n[bold]🔬 Profile ({profiler.mode}, {profiler.elapsed:.2f}s)[/bold]")
+    for line in profiler.summary_lines():
+        console.print(line, markup=False, highlight=False, soft_wrap=True)
+    path = profiler.save(get_config().output_dir, command)
+    console.print(f"[dim]Profile saved to: {path}[/dim]")
+
+def _report_trace(show: bool, trace_file: Optional[str]) -> None:
+    """Print the span breakdown and export the spans collected by --trace/--trace-file"""
+    from tracing import tracer
+    
+    if show:
+        console.print("\n[bold]⏱️  Trace[/bold]")
+        for line in tracer.flame_lines(width=20):
+            console.print(line, markup=False, highlight=False, soft_wrap=True)
+    
+    if not trace_file:
+        from config import get_config
+        from datetime import datetime
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        trace_file = os.path.join(get_config().output_dir, f"trace_{timestamp}.jsonl")
+    tracer.export(trace_file)
+    console.print(f"[dim]Trace saved to: {trace_file}[/dim]")
+
+def _create_agent(ctx) -> "CareerAgent":
+    """Create a CareerAgent from the global CLI options"""
+    from career_agent import CareerAgent
+    
+    return CareerAgent(
+        ctx.obj['provider'],
+        use_cache=not ctx.obj['no_cache'],
+        output_format=ctx.obj['output_format'],
+        cassette_path=ctx.obj['cassette_path'],
+        cassette_mode=ctx.obj['cassette_mode']
+    )
+
+def _get_agent(ctx):
+    """Forward to the daemon's warm agent when it is running, otherwise create one in-process.
+
+    The JSONL output mode, cassettes, traced and profiled runs always run
+    in-process, since records, cassette entries, spans and profiles come from
+    the agent that makes the request.
+    """
+    from config import get_config
+    
+    config = get_config()
+    output_format = ctx.obj['output_format'] or config.output_format
+    cassette_path = ctx.obj['cassette_path'] or config.cassette_path
+    if (not ctx.obj['no_daemon'] and output_format != 'jsonl' and not cassette_path
+            and not ctx.obj['trace'] and not ctx.obj['profile']):
+        from daemon import DaemonClient, RemoteCareerAgent
+        
+        client = DaemonClient()
+        if client.is_running():
+            return RemoteCareerAgent(client, ctx.obj['provider'], use_cache=not ctx.obj['no_cache'])
+    
+    return _create_agent(ctx)
+
+def _live_panel(chunks: Iterable[str], title: str, border_style: str) -> Iterator[str]:
+    """Pass chunks through while rendering the accumulated markdown in a live panel"""
+    from rich.live import Live
+    from rich.markdown import Markdown
+    
+    parts = []
+    last_render = 0.0
+    
+    def render() -> Panel:
+        return Panel(Markdown("".join(parts)), title=title, border_style=border_style)
+    
+    with Live(render(), console=console, vertical_overflow="visible", auto_refresh=False) as live:
+        for chunk in chunks:
+            parts.append(chunk)
+            now = time.monotonic()
+            if now - last_render >= LIVE_REFRESH_INTERVAL:
+                live.update(render(), refresh=True)
+                last_render = now
+            yield chunk
+        live.update(render(), refresh=True)
+
+def _present(agent, produce: Callable[[bool], Union[str, Iterator[str]]], status: str, title: str,
+             border_style: str, stream: bool, save_filename: Optional[str] = None,
+             saved_label: str = "Output") -> str:
+    """Run a task and show its result in a panel, optionally saving it.
+    
+    When streaming, partial markdown is rendered as tokens arrive and the save
+    file is written chunk by chunk; otherwise a spinner waits for the full text.
+    """
+    from rich.markdown import Markdown
+    from token_usage import get_last_usage, reset_last_usage
+    
+    reset_last_usage()
+    if stream:
+        parts = []
+        chunks = _live_panel(produce(True), title, border_style)
+        tee = (parts.append(chunk) or chunk for chunk in chunks)
+        if save_filename:
+            output_path = agent.save_output(tee, save_filename)
+        else:
+            for _ in tee:
+                pass
+        # Live leaves the cursor at the end of the panel's last line
+        console.print()
+        content = "".join(parts)
+    else:
+        with console.status(f"[bold green]{status}"):
+            content = produce(False)
+        
+        console.print(Panel(
+            Markdown(content),
+            title=title,
+            border_style=border_style
+        ))
+        
+        if save_filename:
+            output_path = agent.save_output(content, save_filename)
+    
+    # Nothing is reported when the response came from the local response cache
+    usage = get_last_usage()
+    if usage:
+        console.print(f"[dim]🔢 Tokens: {usage.summary()}[/dim]")
+    
+    if save_filename:
+        console.print(f"💾 {saved_label} saved to: {output_path}")
+    
+    return content
 
 @cli.command()
 @click.option('--resume-path', help='Path to resume file')
@@ -32,25 +208,23 @@ def cli(ctx, provider, config_file):
 def analyze(ctx, resume_path, detailed, save):
     """📊 Analyze your resume and get improvement suggestions"""
     try:
-        agent = CareerAgent(ctx.obj['provider'])
+        agent = _get_agent(ctx)
         
         if resume_path:
             agent.load_resume(resume_path)
         else:
             agent.load_resume()
         
-        with console.status("[bold green]Analyzing resume..."):
-            analysis = agent.analyze_resume(detailed=detailed)
-        
-        console.print(Panel(
-            Markdown(analysis),
-            title="📊 Resume Analysis",
-            border_style="blue"
-        ))
-        
-        if save:
-            output_path = agent.save_output(analysis, "resume_analysis.md")
-            console.print(f"💾 Analysis saved to: {output_path}")
+        _present(
+            agent,
+            lambda stream: agent.analyze_resume(detailed=detailed, stream=stream),
+            "Analyzing resume...",
+            "📊 Resume Analysis",
+            "blue",
+            ctx.obj['stream'],
+            save_filename="resume_analysis.md" if save else None,
+            saved_label="Analysis"
+        )
             
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
@@ -63,20 +237,18 @@ def analyze(ctx, resume_path, detailed, save):
 def advice(ctx, query, context, save):
     """💡 Get personalized career advice"""
     try:
-        agent = CareerAgent(ctx.obj['provider'])
-        
-        with console.status("[bold green]Generating career advice..."):
-            advice_text = agent.get_career_advice(query, context)
-        
-        console.print(Panel(
-            Markdown(advice_text),
-            title="💡 Career Advice",
-            border_style="green"
-        ))
+        agent = _get_agent(ctx)
         
-        if save:
-            output_path = agent.save_output(advice_text, "career_advice.md")
-            console.print(f"💾 Advice saved to: {output_path}")
+        _present(
+            agent,
+            lambda stream: agent.get_career_advice(query, context, stream=stream),
+            "Generating career advice...",
+            "💡 Career Advice",
+            "green",
+            ctx.obj['stream'],
+            save_filename="career_advice.md" if save else None,
+            saved_label="Advice"
+        )
             
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
@@ -99,20 +271,18 @@ def optimize(ctx, job_file, save):
             console.print("[bold red]Error:[/bold red] No job description provided")
             return
         
-        agent = CareerAgent(ctx.obj['provider'])
+        agent = _get_agent(ctx)
         
-        with console.status("[bold green]Optimizing resume..."):
-            optimization = agent.optimize_resume_for_job(job_description)
-        
-        console.print(Panel(
-            Markdown(optimization),
-            title="🎯 Resume Optimization",
-            border_style="yellow"
-        ))
-        
-        if save:
-            output_path = agent.save_output(optimization, "resume_optimization.md")
-            console.print(f"💾 Optimization saved to: {output_path}")
+        _present(
+            agent,
+            lambda stream: agent.optimize_resume_for_job(job_description, stream=stream),
+            "Optimizing resume...",
+            "🎯 Resume Optimization",
+            "yellow",
+            ctx.obj['stream'],
+            save_filename="resume_optimization.md" if save else None,
+            saved_label="Optimization"
+        )
             
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
@@ -137,20 +307,18 @@ def cover_letter(ctx, job_file, company, additional_info, save):
             console.print("[bold red]Error:[/bold red] No job description provided")
             return
         
-        agent = CareerAgent(ctx.obj['provider'])
-        
-        with console.status("[bold green]Generating cover letter..."):
-            letter = agent.generate_cover_letter(job_description, company, additional_info)
+        agent = _get_agent(ctx)
         
-        console.print(Panel(
-            Markdown(letter),
-            title="✉️ Cover Letter",
-            border_style="cyan"
-        ))
-        
-        if save:
-            output_path = agent.save_output(letter, f"cover_letter_{company.replace(' ', '_')}.md")
-            console.print(f"💾 Cover letter saved to: {output_path}")
+        _present(
+            agent,
+            lambda stream: agent.generate_cover_letter(job_description, company, additional_info, stream=stream),
+            "Generating cover letter...",
+            "✉️ Cover Letter",
+            "cyan",
+            ctx.obj['stream'],
+            save_filename=f"cover_letter_{company.replace(' ', '_')}.md" if save else None,
+            saved_label="Cover letter"
+        )
             
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
@@ -176,20 +344,63 @@ def interview(ctx, job_file, interview_type, save):
             console.print("[bold red]Error:[/bold red] No job description provided")
             return
         
-        agent = CareerAgent(ctx.obj['provider'])
+        agent = _get_agent(ctx)
+        
+        _present(
+            agent,
+            lambda stream: agent.prepare_interview_questions(job_description, interview_type, stream=stream),
+            "Preparing interview questions...",
+            "🎤 Interview Preparation",
+            "magenta",
+            ctx.obj['stream'],
+            save_filename=f"interview_prep_{interview_type}.md" if save else None,
+            saved_label="Interview prep"
+        )
+            
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+
+@cli.command('apply-pack')
+@click.option('--job-file', help='Path to file containing job description')
+@click.option('--company', prompt=True, help='Company name')
+@click.option('--role', help='Role title for the packet heading')
+@click.option('--type', 'interview_type', default='general',
+              type=click.Choice(['general', 'technical', 'behavioral', 'panel']),
+              help='Type of interview to prepare for')
+@click.pass_context
+def apply_pack(ctx, job_file, company, role, interview_type):
+    """📦 Build a full application packet for one job in a single pass"""
+    from rich.markdown import Markdown
+    from batch_runner import slugify
+    
+    try:
+        if job_file and os.path.exists(job_file):
+            with open(job_file, 'r', encoding='utf-8') as f:
+                job_description = f.read()
+        else:
+            console.print("📝 Please paste the job description (press Ctrl+D when done):")
+            job_description = sys.stdin.read()
+        
+        if not job_description.strip():
+            console.print("[bold red]Error:[/bold red] No job description provided")
+            return
+        
+        agent = _get_agent(ctx)
         
-        with console.status("[bold green]Preparing interview questions..."):
-            prep = agent.prepare_interview_questions(job_description, interview_type)
+        started = time.monotonic()
+        with console.status("[bold green]Generating analysis, optimization, cover letter and interview prep..."):
+            packet = agent.generate_application_packet(job_description, company, role, interview_type)
+        elapsed = time.monotonic() - started
         
         console.print(Panel(
-            Markdown(prep),
-            title="🎤 Interview Preparation",
-            border_style="magenta"
+            Markdown(packet),
+            title=f"📦 Application Packet: {company}",
+            border_style="cyan"
         ))
         
-        if save:
-            output_path = agent.save_output(prep, f"interview_prep_{interview_type}.md")
-            console.print(f"💾 Interview prep saved to: {output_path}")
+        output_path = agent.save_output(packet, f"application_packet_{slugify(company)}.md")
+        console.print(f"⏱️  Generated in {elapsed:.1f}s")
+        console.print(f"💾 Packet saved to: {output_path}")
             
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
@@ -201,24 +412,371 @@ def interview(ctx, job_file, interview_type, save):
 def skills(ctx, target_role, save):
     """📚 Get skill development suggestions"""
     try:
-        agent = CareerAgent(ctx.obj['provider'])
+        agent = _get_agent(ctx)
         
-        with console.status("[bold green]Analyzing skill development opportunities..."):
-            suggestions = agent.suggest_skill_improvements(target_role)
+        _present(
+            agent,
+            lambda stream: agent.suggest_skill_improvements(target_role, stream=stream),
+            "Analyzing skill development opportunities...",
+            "📚 Skill Development Suggestions",
+            "yellow",
+            ctx.obj['stream'],
+            save_filename="skill_suggestions.md" if save else None,
+            saved_label="Suggestions"
+        )
+            
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+
+@cli.command()
+@click.argument('queue_file', type=click.Path(exists=True, dir_okay=False))
+@click.option('--task', 'tasks', multiple=True, type=click.Choice(['optimize', 'cover_letter']),
+              help='Task to run per row (repeatable, default: all)')
+@click.option('--concurrency', type=int, help='Maximum concurrent LLM requests')
+@click.option('--limit', type=int, help='Only process the first N rows')
+@click.option('--output-dir', help='Directory for per-row outputs and the checkpoint file')
+@click.option('--checkpoint', help='Checkpoint file (default: <output-dir>/checkpoint.jsonl)')
+@click.option('--dedupe', is_flag=True, help='Run once per cluster of near-duplicate postings')
+@click.pass_context
+def batch(ctx, queue_file, tasks, concurrency, limit, output_dir, checkpoint, dedupe):
+    """📦 Tailor resume and cover letters for a whole job queue CSV"""
+    import asyncio
+    from rich.progress import Progress
+    from batch_runner import BATCH_TASKS, BatchRunner, load_job_queue
+    from cassette import CassetteProvider
+    from config import get_config
+    from token_usage import usage_meter
+    
+    try:
+        config = get_config()
+        rows = load_job_queue(queue_file)
+        if dedupe:
+            from job_dedupe import dedupe_job_rows
+            
+            total = len(rows)
+            rows, duplicates = dedupe_job_rows(rows)
+            console.print(
+                f"🧹 {total} rows collapse to {len(rows)} distinct postings "
+                f"({len(duplicates)} clusters of near-duplicates)"
+            )
+        if limit:
+            rows = rows[:limit]
         
-        console.print(Panel(
-            Markdown(suggestions),
-            title="📚 Skill Development Suggestions",
-            border_style="yellow"
-        ))
+        tasks = list(tasks) or BATCH_TASKS
+        output_dir = output_dir or os.path.join(config.output_dir, f"batch_{Path(queue_file).stem}")
         
-        if save:
-            output_path = agent.save_output(suggestions, "skill_suggestions.md")
-            console.print(f"💾 Suggestions saved to: {output_path}")
+        agent = _create_agent(ctx)
+        runner = BatchRunner(
+            agent,
+            output_dir,
+            concurrency=concurrency or config.batch_concurrency,
+            checkpoint_path=checkpoint
+        )
+        
+        with Progress(console=console) as progress:
+            progress_task = progress.add_task("Processing job queue...", total=len(rows) * len(tasks))
+            
+            def on_progress(row, task, error):
+                progress.advance(progress_task)
+                if error:
+                    progress.console.print(f"[bold red]Failed:[/bold red] {row.company} ({task}): {error}")
             
+            # Rows finished in an earlier run are already done
+            done = sum(1 for row in rows for task in tasks if runner.checkpoint.is_done(row.key, task))
+            progress.advance(progress_task, done)
+            stats = asyncio.run(runner.run(rows, tasks, on_progress=on_progress))
+        
+        console.print(
+            f"✅ {stats['completed']} completed, {stats['skipped']} skipped from checkpoint, "
+            f"{stats['failed']} failed"
+        )
+        if usage_meter.requests:
+            console.print(f"[dim]🔢 Tokens: {usage_meter.total.summary()}[/dim]")
+        if isinstance(agent.ai_provider, CassetteProvider):
+            provider = agent.ai_provider
+            missed = "missing" if provider.mode == "replay" else "recorded"
+            console.print(f"📼 Cassette: {provider.hits} replayed, {provider.misses} {missed} ({provider.cassette.path})")
+        console.print(f"💾 Outputs saved to: {output_dir}")
+        
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
 
+@cli.command()
+@click.argument('queue_file', type=click.Path(exists=True, dir_okay=False))
+@click.option('--resume-path', help='Path to resume file')
+@click.option('--top', default=20, show_default=True, help='Number of top postings to show')
+@click.option('--min-salary', type=float, help='Halve the score of postings that pay less than this')
+@click.option('--output', 'output_file', type=click.Path(dir_okay=False), help='Write every posting, ranked, to this CSV')
+@click.option('--top-output', type=click.Path(dir_okay=False), help='Write the top postings to this CSV for the batch command')
+def score(queue_file, resume_path, top, min_salary, output_file, top_output):
+    """📊 Rank a job queue CSV against your resume skills without any LLM calls"""
+    from document_parser import create_resume_parser
+    from config import get_config
+    from job_scoring import load_postings, score_postings, write_ranked_csv
+    
+    try:
+        resume_data = create_resume_parser().parse_resume(resume_path or get_config().resume_path)
+        postings = load_postings(queue_file)
+        
+        started = time.monotonic()
+        ranked = score_postings(postings, resume_data['skills'], min_salary)
+        elapsed = time.monotonic() - started
+        
+        table = Table(title=f"Top {min(top, len(ranked))} of {len(ranked)} postings")
+        table.add_column("#", justify="right", style="dim")
+        table.add_column("Score", justify="right", style="green")
+        table.add_column("Company", style="cyan")
+        table.add_column("Salary")
+        table.add_column("Link", style="dim", overflow="fold")
+        for rank, posting in enumerate(ranked[:top], 1):
+            salary = ""
+            if posting.salary_max:
+                salary = f"${posting.salary_min / 1000:,.0f}k-{posting.salary_max / 1000:,.0f}k"
+            table.add_row(str(rank), f"{posting.score:.1f}", posting.company, salary,
+                          posting.urls[0] if posting.urls else "")
+        console.print(table)
+        console.print(f"⏱️  Scored {len(ranked)} postings in {elapsed * 1000:.0f} ms")
+        
+        if output_file:
+            write_ranked_csv(ranked, output_file)
+            console.print(f"💾 Ranked postings saved to: {output_file}")
+        if top_output:
+            write_ranked_csv(ranked[:top], top_output)
+            console.print(f"💾 Top {min(top, len(ranked))} saved to: {top_output} (run `batch {top_output}` to tailor them)")
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+
+@cli.command()
+@click.option('--job-file', help='Path to file containing job description')
+@click.option('--resume-path', help='Path to resume file')
+@click.option('--top-k', type=int, help='Number of resume lines to show (default: EMBEDDING_TOP_K)')
+def match(job_file, resume_path, top_k):
+    """🧲 Show the resume lines most relevant to a job, without any LLM calls"""
+    from document_parser import create_resume_parser
+    from config import get_config
+    from embedding_index import get_embedder, load_resume_index, chunk_text, top_relevant
+    
+    try:
+        if job_file and os.path.exists(job_file):
+            with open(job_file, 'r', encoding='utf-8') as f:
+                job_description = f.read()
+        else:
+            console.print("📝 Please paste the job description (press Ctrl+D when done):")
+            job_description = sys.stdin.read()
+        
+        if not job_description.strip():
+            console.print("[bold red]Error:[/bold red] No job description provided")
+            return
+        
+        config = get_config()
+        resume_data = create_resume_parser().parse_resume(resume_path or config.resume_path)
+        
+        started = time.monotonic()
+        embedder = get_embedder(config.embedding_model)
+        index = load_resume_index(os.path.join(config.cache_dir, "embeddings"), resume_data['raw_text'], embedder)
+        matches = top_relevant(index, embedder, chunk_text(job_description), k=top_k or config.embedding_top_k)
+        elapsed = time.monotonic() - started
+        
+        table = Table(title=f"Top {len(matches)} of {len(index)} resume lines ({embedder.name})")
+        table.add_column("#", justify="right", style="dim")
+        table.add_column("Similarity", justify="right", style="green")
+        table.add_column("Resume line", overflow="fold")
+        for rank, item in enumerate(matches, 1):
+            table.add_row(str(rank), f"{item['score']:.3f}", item['text'])
+        console.print(table)
+        console.print(f"⏱️  Matched in {elapsed * 1000:.0f} ms")
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+
+@cli.group()
+def tracker():
+    """🗂️  Query the application tracker"""
+    pass
+
+def _open_tracker():
+    from tracker import Tracker, get_db_path
+    
+    return Tracker(get_db_path())
+
+def _print_applications(rows, title: str) -> None:
+    if not rows:
+        console.print(f"No applications: {title.lower()}")
+        return
+    
+    table = Table(title=f"{title} ({len(rows)})")
+    table.add_column("Company", style="cyan")
+    table.add_column("Role")
+    table.add_column("Status", style="green")
+    table.add_column("Follow up")
+    table.add_column("Source", style="dim")
+    for row in rows:
+        table.add_row(row['company'], row['role'], row['status'], row['follow_up_date'] or "", row['source'])
+    console.print(table)
+
+@tracker.command('import')
+@click.argument('csv_files', nargs=-1, type=click.Path(exists=True, dir_okay=False))
+def tracker_import(csv_files):
+    """Import job search CSVs (defaults to the job-search queues)"""
+    from tracker import get_csv_paths
+    
+    try:
+        csv_files = csv_files or [path for path in get_csv_paths() if os.path.exists(path)]
+        store = _open_tracker()
+        for csv_file in csv_files:
+            stats = store.import_csv(csv_file)
+            console.print(
+                f"📥 {csv_file} ({stats['source']}): {stats['inserted']} new, "
+                f"{stats['updated']} updated, {stats['unchanged']} unchanged, "
+                f"{stats['deleted']} removed"
+            )
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+
+@tracker.command('export')
+@click.argument('source', type=click.Choice(['tracker', 'target', 'hn']))
+@click.argument('csv_file', type=click.Path(dir_okay=False))
+def tracker_export(source, csv_file):
+    """Export a source back to its CSV format"""
+    try:
+        count = _open_tracker().export_csv(source, csv_file)
+        console.print(f"📤 Exported {count} rows to: {csv_file}")
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+
+@tracker.command('due')
+@click.option('--date', 'on_or_before', help='Include follow-ups due on or before this date (YYYY-MM-DD, default today)')
+def tracker_due(on_or_before):
+    """Open applications due for follow-up"""
+    try:
+        _print_applications(_open_tracker().due(on_or_before), "Due for follow-up")
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+
+@tracker.command('by-status')
+@click.argument('status', required=False)
+def tracker_by_status(status):
+    """Applications with STATUS, or counts per status when omitted"""
+    try:
+        store = _open_tracker()
+        if status:
+            _print_applications(store.by_status(status), f"Status: {status}")
+            return
+        
+        table = Table(title="Applications by status")
+        table.add_column("Status", style="green")
+        table.add_column("Count", justify="right")
+        for row in store.status_counts():
+            table.add_row(row['status'] or "(none)", str(row['count']))
+        console.print(table)
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+
+@tracker.command('company')
+@click.argument('name')
+def tracker_company(name):
+    """Check whether a company is already in the tracker"""
+    try:
+        _print_applications(_open_tracker().by_company(name), f"Company: {name}")
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+
+@tracker.command('dedupe')
+def tracker_dedupe():
+    """Companies that appear in more than one row"""
+    try:
+        rows = _open_tracker().duplicates()
+        if not rows:
+            console.print("No duplicate companies")
+            return
+        
+        table = Table(title=f"Companies in more than one row ({len(rows)})")
+        table.add_column("Company", style="cyan")
+        table.add_column("Rows", justify="right")
+        table.add_column("Sources", style="dim")
+        table.add_column("Statuses", style="green")
+        for row in rows:
+            table.add_row(row['company'], str(row['count']), row['sources'], row['statuses'])
+        console.print(table)
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+
+@cli.group()
+def daemon():
+    """🔥 Manage the resident career agent daemon"""
+    pass
+
+@daemon.command('start')
+@click.option('--detach', is_flag=True, help='Run the daemon in the background')
+@click.pass_context
+def daemon_start(ctx, detach):
+    """Start the daemon and keep a warm agent ready"""
+    from daemon import CareerAgentDaemon, DaemonClient, get_socket_path
+    
+    try:
+        if DaemonClient().is_running():
+            console.print(f"Daemon already running on {get_socket_path()}")
+            return
+        
+        if detach:
+            import subprocess
+            
+            args = [sys.executable, os.path.abspath(__file__)]
+            if ctx.obj['provider']:
+                args += ['--provider', ctx.obj['provider']]
+            subprocess.Popen(
+                args + ['daemon', 'start'],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+            
+            # Wait until the agent is warm and the socket is accepting requests
+            for _ in range(600):
+                if DaemonClient().is_running():
+                    console.print(f"🔥 Daemon started on {get_socket_path()}")
+                    return
+                time.sleep(0.1)
+            console.print("[bold red]Error:[/bold red] Daemon did not start; run without --detach to see why")
+            return
+        
+        console.print(f"🔥 Starting daemon on {get_socket_path()} (Ctrl+C to stop)")
+        CareerAgentDaemon(provider_name=ctx.obj['provider']).serve_forever()
+        
+    except KeyboardInterrupt:
+        console.print("\n👋 Daemon stopped")
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+
+@daemon.command('stop')
+def daemon_stop():
+    """Stop the running daemon"""
+    from daemon import DaemonClient
+    
+    client = DaemonClient()
+    if not client.is_running():
+        console.print("Daemon is not running")
+        return
+    
+    client.shutdown()
+    console.print("👋 Daemon stopped")
+
+@daemon.command('status')
+def daemon_status():
+    """Show whether the daemon is running"""
+    from daemon import DaemonClient, get_socket_path
+    
+    client = DaemonClient()
+    if not client.is_running():
+        console.print("Daemon is not running")
+        return
+    
+    status = client.ping()
+    console.print(
+        f"🔥 Daemon running on {get_socket_path()} "
+        f"(pid {status['pid']}, up {status['uptime']:.0f}s, {status['agents']} warm agent(s))"
+    )
+
 @cli.command()
 @click.pass_context
 def interactive(ctx):
@@ -231,7 +789,8 @@ def interactive(ctx):
     ))
     
     try:
-        agent = CareerAgent(ctx.obj['provider'])
+        agent = _get_agent(ctx)
+        stream = ctx.obj['stream']
         
         while True:
             console.print("\n" + "="*50)
@@ -256,49 +815,45 @@ def interactive(ctx):
                 console.print("👋 Goodbye! Good luck with your career journey!")
                 break
             elif choice == "1":
-                _interactive_analyze(agent)
+                _interactive_analyze(agent, stream)
             elif choice == "2":
-                _interactive_advice(agent)
+                _interactive_advice(agent, stream)
             elif choice == "3":
-                _interactive_optimize(agent)
+                _interactive_optimize(agent, stream)
             elif choice == "4":
-                _interactive_cover_letter(agent)
+                _interactive_cover_letter(agent, stream)
             elif choice == "5":
-                _interactive_interview(agent)
+                _interactive_interview(agent, stream)
             elif choice == "6":
-                _interactive_skills(agent)
+                _interactive_skills(agent, stream)
                 
     except KeyboardInterrupt:
         console.print("\n👋 Goodbye!")
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
 
-def _interactive_analyze(agent):
+def _interactive_analyze(agent, stream):
     detailed = Prompt.ask("Detailed analysis?", choices=["y", "n"], default="y") == "y"
     
-    with console.status("[bold green]Analyzing resume..."):
-        analysis = agent.analyze_resume(detailed=detailed)
-    
-    console.print(Panel(Markdown(analysis), title="📊 Resume Analysis", border_style="blue"))
+    analysis = _present(agent, lambda streaming: agent.analyze_resume(detailed=detailed, stream=streaming),
+                        "Analyzing resume...", "📊 Resume Analysis", "blue", stream)
     
     if Prompt.ask("Save to file?", choices=["y", "n"], default="n") == "y":
         output_path = agent.save_output(analysis, "resume_analysis.md")
         console.print(f"💾 Saved to: {output_path}")
 
-def _interactive_advice(agent):
+def _interactive_advice(agent, stream):
     query = Prompt.ask("What career advice do you need?")
     context = Prompt.ask("Any additional context? (optional)", default="")
     
-    with console.status("[bold green]Generating advice..."):
-        advice_text = agent.get_career_advice(query, context if context else None)
-    
-    console.print(Panel(Markdown(advice_text), title="💡 Career Advice", border_style="green"))
+    advice_text = _present(agent, lambda streaming: agent.get_career_advice(query, context if context else None, stream=streaming),
+                           "Generating advice...", "💡 Career Advice", "green", stream)
     
     if Prompt.ask("Save to file?", choices=["y", "n"], default="n") == "y":
         output_path = agent.save_output(advice_text, "career_advice.md")
         console.print(f"💾 Saved to: {output_path}")
 
-def _interactive_optimize(agent):
+def _interactive_optimize(agent, stream):
     console.print("📝 Please paste the job description (press Enter twice when done):")
     lines = []
     empty_count = 0
@@ -316,16 +871,14 @@ def _interactive_optimize(agent):
         console.print("[bold red]No job description provided[/bold red]")
         return
     
-    with console.status("[bold green]Optimizing resume..."):
-        optimization = agent.optimize_resume_for_job(job_description)
-    
-    console.print(Panel(Markdown(optimization), title="🎯 Resume Optimization", border_style="yellow"))
+    optimization = _present(agent, lambda streaming: agent.optimize_resume_for_job(job_description, stream=streaming),
+                            "Optimizing resume...", "🎯 Resume Optimization", "yellow", stream)
     
     if Prompt.ask("Save to file?", choices=["y", "n"], default="n") == "y":
         output_path = agent.save_output(optimization, "resume_optimization.md")
         console.print(f"💾 Saved to: {output_path}")
 
-def _interactive_cover_letter(agent):
+def _interactive_cover_letter(agent, stream):
     company = Prompt.ask("Company name")
     console.print("📝 Please paste the job description (press Enter twice when done):")
     lines = []
@@ -341,16 +894,14 @@ def _interactive_cover_letter(agent):
     job_description = "\n".join(lines).strip()
     additional_info = Prompt.ask("Any additional info to include? (optional)", default="")
     
-    with console.status("[bold green]Generating cover letter..."):
-        letter = agent.generate_cover_letter(job_description, company, additional_info if additional_info else None)
-    
-    console.print(Panel(Markdown(letter), title="✉️ Cover Letter", border_style="cyan"))
+    letter = _present(agent, lambda streaming: agent.generate_cover_letter(job_description, company, additional_info if additional_info else None, stream=streaming),
+                      "Generating cover letter...", "✉️ Cover Letter", "cyan", stream)
     
     if Prompt.ask("Save to file?", choices=["y", "n"], default="n") == "y":
         output_path = agent.save_output(letter, f"cover_letter_{company.replace(' ', '_')}.md")
         console.print(f"💾 Saved to: {output_path}")
 
-def _interactive_interview(agent):
+def _interactive_interview(agent, stream):
     interview_type = Prompt.ask("Interview type", choices=["general", "technical", "behavioral", "panel"], default="general")
     console.print("📝 Please paste the job description (press Enter twice when done):")
     lines = []
@@ -365,22 +916,18 @@ def _interactive_interview(agent):
     
     job_description = "\n".join(lines).strip()
     
-    with console.status("[bold green]Preparing interview questions..."):
-        prep = agent.prepare_interview_questions(job_description, interview_type)
-    
-    console.print(Panel(Markdown(prep), title="🎤 Interview Preparation", border_style="magenta"))
+    prep = _present(agent, lambda streaming: agent.prepare_interview_questions(job_description, interview_type, stream=streaming),
+                    "Preparing interview questions...", "🎤 Interview Preparation", "magenta", stream)
     
     if Prompt.ask("Save to file?", choices=["y", "n"], default="n") == "y":
         output_path = agent.save_output(prep, f"interview_prep_{interview_type}.md")
         console.print(f"💾 Saved to: {output_path}")
 
-def _interactive_skills(agent):
+def _interactive_skills(agent, stream):
     target_role = Prompt.ask("Target role or career direction (optional)", default="")
     
-    with console.status("[bold green]Analyzing skill development opportunities..."):
-        suggestions = agent.suggest_skill_improvements(target_role if target_role else None)
-    
-    console.print(Panel(Markdown(suggestions), title="📚 Skill Development", border_style="yellow"))
+    suggestions = _present(agent, lambda streaming: agent.suggest_skill_improvements(target_role if target_role else None, stream=streaming),
+                           "Analyzing skill development opportunities...", "📚 Skill Development", "yellow", stream)
     
     if Prompt.ask("Save to file?", choices=["y", "n"], default="n") == "y":
         output_path = agent.save_output(suggestions, "skill_suggestions.md")
@@ -4,8 +4,6 @@ from pydantic import Field
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
-load_dotenv()
-
 class AgentConfig(BaseSettings):
     """Configuration settings for the Career Agent"""
     
@@ -13,30 +11,103 @@ class AgentConfig(BaseSettings):
     openai_api_key: Optional[str] = Field(default=None)
     anthropic_api_key: Optional[str] = Field(default=None)
     
-    # Default AI provider (openai or anthropic)
+    # Default AI provider (openai, anthropic, or local for the offline simulator)
     default_provider: str = Field(default="openai")
     
     # Model settings
     openai_model: str = Field(default="gpt-4")
     anthropic_model: str = Field(default="claude-3-sonnet-20240229")
     
+    # Local provider: simulated latency (lognormal around the median time to
+    # first token), output rate (0 = instant), response length and 429 rate
+    local_model: str = Field(default="local-sim")
+    local_latency_ms: float = Field(default=300.0)
+    local_latency_sigma: float = Field(default=0.5)
+    local_tokens_per_second: float = Field(default=80.0)
+    local_output_tokens: int = Field(default=400)
+    local_error_rate: float = Field(default=0.0)
+    local_retry_after_ms: float = Field(default=200.0)
+    local_seed: Optional[int] = Field(default=None)
+    
+    # Client-side rate limiting per provider and model (0 disables a bucket)
+    rate_limit_requests_per_minute: int = Field(default=0)
+    rate_limit_tokens_per_minute: int = Field(default=0)
+    max_concurrency: int = Field(default=8)
+    min_concurrency: int = Field(default=1)
+    max_retries: int = Field(default=5)
+    retry_backoff_base: float = Field(default=1.0)
+    retry_backoff_max: float = Field(default=60.0)
+    
     # Agent settings
     max_tokens: int = Field(default=4000)
     temperature: float = Field(default=0.7)
     
+    # Prompt token budget (0 = the model's context window minus max_tokens)
+    prompt_token_budget: int = Field(default=0)
+    # Job descriptions are cut to this many tokens after boilerplate removal (0 = no cap)
+    job_description_max_tokens: int = Field(default=2000)
+    
+    # Resume bullets matched to job postings: "hashing", "hashing:<dim>" or "sentence-transformers:<model>"
+    embedding_model: str = Field(default="hashing")
+    # Resume bullets that replace the full resume text in tailoring prompts over the token budget (0 = off)
+    embedding_top_k: int = Field(default=8)
+    # Send only those bullets in tailoring prompts even when the full resume fits: smaller prompts, but a
+    # per-job resume context that the provider's prompt cache cannot reuse across tasks
+    embedding_bullets_only: bool = Field(default=False)
+    
+    # Maximum concurrent LLM requests for batch runs
+    batch_concurrency: int = Field(default=4)
+    
     # File paths
     resume_path: str = Field(default="Ian_Alloway_Resume_CV.pdf")
     output_dir: str = Field(default="output")
     
+    # Output format: "markdown" files per response, or "jsonl" records appended to one log in output_dir
+    output_format: str = Field(default="markdown")
+    output_log_filename: str = Field(default="records.jsonl")
+    # Buffered records are written once this many are waiting or this many seconds have passed
+    output_log_max_buffered: int = Field(default=100)
+    output_log_flush_interval: float = Field(default=5.0)
+    
+    # Number of worker processes for PDF page extraction (1 = serial)
+    pdf_workers: int = Field(default=1)
+    
+    # Skills taxonomy file (defaults to the bundled skills_taxonomy.txt)
+    skills_taxonomy_path: Optional[str] = Field(default=None)
+    
+    # Parse cache settings
+    cache_dir: str = Field(default=".cache")
+    parse_cache_enabled: bool = Field(default=True)
+    parse_cache_max_entries: int = Field(default=64)
+    parse_cache_max_bytes: int = Field(default=50 * 1024 * 1024)
+    
+    # Record/replay cassette of LLM responses (off unless a path is set); mode is auto, record or replay
+    cassette_path: Optional[str] = Field(default=None)
+    cassette_mode: str = Field(default="auto")
+    
+    # LLM response cache settings
+    response_cache_enabled: bool = Field(default=True)
+    response_cache_ttl_seconds: int = Field(default=7 * 24 * 3600)
+    response_cache_max_entries: int = Field(default=1000)
+    
     model_config = {
         "env_file": ".env",
         "case_sensitive": False,
         "extra": "ignore"
     }
 
-# Global config instance
-config = AgentConfig()
+_config: Optional[AgentConfig] = None
 
 def get_config() -> AgentConfig:
-    """Get the global configuration instance"""
-    return config
\ No newline at end of file
+    """Get the global configuration instance, loading .env on first use"""
+    global _config
+    if _config is None:
+        load_dotenv()
+        _config = AgentConfig()
+    return _config
+
+def __getattr__(name: str):
+    # Keep `from config import config` working without building the config at import time
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
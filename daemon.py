@@ -0,0 +1,283 @@
+import os
+import json
+import time
+import socket
+import threading
+import socketserver
+from typing import Dict, Any, Optional, Iterator, Tuple, Union, Iterable
+
+from output_writer import save_output_file
+from token_usage import TokenUsage, get_last_usage, reset_last_usage, record_usage, collect_savings
+
+# Socket used when DAEMON_SOCKET_PATH is not set; resolved relative to the working directory
+DEFAULT_SOCKET_PATH = os.path.join(".cache", "career_agent.sock")
+
+# CareerAgent methods the daemon will run on behalf of a client
+DAEMON_TASKS = {
+    'analyze_resume',
+    'get_career_advice',
+    'optimize_resume_for_job',
+    'generate_cover_letter',
+    'prepare_interview_questions',
+    'suggest_skill_improvements',
+    'generate_application_packet'
+}
+
+def get_socket_path() -> str:
+    """Socket path shared by the daemon and its clients.
+
+    Read straight from the environment so clients can find the daemon without
+    loading the full AgentConfig.
+    """
+    return os.environ.get("DAEMON_SOCKET_PATH", DEFAULT_SOCKET_PATH)
+
+def _send(wfile, message: Dict[str, Any]) -> None:
+    wfile.write(json.dumps(message).encode('utf-8') + b"\n")
+    wfile.flush()
+
+def _usage_dict() -> Optional[Dict[str, Any]]:
+    usage = get_last_usage()
+    return usage.to_dict() if usage else None
+
+def _record_remote_usage(message: Dict[str, Any]) -> None:
+    # Mirror the daemon's token usage so the client can report it
+    if message.get("usage"):
+        record_usage(TokenUsage(**message["usage"]))
+
+def _print_remote_savings(message: Dict[str, Any]) -> None:
+    # Prompt trimming notices are collected by the daemon and printed here, as an in-process run would
+    for notice in message.get("savings") or []:
+        print(notice)
+
+class _DaemonHandler(socketserver.StreamRequestHandler):
+    """Handles one newline-delimited JSON request per connection"""
+    
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            _send(self.wfile, {"error": "Malformed request"})
+            return
+        
+        command = request.get("command", "task")
+        try:
+            if command == "ping":
+                _send(self.wfile, self.server.agent_daemon.status())
+            elif command == "shutdown":
+                _send(self.wfile, {"ok": True})
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            elif command == "task":
+                self._run_task(request)
+            else:
+                _send(self.wfile, {"error": f"Unknown command: {command}"})
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away mid-response
+            pass
+        except Exception as e:
+            try:
+                _send(self.wfile, {"error": str(e)})
+            except OSError:
+                pass
+    
+    def _run_task(self, request: Dict[str, Any]) -> None:
+        task = request.get("task")
+        if task not in DAEMON_TASKS:
+            raise ValueError(f"Unsupported task: {task}")
+        
+        agent = self.server.agent_daemon.get_agent(
+            request.get("provider"),
+            request.get("use_cache", True),
+            request.get("resume_path")
+        )
+        method = getattr(agent, task)
+        kwargs = request.get("kwargs", {})
+        
+        reset_last_usage()
+        savings = collect_savings()
+        if request.get("stream"):
+            # Prompts are built when the method is called, so their savings go out before the first chunk
+            chunks = method(**kwargs, stream=True)
+            _send(self.wfile, {"savings": savings})
+            for chunk in chunks:
+                _send(self.wfile, {"chunk": chunk})
+            _send(self.wfile, {"done": True, "usage": _usage_dict()})
+        else:
+            result = method(**kwargs)
+            _send(self.wfile, {"result": result, "usage": _usage_dict(), "savings": savings})
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+class CareerAgentDaemon:
+    """Resident process holding warm CareerAgents behind a Unix socket"""
+    
+    def __init__(self, socket_path: Optional[str] = None, provider_name: Optional[str] = None):
+        self.socket_path = socket_path or get_socket_path()
+        self.provider_name = provider_name
+        self.started_at = time.time()
+        self._agents: Dict[Tuple[Optional[str], bool, Optional[str]], Any] = {}
+        # Stat signature of the resume each agent last loaded, to notice edits
+        self._loaded: Dict[Tuple[Optional[str], bool, Optional[str]], Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+    
+    def get_agent(self, provider_name: Optional[str], use_cache: bool, resume_path: Optional[str]):
+        """Get a warm agent for the request, building it on first use and reloading the resume when the file changed"""
+        from career_agent import CareerAgent
+        
+        key = (provider_name or self.provider_name, use_cache, resume_path)
+        with self._lock:
+            agent = self._agents.get(key)
+            if agent is None:
+                agent = self._agents[key] = CareerAgent(key[0], use_cache=use_cache)
+            
+            stat = os.stat(resume_path or agent.config.resume_path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if self._loaded.get(key) != signature:
+                agent.load_resume(resume_path)
+                self._loaded[key] = signature
+            return agent
+    
+    def status(self) -> Dict[str, Any]:
+        from config import get_config
+        
+        return {
+            "pid": os.getpid(),
+            "uptime": time.time() - self.started_at,
+            "agents": len(self._agents),
+            "output_dir": os.path.abspath(get_config().output_dir)
+        }
+    
+    def serve_forever(self) -> None:
+        """Warm the default agent, then serve requests until shut down"""
+        self.get_agent(None, True, None)
+        
+        os.makedirs(os.path.dirname(self.socket_path) or ".", exist_ok=True)
+        if os.path.exists(self.socket_path):
+            if DaemonClient(self.socket_path).is_running():
+                raise RuntimeError(f"Daemon already running on {self.socket_path}")
+            # Left behind by a daemon that did not shut down cleanly
+            os.unlink(self.socket_path)
+        
+        # Bind under an owner-only umask, so the socket is never reachable by other users, not even briefly
+        previous_umask = os.umask(0o177)
+        try:
+            server = _UnixServer(self.socket_path, _DaemonHandler)
+        finally:
+            os.umask(previous_umask)
+        server.agent_daemon = self
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+class DaemonClient:
+    """Client side of the daemon protocol"""
+    
+    def __init__(self, socket_path: Optional[str] = None, timeout: float = 600.0):
+        self.socket_path = socket_path or get_socket_path()
+        self.timeout = timeout
+    
+    def _request(self, request: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            sock.sendall(json.dumps(request).encode('utf-8') + b"\n")
+            with sock.makefile('rb') as rfile:
+                for line in rfile:
+                    message = json.loads(line)
+                    if "error" in message:
+                        raise Exception(message["error"])
+                    yield message
+    
+    def is_running(self) -> bool:
+        if not os.path.exists(self.socket_path):
+            return False
+        try:
+            self.ping()
+            return True
+        except (OSError, ValueError):
+            return False
+    
+    def ping(self) -> Dict[str, Any]:
+        return next(self._request({"command": "ping"}))
+    
+    def shutdown(self) -> None:
+        next(self._request({"command": "shutdown"}))
+    
+    def run_task(self, task: str, kwargs: Dict[str, Any], provider_name: Optional[str] = None,
+                 use_cache: bool = True, resume_path: Optional[str] = None,
+                 stream: bool = False) -> Union[str, Iterator[str]]:
+        request = {
+            "command": "task",
+            "task": task,
+            "kwargs": kwargs,
+            "provider": provider_name,
+            "use_cache": use_cache,
+            "resume_path": resume_path,
+            "stream": stream
+        }
+        if stream:
+            messages = self._request(request)
+            _print_remote_savings(next(messages))
+            return self._stream(messages)
+        message = next(self._request(request))
+        _print_remote_savings(message)
+        _record_remote_usage(message)
+        return message["result"]
+    
+    def _stream(self, messages: Iterator[Dict[str, Any]]) -> Iterator[str]:
+        for message in messages:
+            if message.get("done"):
+                _record_remote_usage(message)
+                return
+            yield message["chunk"]
+
+class RemoteCareerAgent:
+    """Drop-in stand-in for CareerAgent's task methods that forwards them to a running daemon"""
+    
+    def __init__(self, client: DaemonClient, provider_name: Optional[str] = None, use_cache: bool = True):
+        self.client = client
+        self.provider_name = provider_name
+        self.use_cache = use_cache
+        self.resume_path: Optional[str] = None
+        self.output_dir = client.ping()["output_dir"]
+    
+    def load_resume(self, file_path: Optional[str] = None) -> None:
+        """Resumes are parsed by the daemon; this only selects which one"""
+        self.resume_path = os.path.abspath(file_path) if file_path else None
+    
+    def _run(self, task: str, stream: bool, **kwargs) -> Union[str, Iterator[str]]:
+        return self.client.run_task(
+            task, kwargs, self.provider_name, self.use_cache, self.resume_path, stream
+        )
+    
+    def analyze_resume(self, detailed: bool = True, stream: bool = False) -> Union[str, Iterator[str]]:
+        return self._run('analyze_resume', stream, detailed=detailed)
+    
+    def get_career_advice(self, query: str, context: Optional[str] = None, stream: bool = False) -> Union[str, Iterator[str]]:
+        return self._run('get_career_advice', stream, query=query, context=context)
+    
+    def optimize_resume_for_job(self, job_description: str, stream: bool = False) -> Union[str, Iterator[str]]:
+        return self._run('optimize_resume_for_job', stream, job_description=job_description)
+    
+    def generate_cover_letter(self, job_description: str, company_name: str, additional_info: Optional[str] = None, stream: bool = False) -> Union[str, Iterator[str]]:
+        return self._run('generate_cover_letter', stream, job_description=job_description,
+                         company_name=company_name, additional_info=additional_info)
+    
+    def prepare_interview_questions(self, job_description: str, interview_type: str = "general", stream: bool = False) -> Union[str, Iterator[str]]:
+        return self._run('prepare_interview_questions', stream, job_description=job_description,
+                         interview_type=interview_type)
+    
+    def suggest_skill_improvements(self, target_role: Optional[str] = None, stream: bool = False) -> Union[str, Iterator[str]]:
+        return self._run('suggest_skill_improvements', stream, target_role=target_role)
+    
+    def generate_application_packet(self, job_description: str, company_name: str, role: Optional[str] = None,
+                                    interview_type: str = "general") -> str:
+        return self._run('generate_application_packet', False, job_description=job_description,
+                         company_name=company_name, role=role, interview_type=interview_type)
+    
+    def save_output(self, content: Union[str, Iterable[str]], filename: str) -> str:
+        """Save output locally into the daemon's output directory"""
+        return save_output_file(self.output_dir, content, filename)
@@ -1,37 +1,151 @@
 import os
-from typing import Optional, Dict, Any
-import PyPDF2
-from docx import Document
+import posixpath
+import zipfile
+from xml.etree import ElementTree
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Any, List, Iterator, Iterable, Tuple
 from pathlib import Path
 import re
 
+from parse_cache import ParseCache
+from tracing import span, traced, tracer
+from skills_taxonomy import SkillsMatcher, get_default_skills_matcher
+
+# Bump whenever extraction logic changes so cached parses are invalidated
+PARSER_VERSION = "5"
+
+# PDFs shorter than this are extracted serially; pool startup would cost more than it saves
+MIN_PAGES_FOR_PARALLEL = 8
+
+def _page_text(page, index: int) -> str:
+    """Extract one PDF page's text, timed as a span"""
+    with span("pdf.page", page=index) as page_span:
+        text = page.extract_text()
+        page_span.set_attribute("chars", len(text))
+    return text
+
+def _extract_pdf_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """Extract the text of pages [start, stop) in a worker process"""
+    import PyPDF2
+    
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        return [pdf_reader.pages[i].extract_text() for i in range(start, stop)]
+
+# OOXML namespaces, in ElementTree's "{namespace}tag" form
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_RELATIONSHIP = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+
+def _docx_part_names(archive: zipfile.ZipFile) -> Tuple[str, List[str]]:
+    """Zip names of the main document part and its header parts, found through the package relationships"""
+    def related(rels_name: str, base: str, type_suffix: str) -> List[str]:
+        try:
+            rels = ElementTree.fromstring(archive.read(rels_name))
+        except KeyError:
+            return []
+        return [
+            posixpath.normpath(posixpath.join(base, rel.get('Target', '').lstrip('/')))
+            for rel in rels.iter(_RELATIONSHIP)
+            if rel.get('Type', '').endswith(type_suffix) and rel.get('TargetMode') != 'External'
+        ]
+    
+    main = (related('_rels/.rels', '', '/officeDocument') or ['word/document.xml'])[0]
+    directory, name = posixpath.split(main)
+    headers = related(posixpath.join(directory, '_rels', f"{name}.rels"), directory, '/header')
+    return main, sorted(set(headers))
+
+def _iter_ooxml_paragraphs(xml_file) -> Iterator[str]:
+    """Stream paragraph texts from a WordprocessingML part with incremental parsing.
+    
+    Table cells and text boxes hold ordinary paragraphs, so they are yielded
+    too; a text box's paragraphs come just before the paragraph anchoring it.
+    Finished top-level elements are dropped as parsing goes, so memory stays
+    flat however long the document is.
+    """
+    stack = []
+    paragraphs: List[List[str]] = []
+    # Inside mc:Fallback (legacy copies of text boxes) or paragraph properties (tab stops)
+    skip_depth = 0
+    
+    for event, element in ElementTree.iterparse(xml_file, events=('start', 'end')):
+        tag = element.tag
+        if event == 'start':
+            stack.append(element)
+            if tag == _MC_FALLBACK or tag == _W + 'pPr':
+                skip_depth += 1
+            elif tag == _W + 'p' and not skip_depth:
+                paragraphs.append([])
+            continue
+        
+        stack.pop()
+        if tag == _MC_FALLBACK or tag == _W + 'pPr':
+            skip_depth -= 1
+        elif skip_depth or not paragraphs:
+            pass
+        elif tag == _W + 't':
+            paragraphs[-1].append(element.text or '')
+        elif tag == _W + 'tab':
+            paragraphs[-1].append('\t')
+        elif tag == _W + 'cr' or (tag == _W + 'br' and element.get(_W + 'type') in (None, 'textWrapping')):
+            paragraphs[-1].append('\n')
+        elif tag == _W + 'noBreakHyphen':
+            paragraphs[-1].append('-')
+        elif tag == _W + 'p':
+            yield ''.join(paragraphs.pop())
+        
+        if stack and stack[-1].tag in (_W + 'body', _W + 'hdr'):
+            stack[-1].remove(element)
+
 class DocumentParser:
     """Parser for various document formats"""
     
     @staticmethod
-    def extract_text_from_pdf(file_path: str) -> str:
-        """Extract text from PDF file"""
+    def extract_text_from_pdf(file_path: str, workers: int = 1) -> str:
+        """Extract text from PDF file, optionally spreading pages across worker processes"""
+        import PyPDF2
+        
         try:
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip()
+                page_count = len(pdf_reader.pages)
+                
+                if workers <= 1 or page_count < MIN_PAGES_FOR_PARALLEL:
+                    pages = [_page_text(page, index) for index, page in enumerate(pdf_reader.pages)]
+                else:
+                    pages = None
+            
+            if pages is None:
+                pages = DocumentParser._extract_pdf_pages_parallel(file_path, page_count, workers)
+            
+            return "".join(f"{page}\n" for page in pages).strip()
         except Exception as e:
             raise Exception(f"Error reading PDF file: {str(e)}")
     
+    @staticmethod
+    def _extract_pdf_pages_parallel(file_path: str, page_count: int, workers: int) -> List[str]:
+        """Extract pages across a process pool, preserving page order"""
+        return list(DocumentParser._iter_pdf_pages_parallel(file_path, page_count, workers))
+    
+    @staticmethod
+    def _iter_pdf_pages_parallel(file_path: str, page_count: int, workers: int) -> Iterator[str]:
+        """Yield page texts in order while later contiguous page chunks are still being extracted"""
+        workers = min(workers, page_count)
+        chunk_size = -(-page_count // workers)
+        ranges = [(start, min(start + chunk_size, page_count)) for start in range(0, page_count, chunk_size)]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_extract_pdf_page_range, file_path, start, stop) for start, stop in ranges]
+            for future, (start, stop) in zip(futures, ranges):
+                # Worker processes are not traced; this times the wait for each chunk
+                with span("pdf.page_range", pages=stop - start, first_page=start):
+                    pages = future.result()
+                yield from pages
+    
     @staticmethod
     def extract_text_from_docx(file_path: str) -> str:
         """Extract text from Word document"""
-        try:
-            doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
-        except Exception as e:
-            raise Exception(f"Error reading Word document: {str(e)}")
+        return "\n".join(DocumentParser._iter_docx_lines(file_path)).strip()
     
     @staticmethod
     def extract_text_from_txt(file_path: str) -> str:
@@ -43,7 +157,7 @@ class DocumentParser:
             raise Exception(f"Error reading text file: {str(e)}")
     
     @staticmethod
-    def parse_document(file_path: str) -> str:
+    def parse_document(file_path: str, pdf_workers: int = 1) -> str:
         """Parse document based on file extension"""
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
@@ -51,78 +165,345 @@ class DocumentParser:
         file_extension = Path(file_path).suffix.lower()
         
         if file_extension == '.pdf':
-            return DocumentParser.extract_text_from_pdf(file_path)
+            return DocumentParser.extract_text_from_pdf(file_path, workers=pdf_workers)
         elif file_extension == '.docx':
             return DocumentParser.extract_text_from_docx(file_path)
         elif file_extension in ['.txt', '.md']:
             return DocumentParser.extract_text_from_txt(file_path)
         else:
             raise ValueError(f"Unsupported file format: {file_extension}")
+    
+    @staticmethod
+    def iter_lines(file_path: str, pdf_workers: int = 1) -> Iterator[str]:
+        """Stream document text line by line without materializing the whole document.
+        
+        Joining the yielded lines with newlines and stripping the result gives
+        exactly what parse_document returns.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        file_extension = Path(file_path).suffix.lower()
+        
+        if file_extension == '.pdf':
+            return DocumentParser._iter_pdf_lines(file_path, workers=pdf_workers)
+        elif file_extension == '.docx':
+            return DocumentParser._iter_docx_lines(file_path)
+        elif file_extension in ['.txt', '.md']:
+            return DocumentParser._iter_txt_lines(file_path)
+        else:
+            raise ValueError(f"Unsupported file format: {file_extension}")
+    
+    @staticmethod
+    def _iter_pdf_lines(file_path: str, workers: int = 1) -> Iterator[str]:
+        """Yield PDF lines page by page"""
+        import PyPDF2
+        
+        try:
+            with open(file_path, 'rb') as file:
+                pdf_reader = PyPDF2.PdfReader(file)
+                page_count = len(pdf_reader.pages)
+                
+                if workers <= 1 or page_count < MIN_PAGES_FOR_PARALLEL:
+                    for index, page in enumerate(pdf_reader.pages):
+                        yield from _page_text(page, index).split('\n')
+                    return
+            
+            for page_text in DocumentParser._iter_pdf_pages_parallel(file_path, page_count, workers):
+                yield from page_text.split('\n')
+        except Exception as e:
+            raise Exception(f"Error reading PDF file: {str(e)}")
+    
+    @staticmethod
+    def _iter_docx_lines(file_path: str) -> Iterator[str]:
+        """Yield Word document lines: headers first, then body paragraphs, table cells and text boxes.
+        
+        The XML is streamed straight out of the OOXML zip. If that fails before
+        any line is produced, the document is read with python-docx instead,
+        which only sees body paragraphs.
+        """
+        produced = False
+        try:
+            for line in DocumentParser._iter_docx_zip_lines(file_path):
+                produced = True
+                yield line
+        except Exception as e:
+            if produced:
+                raise Exception(f"Error reading Word document: {str(e)}")
+            yield from DocumentParser._iter_docx_lines_python_docx(file_path)
+    
+    @staticmethod
+    def _iter_docx_zip_lines(file_path: str) -> Iterator[str]:
+        with span("docx.open"):
+            archive = zipfile.ZipFile(file_path)
+        
+        with archive:
+            main, headers = _docx_part_names(archive)
+            # Identical first-page/default headers would otherwise repeat the contact block
+            seen_headers = set()
+            for header in headers:
+                with archive.open(header) as xml_file:
+                    lines = tuple(_iter_ooxml_paragraphs(xml_file))
+                if lines not in seen_headers:
+                    seen_headers.add(lines)
+                    for paragraph in lines:
+                        yield from paragraph.split('\n')
+            
+            with archive.open(main) as xml_file:
+                for paragraph in _iter_ooxml_paragraphs(xml_file):
+                    yield from paragraph.split('\n')
+    
+    @staticmethod
+    def _iter_docx_lines_python_docx(file_path: str) -> Iterator[str]:
+        """Yield Word document lines paragraph by paragraph through python-docx"""
+        from docx import Document
+        
+        try:
+            with span("docx.open", fallback=True):
+                doc = Document(file_path)
+            for paragraph in doc.paragraphs:
+                yield from paragraph.text.split('\n')
+        except Exception as e:
+            raise Exception(f"Error reading Word document: {str(e)}")
+    
+    @staticmethod
+    def _iter_txt_lines(file_path: str) -> Iterator[str]:
+        """Yield text file lines as they are read"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    yield line[:-1] if line.endswith('\n') else line
+        except Exception as e:
+            raise Exception(f"Error reading text file: {str(e)}")
+
+# Common section headers, in priority order: the first matching section wins
+SECTION_PATTERNS = {
+    'summary': r'summary|profile|objective|about',
+    'experience': r'experience|employment|work history|professional experience',
+    'education': r'education|academic|qualifications',
+    'skills': r'skills|competencies|technical skills|expertise',
+    'projects': r'projects|portfolio',
+    'certifications': r'certifications|certificates|licenses',
+    'achievements': r'achievements|awards|honors|accomplishments'
+}
+
+# Degree patterns
+DEGREE_PATTERNS = [
+    r'bachelor|b\.?s\.?|b\.?a\.?|bs|ba',
+    r'master|m\.?s\.?|m\.?a\.?|ms|ma|mba',
+    r'phd|ph\.?d\.?|doctorate|doctoral',
+    r'associate|a\.?s\.?|as'
+]
+
+# Look for job titles and company patterns
+JOB_PATTERNS = [
+    r'engineer|developer|manager|analyst|director|consultant|specialist',
+    r'software|senior|junior|lead|principal|staff'
+]
+
+class LineClassifier:
+    """Precompiled engine that classifies a line against every section, degree and job pattern.
+    
+    All patterns are matched against the lowercased line, which is cheaper than
+    case-insensitive matching. Section headers use one alternation with a named
+    group per section; the per-section patterns are only consulted on the rare
+    header lines where a lower-priority group matched first.
+    """
+    
+    SECTION_MAX_LENGTH = 50
+    JOB_MIN_LENGTH = 10
+    JOB_MAX_LENGTH = 100
+    
+    def __init__(self):
+        self.section_names = list(SECTION_PATTERNS)
+        self.section_regex = re.compile('|'.join(
+            f'(?P<{name}>{pattern})' for name, pattern in SECTION_PATTERNS.items()
+        ))
+        self.section_regexes = {name: re.compile(pattern) for name, pattern in SECTION_PATTERNS.items()}
+        self.degree_regex = re.compile('|'.join(DEGREE_PATTERNS))
+        self.job_regex = re.compile('|'.join(JOB_PATTERNS))
+    
+    def section_for(self, lowered: str) -> Optional[str]:
+        """Return the highest-priority section header matched by a stripped, lowercased line"""
+        if len(lowered) >= self.SECTION_MAX_LENGTH:
+            return None
+        
+        match = self.section_regex.search(lowered)
+        if not match:
+            return None
+        
+        section_name = match.lastgroup
+        for candidate in self.section_names:
+            if candidate == section_name:
+                break
+            if self.section_regexes[candidate].search(lowered):
+                return candidate
+        return section_name
+    
+    def is_degree(self, lowered: str) -> bool:
+        return self.degree_regex.search(lowered) is not None
+    
+    def is_job(self, lowered: str) -> bool:
+        return (
+            self.JOB_MIN_LENGTH < len(lowered) < self.JOB_MAX_LENGTH
+            and self.job_regex.search(lowered) is not None
+        )
+
+_LINE_CLASSIFIER = LineClassifier()
+
+class ResumeLineConsumer:
+    """Single-pass consumer that builds sections, education and experience line by line.
+    
+    Raw lines are only kept with keep_lines=True (for raw_text), so streaming
+    callers such as iter_sections hold one section at a time, not the document.
+    """
+    
+    def __init__(self, classifier: Optional[LineClassifier] = None, keep_lines: bool = False):
+        self.classifier = classifier or _LINE_CLASSIFIER
+        self.lines: Optional[List[str]] = [] if keep_lines else None
+        self.line_count = 0
+        self.sections: Dict[str, str] = {}
+        self.education: List[str] = []
+        self.experience: List[str] = []
+        self._current_section: Optional[str] = None
+        self._section_content: List[str] = []
+    
+    def feed(self, line: str) -> Optional[Tuple[str, str]]:
+        """Consume one raw line; returns a (name, content) section when one is completed"""
+        self.line_count += 1
+        if self.lines is not None:
+            self.lines.append(line)
+        stripped = line.strip()
+        if not stripped:
+            return None
+        
+        lowered = stripped.lower()
+        classifier = self.classifier
+        
+        if classifier.is_degree(lowered):
+            self.education.append(stripped)
+        
+        if classifier.is_job(lowered):
+            self.experience.append(stripped)
+        
+        # Check if line is a section header
+        section_name = classifier.section_for(lowered)
+        if section_name:
+            completed = self._close_section()
+            self._current_section = section_name
+            return completed
+        
+        if self._current_section:
+            self._section_content.append(stripped)
+        return None
+    
+    def finish(self) -> Optional[Tuple[str, str]]:
+        """Flush the last open section"""
+        completed = self._close_section()
+        self._current_section = None
+        return completed
+    
+    def _close_section(self) -> Optional[Tuple[str, str]]:
+        completed = None
+        if self._current_section and self._section_content:
+            completed = (self._current_section, '\n'.join(self._section_content))
+            self.sections[self._current_section] = completed[1]
+        self._section_content = []
+        return completed
+    
+    @property
+    def text(self) -> str:
+        """Full document text, identical to DocumentParser.parse_document"""
+        if self.lines is None:
+            raise ValueError("ResumeLineConsumer was created without keep_lines")
+        return '\n'.join(self.lines).strip()
 
 class ResumeParser:
     """Specialized parser for resume analysis"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[ParseCache] = None, pdf_workers: int = 1,
+                 skills_matcher: Optional[SkillsMatcher] = None):
         self.document_parser = DocumentParser()
+        self.cache = cache
+        self.pdf_workers = pdf_workers
+        self.skills_matcher = skills_matcher or get_default_skills_matcher()
     
+    @traced("parser.parse_resume")
     def parse_resume(self, file_path: str) -> Dict[str, Any]:
         """Parse resume and extract structured information"""
-        text = self.document_parser.parse_document(file_path)
+        if self.cache is None:
+            return self._parse_resume_uncached(file_path)
+        
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        # The skills taxonomy is part of the parser, so editing it invalidates cached parses too
+        parser_version = f"{PARSER_VERSION}.{self.skills_matcher.fingerprint[:16]}"
+        cache_key = self.cache.make_key(file_path, parser_version)
+        with span("parse_cache.get") as cache_span:
+            parsed_data = self.cache.get(cache_key)
+            cache_span.set_attribute("hit", parsed_data is not None)
+        if parsed_data is None:
+            parsed_data = self._parse_resume_uncached(file_path)
+            self.cache.put(cache_key, parsed_data)
+        
+        return parsed_data
+    
+    def _parse_resume_uncached(self, file_path: str) -> Dict[str, Any]:
+        """Stream the document once through every line-based extraction pass"""
+        # Page extraction is streamed into the pass, so its spans nest under this one; sections,
+        # education and experience are all built here, one line at a time
+        with span("parser.line_pass") as pass_span:
+            consumer = self._consume(self.document_parser.iter_lines(file_path, pdf_workers=self.pdf_workers))
+            self._describe_pass(pass_span, consumer)
+        text = consumer.text
         
         # Basic information extraction using regex patterns
         parsed_data = {
             'raw_text': text,
-            'sections': self._extract_sections(text),
+            'sections': consumer.sections,
             'contact_info': self._extract_contact_info(text),
-            'skills': self._extract_skills(text),
-            'education': self._extract_education(text),
-            'experience': self._extract_experience(text)
+            'skills': self._extract_skills(text, consumer.sections.get('skills')),
+            'education': consumer.education,
+            'experience': consumer.experience
         }
         
         return parsed_data
     
-    def _extract_sections(self, text: str) -> Dict[str, str]:
-        """Extract different sections from resume"""
-        sections = {}
-        
-        # Common section headers
-        section_patterns = {
-            'summary': r'(?i)(summary|profile|objective|about)',
-            'experience': r'(?i)(experience|employment|work history|professional experience)',
-            'education': r'(?i)(education|academic|qualifications)',
-            'skills': r'(?i)(skills|competencies|technical skills|expertise)',
-            'projects': r'(?i)(projects|portfolio)',
-            'certifications': r'(?i)(certifications|certificates|licenses)',
-            'achievements': r'(?i)(achievements|awards|honors|accomplishments)'
-        }
-        
-        lines = text.split('\n')
-        current_section = None
-        section_content = []
-        
+    def iter_sections(self, file_path: str) -> Iterator[Tuple[str, str]]:
+        """Yield (section_name, content) pairs as soon as each section is complete"""
+        consumer = ResumeLineConsumer()
+        # Not made current: the caller's work between sections must not nest under it
+        pass_span = tracer.start_span("parser.iter_sections")
+        try:
+            for line in self.document_parser.iter_lines(file_path, pdf_workers=self.pdf_workers):
+                completed = consumer.feed(line)
+                if completed:
+                    yield completed
+            
+            completed = consumer.finish()
+            if completed:
+                yield completed
+        finally:
+            self._describe_pass(pass_span, consumer)
+            tracer.end_span(pass_span)
+    
+    @staticmethod
+    def _describe_pass(pass_span, consumer: ResumeLineConsumer) -> None:
+        pass_span.set_attribute("lines", consumer.line_count)
+        pass_span.set_attribute("sections", len(consumer.sections))
+        pass_span.set_attribute("education", len(consumer.education))
+        pass_span.set_attribute("experience", len(consumer.experience))
+    
+    @staticmethod
+    def _consume(lines: Iterable[str]) -> ResumeLineConsumer:
+        consumer = ResumeLineConsumer(keep_lines=True)
         for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Check if line is a section header
-            for section_name, pattern in section_patterns.items():
-                if re.search(pattern, line) and len(line) < 50:
-                    if current_section and section_content:
-                        sections[current_section] = '\n'.join(section_content)
-                    current_section = section_name
-                    section_content = []
-                    break
-            else:
-                if current_section:
-                    section_content.append(line)
-        
-        # Add the last section
-        if current_section and section_content:
-            sections[current_section] = '\n'.join(section_content)
-        
-        return sections
+            consumer.feed(line)
+        consumer.finish()
+        return consumer
     
+    @traced("parser.extract_contact_info")
     def _extract_contact_info(self, text: str) -> Dict[str, str]:
         """Extract contact information"""
         contact_info = {}
@@ -147,64 +528,33 @@ class ResumeParser:
         
         return contact_info
     
-    def _extract_skills(self, text: str) -> list:
-        """Extract skills from resume"""
-        # This is a basic implementation - in practice, you'd use NLP or a skills database
-        common_skills = [
-            'Python', 'Java', 'JavaScript', 'C++', 'C#', 'SQL', 'HTML', 'CSS',
-            'React', 'Angular', 'Vue', 'Node.js', 'Django', 'Flask', 'Spring',
-            'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Git', 'Linux',
-            'Machine Learning', 'Data Science', 'AI', 'Deep Learning',
-            'Project Management', 'Agile', 'Scrum', 'Leadership', 'Communication'
-        ]
-        
-        found_skills = []
-        text_upper = text.upper()
-        
-        for skill in common_skills:
-            if skill.upper() in text_upper:
-                found_skills.append(skill)
-        
-        return found_skills
+    @traced("parser.extract_skills")
+    def _extract_skills(self, text: str, skills_section: Optional[str] = None) -> list:
+        """Extract skills from resume using the skills taxonomy"""
+        return self.skills_matcher.find_skills(text, skills_section)
+
+def create_resume_parser() -> ResumeParser:
+    """Create a resume parser with the configured parse cache, PDF workers and skills taxonomy.
     
-    def _extract_education(self, text: str) -> list:
-        """Extract education information"""
-        education = []
-        
-        # Degree patterns
-        degree_patterns = [
-            r'(?i)(bachelor|b\.?s\.?|b\.?a\.?|bs|ba)',
-            r'(?i)(master|m\.?s\.?|m\.?a\.?|ms|ma|mba)',
-            r'(?i)(phd|ph\.?d\.?|doctorate|doctoral)',
-            r'(?i)(associate|a\.?s\.?|as)'
-        ]
-        
-        lines = text.split('\n')
-        for line in lines:
-            for pattern in degree_patterns:
-                if re.search(pattern, line):
-                    education.append(line.strip())
-                    break
-        
-        return education
+    Lives here rather than in career_agent so LLM-free commands (score, match)
+    do not import the provider stack.
+    """
+    from config import get_config
     
-    def _extract_experience(self, text: str) -> list:
-        """Extract work experience"""
-        experience = []
-        
-        # Look for job titles and company patterns
-        job_patterns = [
-            r'(?i)(engineer|developer|manager|analyst|director|consultant|specialist)',
-            r'(?i)(software|senior|junior|lead|principal|staff)'
-        ]
-        
-        lines = text.split('\n')
-        for line in lines:
-            line = line.strip()
-            if len(line) > 10 and len(line) < 100:  # Reasonable length for job titles
-                for pattern in job_patterns:
-                    if re.search(pattern, line):
-                        experience.append(line)
-                        break
-        
-        return experience
\ No newline at end of file
+    config = get_config()
+    cache = None
+    if config.parse_cache_enabled:
+        cache = ParseCache(
+            os.path.join(config.cache_dir, "parsed"),
+            max_entries=config.parse_cache_max_entries,
+            max_bytes=config.parse_cache_max_bytes
+        )
+    
+    return ResumeParser(
+        cache=cache,
+        pdf_workers=config.pdf_workers,
+        skills_matcher=SkillsMatcher.from_file(
+            config.skills_taxonomy_path,
+            cache_dir=os.path.join(config.cache_dir, "skills")
+        )
+    )
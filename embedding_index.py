@@ -0,0 +1,241 @@
+import os
+import re
+import json
+import zlib
+import unicodedata
+import hashlib
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
+# Bump when the on-disk index layout changes so stale indexes are rebuilt
+INDEX_FORMAT_VERSION = "1"
+
+# Indexes at least this large are searched through IVF lists instead of a full scan
+IVF_MIN_VECTORS = 4096
+
+_WORD_RE = re.compile(r'[a-z0-9][a-z0-9+#]*')
+
+class Embedder:
+    """Maps texts to L2-normalized float32 vectors"""
+    
+    name = "base"
+    dim = 0
+    
+    def embed(self, texts: List[str]) -> np.ndarray:
+        raise NotImplementedError
+
+class HashingEmbedder(Embedder):
+    """Deterministic signed feature hashing of words and word pairs.
+
+    Needs no model download, so it is the offline default and gives stable
+    vectors for tests.
+    """
+    
+    def __init__(self, dim: int = 1024):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+    
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            # NFKC folds PDF ligatures such as "ﬁ" back into plain letters
+            words = _WORD_RE.findall(unicodedata.normalize('NFKC', text).lower())
+            for term in words + [f"{a} {b}" for a, b in zip(words, words[1:])]:
+                digest = zlib.crc32(term.encode('utf-8'))
+                # The top bit picks the sign so collisions tend to cancel out
+                vectors[row, digest % self.dim] += 1.0 if digest & 0x80000000 else -1.0
+        return _normalize(vectors)
+
+class SentenceTransformerEmbedder(Embedder):
+    """Local sentence-transformers model (optional dependency)"""
+    
+    def __init__(self, model_name: str):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ImportError(
+                "sentence-transformers is not installed; install it or set EMBEDDING_MODEL=hashing"
+            )
+        
+        self.model = SentenceTransformer(model_name)
+        self.dim = self.model.get_sentence_embedding_dimension()
+        self.name = f"st-{model_name.replace('/', '_')}"
+    
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = self.model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
+        return _normalize(vectors.astype(np.float32))
+
+def get_embedder(model: str = "hashing") -> Embedder:
+    """Create an embedder from a spec: "hashing", "hashing:<dim>" or "sentence-transformers:<model>" """
+    kind, _, argument = model.partition(':')
+    if kind == "hashing":
+        return HashingEmbedder(int(argument) if argument else 1024)
+    elif kind == "sentence-transformers":
+        return SentenceTransformerEmbedder(argument or "all-MiniLM-L6-v2")
+    else:
+        raise ValueError(f"Unsupported embedding model: {model}")
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+def _kmeans(vectors: np.ndarray, clusters: int, iterations: int = 10, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """Spherical k-means; returns (centroids, assignment per vector)"""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), clusters, replace=False)].copy()
+    for _ in range(iterations):
+        assignments = np.argmax(vectors @ centroids.T, axis=1)
+        for cluster in range(clusters):
+            members = vectors[assignments == cluster]
+            if len(members):
+                centroids[cluster] = members.sum(axis=0)
+        centroids = _normalize(centroids)
+    return centroids, np.argmax(vectors @ centroids.T, axis=1)
+
+class VectorIndex:
+    """On-disk vector index: memory-mapped .npy arrays with flat or IVF search.
+
+    Layout under the index directory: vectors.npy (float32, one row per item),
+    meta.json (texts and embedder), and for IVF indexes centroids.npy plus
+    list_ids.npy/list_offsets.npy holding item ids grouped by centroid.
+    """
+    
+    def __init__(self, path: str, vectors: np.ndarray, texts: List[str], embedder_name: str,
+                 centroids: Optional[np.ndarray] = None, list_ids: Optional[np.ndarray] = None,
+                 list_offsets: Optional[np.ndarray] = None):
+        self.path = path
+        self.vectors = vectors
+        self.texts = texts
+        self.embedder_name = embedder_name
+        self.centroids = centroids
+        self.list_ids = list_ids
+        self.list_offsets = list_offsets
+    
+    @classmethod
+    def build(cls, path: str, texts: List[str], embedder: Embedder, ivf: Optional[bool] = None) -> "VectorIndex":
+        """Embed texts and write the index to path"""
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        
+        vectors = embedder.embed(texts) if texts else np.zeros((0, embedder.dim), dtype=np.float32)
+        arrays = {"vectors": vectors}
+        if ivf if ivf is not None else len(texts) >= IVF_MIN_VECTORS:
+            centroids, assignments = _kmeans(vectors, max(1, int(np.sqrt(len(texts)))))
+            order = np.argsort(assignments, kind='stable')
+            arrays["centroids"] = centroids
+            arrays["list_ids"] = order.astype(np.int64)
+            arrays["list_offsets"] = np.concatenate([[0], np.cumsum(np.bincount(assignments, minlength=len(centroids)))])
+        
+        # Temporary names are unique per thread so concurrent builds of one index cannot collide
+        suffix = f"{os.getpid()}.{threading.get_ident()}"
+        for name, array in arrays.items():
+            tmp_path = directory / f"{name}.{suffix}.tmp.npy"
+            np.save(tmp_path, array)
+            os.replace(tmp_path, directory / f"{name}.npy")
+        
+        # meta.json is written last, so an index without it is incomplete
+        meta = {"version": INDEX_FORMAT_VERSION, "embedder": embedder.name, "texts": texts}
+        tmp_path = directory / f"meta.{suffix}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_path, directory / "meta.json")
+        
+        return cls.load(path)
+    
+    @classmethod
+    def load(cls, path: str) -> "VectorIndex":
+        """Open an index with its arrays memory-mapped read-only"""
+        directory = Path(path)
+        with open(directory / "meta.json", 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get("version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Index format {meta.get('version')} is not supported")
+        
+        def open_array(name: str) -> Optional[np.ndarray]:
+            array_path = directory / f"{name}.npy"
+            return np.load(array_path, mmap_mode='r') if array_path.exists() else None
+        
+        return cls(
+            path,
+            open_array("vectors"),
+            meta["texts"],
+            meta["embedder"],
+            centroids=open_array("centroids"),
+            list_ids=open_array("list_ids"),
+            list_offsets=open_array("list_offsets")
+        )
+    
+    @classmethod
+    def load_or_build(cls, path: str, texts: List[str], embedder: Embedder) -> "VectorIndex":
+        """Reuse the index at path if it holds the same texts and embedder, otherwise rebuild it"""
+        try:
+            index = cls.load(path)
+            if index.texts == texts and index.embedder_name == embedder.name:
+                return index
+        except (OSError, ValueError, KeyError):
+            pass
+        return cls.build(path, texts, embedder)
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    def search(self, queries: np.ndarray, k: int = 5, nprobe: int = 8) -> List[List[Tuple[int, float]]]:
+        """Top-k (item id, cosine similarity) per query vector, best first"""
+        queries = np.atleast_2d(queries)
+        if len(self) == 0:
+            return [[] for _ in queries]
+        
+        results = []
+        for query in queries:
+            if self.centroids is not None:
+                probes = np.argsort(-(self.centroids @ query))[:nprobe]
+                candidates = np.concatenate([
+                    self.list_ids[self.list_offsets[probe]:self.list_offsets[probe + 1]] for probe in probes
+                ])
+            else:
+                candidates = np.arange(len(self))
+            
+            scores = self.vectors[candidates] @ query
+            top = np.argsort(-scores, kind='stable')[:k]
+            results.append([(int(candidates[i]), float(scores[i])) for i in top])
+        return results
+
+def chunk_text(text: str, min_length: int = 25) -> List[str]:
+    """Split text into line or sentence chunks worth matching, without duplicates"""
+    chunks = []
+    for line in text.splitlines():
+        for sentence in re.split(r'(?<=[.!?])\s+(?=[A-Z])', line):
+            sentence = sentence.strip(' \t-•*·')
+            if len(sentence) >= min_length:
+                chunks.append(sentence)
+    return list(dict.fromkeys(chunks))
+
+def index_path(cache_dir: str, texts: List[str], embedder: Embedder) -> str:
+    """Cache location for an index over texts"""
+    digest = hashlib.sha256('\n'.join(texts).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{embedder.name}-{digest}")
+
+def load_resume_index(cache_dir: str, resume_text: str, embedder: Embedder) -> VectorIndex:
+    """Index of a resume's lines, cached on disk under cache_dir"""
+    bullets = chunk_text(resume_text)
+    return VectorIndex.load_or_build(index_path(cache_dir, bullets, embedder), bullets, embedder)
+
+def top_relevant(index: VectorIndex, embedder: Embedder, query_texts: List[str], k: int = 8) -> List[Dict[str, Any]]:
+    """Items most relevant to any of the query texts, best first.
+
+    Each item is scored by its best match among the queries, so a bullet that
+    answers one requirement of a job posting ranks as highly as it should.
+    """
+    if not query_texts or len(index) == 0:
+        return []
+    
+    best: Dict[int, float] = {}
+    for matches in index.search(embedder.embed(query_texts), k=k):
+        for item, score in matches:
+            best[item] = max(score, best.get(item, -1.0))
+    
+    ranked = sorted(best.items(), key=lambda item: (-item[1], item[0]))[:k]
+    return [{"text": index.texts[item], "score": score} for item, score in ranked]
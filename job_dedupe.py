@@ -0,0 +1,152 @@
+import re
+import zlib
+from typing import List, Optional, Set, Tuple, TYPE_CHECKING
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from batch_runner import JobRow
+
+# Signature length; split into bands of rows for locality-sensitive hashing
+NUM_PERMUTATIONS = 128
+NUM_BANDS = 32
+
+# Largest prime below 2^32, so (a * x + b) stays within uint64 for 32-bit hashes
+_PRIME = np.uint64(4294967291)
+
+# Shingles hashed per chunk, bounding memory at NUM_PERMUTATIONS x this many uint64s
+_CHUNK_SHINGLES = 1 << 16
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+# Query parameters that track the referrer rather than identify the page
+_TRACKING_PARAMS = re.compile(r'^(utm_\w+|ref|source|gh_src|lever-source)$', re.IGNORECASE)
+
+def normalize_url(url: str) -> str:
+    """Scheme-less, lowercase host URL without www, tracking parameters, fragment or trailing slash"""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query) if not _TRACKING_PARAMS.match(k)])
+    normalized = host + parts.path.rstrip('/')
+    return f"{normalized}?{query}" if query else normalized
+
+def shingles(text: str, urls: Optional[List[str]] = None, size: int = 3) -> Set[str]:
+    """Word shingles of text plus URL features.
+
+    Besides each normalized URL, its parent path is included so a URL cut off
+    mid-segment (as in the HN queue) still overlaps with the full one.
+    """
+    words = _WORD_RE.findall(text.lower())
+    features = {' '.join(words[i:i + size]) for i in range(max(len(words) - size + 1, 1))} if words else set()
+    
+    for url in urls or []:
+        normalized = normalize_url(url)
+        if not normalized:
+            continue
+        features.add(f"url:{normalized}")
+        parent, _, _ = normalized.partition('?')[0].rpartition('/')
+        if parent.count('/') >= 2:
+            features.add(f"url:{parent}/")
+    
+    return features
+
+class MinHasher:
+    """MinHash signatures computed with NumPy over universal hash permutations"""
+    
+    def __init__(self, num_permutations: int = NUM_PERMUTATIONS, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_permutations = num_permutations
+        self.a = rng.integers(1, int(_PRIME), size=num_permutations, dtype=np.uint64)
+        self.b = rng.integers(0, int(_PRIME), size=num_permutations, dtype=np.uint64)
+    
+    def signatures(self, documents: List[Set[str]]) -> np.ndarray:
+        """One signature row per document; empty documents get all-max rows"""
+        signatures = np.full((len(documents), self.num_permutations), np.iinfo(np.uint64).max, dtype=np.uint64)
+        
+        start = 0
+        while start < len(documents):
+            # Gather a chunk of documents' shingle hashes into one flat array
+            hashes = []
+            owners = []
+            stop = start
+            while stop < len(documents) and (not hashes or len(hashes) + len(documents[stop]) <= _CHUNK_SHINGLES):
+                hashes.extend(zlib.crc32(shingle.encode('utf-8')) for shingle in documents[stop])
+                owners.extend([stop] * len(documents[stop]))
+                stop += 1
+            
+            if hashes:
+                values = np.array(hashes, dtype=np.uint64)
+                permuted = (self.a[:, None] * values[None, :] + self.b[:, None]) % _PRIME
+                owners = np.array(owners)
+                # Documents are contiguous in the chunk, so reduce each run of columns
+                doc_ids, offsets = np.unique(owners, return_index=True)
+                signatures[doc_ids] = np.minimum.reduceat(permuted, offsets, axis=1).T
+            start = stop
+        
+        return signatures
+
+def _find(parents: List[int], node: int) -> int:
+    while parents[node] != node:
+        parents[node] = parents[parents[node]]
+        node = parents[node]
+    return node
+
+def cluster_near_duplicates(texts: List[str], urls: Optional[List[List[str]]] = None,
+                            threshold: float = 0.5, num_bands: int = NUM_BANDS) -> List[List[int]]:
+    """Group documents whose estimated Jaccard similarity reaches threshold.
+
+    LSH banding proposes candidate pairs in roughly linear time; each candidate
+    is confirmed against its signature estimate. Clusters are lists of indexes
+    in input order, ordered by their first member.
+    """
+    documents = [shingles(text, urls[i] if urls else None) for i, text in enumerate(texts)]
+    signatures = MinHasher().signatures(documents)
+    rows_per_band = signatures.shape[1] // num_bands
+    
+    parents = list(range(len(documents)))
+    for band in range(num_bands):
+        band_values = np.ascontiguousarray(signatures[:, band * rows_per_band:(band + 1) * rows_per_band])
+        keys = band_values.view(np.dtype((np.void, band_values.dtype.itemsize * rows_per_band))).ravel()
+        _, bucket_ids, bucket_sizes = np.unique(keys, return_inverse=True, return_counts=True)
+        if bucket_sizes.max(initial=0) < 2:
+            continue
+        
+        # Documents grouped by bucket, in input order within each bucket
+        ordered = np.argsort(bucket_ids.ravel(), kind='stable')
+        bucket_ends = np.cumsum(bucket_sizes)
+        for bucket in np.flatnonzero(bucket_sizes > 1):
+            members = ordered[bucket_ends[bucket] - bucket_sizes[bucket]:bucket_ends[bucket]]
+            # Check each member against the bucket's first document only, keeping the
+            # work linear in the bucket size; other bands catch the pairs this skips
+            first = members[0]
+            if not documents[first]:
+                continue
+            for other in members[1:]:
+                if _find(parents, first) == _find(parents, other):
+                    continue
+                if np.mean(signatures[first] == signatures[other]) >= threshold:
+                    parents[_find(parents, other)] = _find(parents, first)
+    
+    clusters = {}
+    for index in range(len(documents)):
+        clusters.setdefault(_find(parents, index), []).append(index)
+    return sorted(clusters.values(), key=lambda members: members[0])
+
+def dedupe_job_rows(rows: List["JobRow"], threshold: float = 0.5) -> Tuple[List["JobRow"], List[List["JobRow"]]]:
+    """Keep the first row of each near-duplicate cluster.
+
+    Rows are compared on company, role, posting text and links; the user's own
+    notes are left out since they differ even when the job is the same.
+    Returns the kept rows and the clusters that had more than one row.
+    """
+    clusters = cluster_near_duplicates(
+        [f"{row.company} {row.role} {row.text}" for row in rows],
+        [row.urls for row in rows],
+        threshold=threshold
+    )
+    kept = [rows[members[0]] for members in clusters]
+    duplicates = [[rows[index] for index in members] for members in clusters if len(members) > 1]
+    return kept, duplicates
@@ -0,0 +1,43 @@
+import csv
+import json
+import hashlib
+from typing import Dict, Iterator, Set, Tuple
+
+def record_identity(record: Dict[str, str]) -> Tuple[str, str, str]:
+    """(key, company, role) of a job search CSV record (tracker, target queue or HN queue).
+
+    The key is the HN post id, else the tracker's job link, else "company|role".
+    """
+    company = (record.get('company') or '').strip()
+    text = (record.get('text') or '').strip()
+    if not company and text:
+        # HN "Who is hiring" posts lead with "Company | Role | Location"
+        company = text.split('|', 1)[0].strip()
+    role = (record.get('role') or '').strip()
+    
+    key = (record.get('id') or record.get('job_link') or f"{company}|{role}").strip()
+    return key, company, role
+
+def unique_key(key: str, record: Dict[str, str], seen_keys: Set[str]) -> str:
+    """Make a repeated key unique within a file and record it in seen_keys.
+
+    Repeats get a suffix from the row's contents rather than its position, so
+    keys stay put when rows are added or removed above them.
+    """
+    if key in seen_keys:
+        digest = hashlib.sha1(json.dumps(record, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()[:10]
+        base = f"{key}#{digest}"
+        key, copy = base, 1
+        while key in seen_keys:
+            copy += 1
+            key = f"{base}-{copy}"
+    seen_keys.add(key)
+    return key
+
+def read_job_records(csv_path: str) -> Iterator[Tuple[str, str, str, Dict[str, str]]]:
+    """Yield (key, company, role, record) per CSV row, with keys made unique within the file"""
+    seen_keys = set()
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        for record in csv.DictReader(f):
+            key, company, role = record_identity(record)
+            yield unique_key(key, record, seen_keys), company, role, record
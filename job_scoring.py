@@ -0,0 +1,181 @@
+import re
+import csv
+import zlib
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
+from job_queue import read_job_records
+
+# Hashed feature space; large enough that collisions between real terms are rare
+N_FEATURES = 2 ** 20
+
+# Columns that hold free text about a posting, across the job search CSV formats
+TEXT_COLUMNS = ['role', 'text', 'fit_reason', 'next_action', 'notes']
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in', 'is', 'it',
+    'of', 'on', 'or', 'our', 'that', 'the', 'this', 'to', 'we', 'will', 'with', 'you', 'your'
+}
+
+_TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#]*')
+_URL_RE = re.compile(r'https?://[^\s;,)"\'<>]+')
+_SALARY_RE = re.compile(
+    r'[$€£]\s*(\d[\d,]*(?:\.\d+)?)\s*([km])?'
+    r'(?:\s*(?:-|–|—|to)\s*[$€£]?\s*(\d[\d,]*(?:\.\d+)?)\s*([km])?)?'
+    r'(\s*(?:/\s*(?:hr|hour|h)\b|(?:per|an|a)\s+hour\b|hourly\b))?',
+    re.IGNORECASE
+)
+
+# Hourly rates are annualized at 40 hours a week for 52 weeks
+HOURS_PER_YEAR = 2080
+
+@dataclass
+class Posting:
+    """One job posting prepared for scoring"""
+    key: str
+    company: str
+    text: str
+    salary_min: Optional[float] = None
+    salary_max: Optional[float] = None
+    urls: List[str] = field(default_factory=list)
+    record: Dict[str, str] = field(default_factory=dict)
+    score: float = 0.0
+
+def _salary_value(number: str, suffix: Optional[str], hourly: bool = False) -> Optional[float]:
+    value = float(number.replace(',', ''))
+    if hourly:
+        return value * HOURS_PER_YEAR
+    if suffix:
+        return value * (1_000_000 if suffix.lower() == 'm' else 1_000)
+    if value >= 1_000:
+        return value
+    # Postings often write "$130-180" meaning thousands; small bare numbers are hourly rates or noise
+    return value * 1_000 if value >= 20 else None
+
+def parse_salary(text: str) -> Optional[Tuple[float, float]]:
+    """Widest (min, max) annual salary across every range in text; hourly rates are annualized"""
+    bounds = []
+    for low, low_suffix, high, high_suffix, hourly in _SALARY_RE.findall(text):
+        # "$150-180K": the suffix on the upper bound applies to both
+        low_value = _salary_value(low, low_suffix or high_suffix or None, bool(hourly))
+        high_value = _salary_value(high, high_suffix or low_suffix or None, bool(hourly)) if high else low_value
+        if low_value and high_value:
+            bounds.append((min(low_value, high_value), max(low_value, high_value)))
+    
+    if not bounds:
+        return None
+    return min(low for low, _ in bounds), max(high for _, high in bounds)
+
+def parse_urls(text: str) -> List[str]:
+    """URLs in text, in order, without duplicates"""
+    return list(dict.fromkeys(url.rstrip('.') for url in _URL_RE.findall(text)))
+
+def load_postings(csv_path: str) -> List[Posting]:
+    """Read a job search CSV (HN queue, target queue or tracker) into Postings"""
+    postings = []
+    for key, company, _, record in read_job_records(csv_path):
+        text = '\n'.join((record.get(column) or '').strip() for column in TEXT_COLUMNS if record.get(column))
+        salary = parse_salary(record.get('salary') or '') or parse_salary(text)
+        url_fields = ' '.join(record.get(column) or '' for column in ('urls', 'job_link', 'url'))
+        
+        postings.append(Posting(
+            key=key,
+            company=company or "Unknown company",
+            text=text,
+            salary_min=salary[0] if salary else None,
+            salary_max=salary[1] if salary else None,
+            urls=parse_urls(url_fields.replace(';', ' ') + ' ' + text),
+            record=dict(record)
+        ))
+    
+    return postings
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word unigrams and bigrams, without stopwords"""
+    words = [word for word in _TOKEN_RE.findall(text.lower()) if word not in STOPWORDS]
+    return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+class HashedTfidf:
+    """TF-IDF over hashed terms, kept in coordinate form so a whole corpus is scored in one pass"""
+    
+    def __init__(self, n_features: int = N_FEATURES):
+        self.n_features = n_features
+        self._feature_cache: Dict[str, int] = {}
+    
+    def _features(self, text: str) -> List[int]:
+        cache = self._feature_cache
+        features = []
+        for term in tokenize(text):
+            feature = cache.get(term)
+            if feature is None:
+                feature = zlib.crc32(term.encode('utf-8')) % self.n_features
+                cache[term] = feature
+            features.append(feature)
+        return features
+    
+    def score(self, documents: List[str], queries: List[str]) -> np.ndarray:
+        """Cosine similarity of each document's TF-IDF vector to the combined query.
+
+        Each query string is tokenized separately, so no bigrams span two of them.
+        """
+        n_docs = len(documents)
+        if n_docs == 0:
+            return np.zeros(0)
+        
+        doc_features = [self._features(text) for text in documents]
+        rows = np.repeat(np.arange(n_docs, dtype=np.int64), [len(features) for features in doc_features])
+        cols = np.fromiter((f for features in doc_features for f in features), dtype=np.int64, count=len(rows))
+        
+        # Term counts per (document, feature) pair
+        pairs, counts = np.unique(rows * self.n_features + cols, return_counts=True)
+        pair_rows = pairs // self.n_features
+        pair_cols = pairs % self.n_features
+        
+        document_frequency = np.bincount(pair_cols, minlength=self.n_features)
+        idf = np.log((1 + n_docs) / (1 + document_frequency)) + 1
+        weights = (1 + np.log(counts)) * idf[pair_cols]
+        norms = np.sqrt(np.bincount(pair_rows, weights=weights * weights, minlength=n_docs))
+        
+        query_vector = np.zeros(self.n_features)
+        query_terms = np.array([f for query in queries for f in self._features(query)], dtype=np.int64)
+        query_features, query_counts = np.unique(query_terms, return_counts=True)
+        query_vector[query_features] = (1 + np.log(query_counts)) * idf[query_features]
+        query_norm = np.linalg.norm(query_vector)
+        if query_norm == 0:
+            return np.zeros(n_docs)
+        
+        dots = np.bincount(pair_rows, weights=weights * query_vector[pair_cols], minlength=n_docs)
+        return dots / (np.maximum(norms, 1e-12) * query_norm)
+
+def score_postings(postings: List[Posting], skills: List[str], min_salary: Optional[float] = None) -> List[Posting]:
+    """Score postings 0-100 by relevance to the resume skills and return them best first.
+
+    Postings whose stated salary tops out below min_salary score half as much.
+    """
+    relevance = HashedTfidf().score([posting.text for posting in postings], skills)
+    if len(relevance) and relevance.max() > 0:
+        relevance = relevance / relevance.max()
+    
+    if min_salary:
+        salary_max = np.array([posting.salary_max or np.inf for posting in postings])
+        relevance = np.where(salary_max < min_salary, relevance * 0.5, relevance)
+    
+    for posting, score in zip(postings, relevance):
+        posting.score = round(float(score) * 100, 1)
+    
+    order = np.argsort(-relevance, kind='stable')
+    return [postings[index] for index in order]
+
+def write_ranked_csv(postings: List[Posting], csv_path: str) -> None:
+    """Write postings in their original CSV columns, with the computed score in the score column"""
+    columns = list(postings[0].record.keys()) if postings else []
+    if 'score' not in columns:
+        columns.insert(0, 'score')
+    
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        for posting in postings:
+            writer.writerow({**posting.record, 'score': f"{posting.score:g}"})
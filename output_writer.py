@@ -0,0 +1,119 @@
+import os
+import json
+import time
+import atexit
+import hashlib
+import threading
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Iterable, Union, List, Dict, Any
+
+def save_output_file(output_dir: str, content: Union[str, Iterable[str]], filename: str) -> str:
+    """Save output to a timestamped file; an iterable of chunks is written to disk as each chunk arrives"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_path = os.path.join(output_dir, f"{timestamp}_{filename}")
+    
+    with open(output_path, 'w', encoding='utf-8') as f:
+        if isinstance(content, str):
+            f.write(content)
+        else:
+            for chunk in content:
+                f.write(chunk)
+                f.flush()
+    
+    return output_path
+
+def inputs_hash(messages: List[Dict[str, Any]]) -> str:
+    """Stable hash of a request's messages, for grouping records of the same prompt"""
+    payload = json.dumps(messages, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class JsonlLog:
+    """Append-only JSONL file that buffers records and writes them in batches.
+
+    Records are flushed once max_buffered of them are waiting, by a
+    background timer every flush_interval seconds, and at exit. The file
+    stays open, so bulk runs cost one write per batch rather than one file
+    per response. Callers that must not lose a record (e.g. before marking
+    it done in a checkpoint) call sync().
+    """
+    
+    def __init__(self, path: str, flush_interval: float = 5.0, max_buffered: int = 100):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self._buffer: List[str] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+        
+        self._closed = threading.Event()
+        if flush_interval > 0:
+            threading.Thread(target=self._flush_periodically, name="jsonl-log-flush", daemon=True).start()
+    
+    def append(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= self.max_buffered:
+                self._flush_locked()
+    
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            with self._lock:
+                if time.monotonic() - self._last_flush >= self.flush_interval:
+                    self._flush_locked()
+    
+    def _flush_locked(self) -> None:
+        if self._buffer and not self._file.closed:
+            self._file.write(''.join(self._buffer))
+            self._file.flush()
+            self._buffer.clear()
+        self._last_flush = time.monotonic()
+    
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+    
+    def sync(self) -> None:
+        """Flush buffered records and fsync, so they survive a crash"""
+        with self._lock:
+            self._flush_locked()
+            if not self._file.closed:
+                os.fsync(self._file.fileno())
+    
+    def close(self) -> None:
+        self._closed.set()
+        with self._lock:
+            self._flush_locked()
+            self._file.close()
+
+_logs: Dict[str, JsonlLog] = {}
+_logs_lock = threading.Lock()
+
+def get_jsonl_log(path: str, flush_interval: float = 5.0, max_buffered: int = 100) -> JsonlLog:
+    """Shared log for a path, so every agent in the process appends through one buffer"""
+    path = os.path.abspath(path)
+    with _logs_lock:
+        log = _logs.get(path)
+        if log is None:
+            log = _logs[path] = JsonlLog(path, flush_interval, max_buffered)
+        return log
+
+@atexit.register
+def _close_logs() -> None:
+    with _logs_lock:
+        for log in _logs.values():
+            log.close()
+        _logs.clear()
+
+# Extra fields (e.g. the batch row) added to records written from the current thread or task
+_record_labels: ContextVar[Dict[str, Any]] = ContextVar("record_labels", default={})
+
+def set_record_labels(**labels: Any) -> None:
+    _record_labels.set(labels)
+
+def get_record_labels() -> Dict[str, Any]:
+    return _record_labels.get()
@@ -0,0 +1,80 @@
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+class ParseCache:
+    """On-disk cache of parsed resumes keyed by file content hash and parser version"""
+    
+    def __init__(self, cache_dir: str, max_entries: int = 64, max_bytes: int = 50 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    @staticmethod
+    def file_digest(file_path: str) -> str:
+        """Hash file contents in fixed-size blocks"""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def make_key(self, file_path: str, parser_version: str) -> str:
+        """Build the cache key for a file; changes whenever the content or parser changes"""
+        return f"{parser_version}-{self.file_digest(file_path)}"
+    
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached parse for a key, or None on a miss"""
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        # Touch the entry so eviction is least-recently-used rather than oldest-written
+        try:
+            os.utime(entry_path, None)
+        except OSError:
+            pass
+        return data
+    
+    def put(self, key: str, data: Dict[str, Any]) -> None:
+        """Store a parse result and evict old entries if the cache is over budget"""
+        entry_path = self._entry_path(key)
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, entry_path)
+        
+        self._evict()
+    
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        for entry_path in self.cache_dir.glob("*.json"):
+            entry_path.unlink(missing_ok=True)
+    
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until both size limits are satisfied"""
+        entries = []
+        for entry_path in self.cache_dir.glob("*.json"):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+        
+        entries.sort(key=lambda entry: entry[0])
+        total_bytes = sum(size for _, size, _ in entries)
+        
+        while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+            _, size, entry_path = entries.pop(0)
+            entry_path.unlink(missing_ok=True)
+            total_bytes -= size
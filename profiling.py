@@ -0,0 +1,141 @@
+import os
+import sys
+import time
+import cProfile
+import pstats
+import threading
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional
+
+# cpu: deterministic cProfile (pstats file); sample: periodic stack samples of
+# every thread (collapsed stacks); memory: tracemalloc allocation snapshot
+PROFILE_MODES = ['cpu', 'sample', 'memory']
+
+# Rows shown in the printed summary
+PROFILE_TOP = 20
+
+class _StackSampler:
+    """Background thread recording the stack of every other thread at a fixed interval.
+
+    Samples are wall-clock, so threads blocked on the network show up too;
+    the counts are written as collapsed stacks ("outer;inner;leaf count")
+    that flamegraph.pl, speedscope and similar viewers read directly.
+    """
+    
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+    
+    def start(self) -> None:
+        self._thread.start()
+    
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+    
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self.counts[";".join(reversed(stack))] += 1
+
+class CommandProfiler:
+    """Profiles one CLI command in one of PROFILE_MODES and saves the result to a file"""
+    
+    def __init__(self, mode: str, sample_interval: float = 0.005):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unsupported profile mode: {mode}")
+        self.mode = mode
+        self.sample_interval = sample_interval
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[_StackSampler] = None
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._peak_bytes = 0
+        self._started = 0.0
+        self.elapsed = 0.0
+    
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        if self.mode == 'cpu':
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        elif self.mode == 'sample':
+            self._sampler = _StackSampler(self.sample_interval)
+            self._sampler.start()
+        else:
+            # The summary groups by allocating line, so one frame per trace is enough and keeps it fast
+            tracemalloc.start(1)
+    
+    def stop(self) -> None:
+        if self.mode == 'cpu':
+            self._profile.disable()
+        elif self.mode == 'sample':
+            self._sampler.stop()
+        else:
+            self._snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")
+            ])
+            self._peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        self.elapsed = time.perf_counter() - self._started
+    
+    def save(self, output_dir: str, command: str) -> str:
+        """Write the profile under output_dir and return its path"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        extension = {'cpu': 'prof', 'sample': 'collapsed.txt', 'memory': 'tracemalloc'}[self.mode]
+        path = os.path.join(output_dir, f"profile_{command}_{timestamp}.{extension}")
+        os.makedirs(output_dir, exist_ok=True)
+        
+        if self.mode == 'cpu':
+            self._profile.dump_stats(path)
+        elif self.mode == 'sample':
+            with open(path, 'w', encoding='utf-8') as f:
+                for stack, count in self._sampler.counts.most_common():
+                    f.write(f"{stack} {count}\n")
+        else:
+            self._snapshot.dump(path)
+        return path
+    
+    def summary_lines(self, top: int = PROFILE_TOP) -> List[str]:
+        """Short text report of the hottest functions or the top allocating lines"""
+        if self.mode == 'cpu':
+            stats = pstats.Stats(self._profile)
+            rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:top]
+            lines = [f"{'cumulative ms':>14}{'own ms':>10}{'calls':>9}  function"]
+            for (filename, line, function), (_, calls, own, cumulative, _) in rows:
+                location = f"{os.path.basename(filename)}:{line}" if line else filename
+                lines.append(f"{cumulative * 1000:>14.1f}{own * 1000:>10.1f}{calls:>9}  {function} ({location})")
+            return lines
+        
+        if self.mode == 'sample':
+            # Leaf frames: where the samples actually landed
+            leaves: Counter = Counter()
+            for stack, count in self._sampler.counts.items():
+                leaves[stack.rsplit(";", 1)[-1]] += count
+            total = sum(leaves.values()) or 1
+            lines = [f"{'samples':>9}{'share':>8}  function ({total:,} samples every {self.sample_interval * 1000:g} ms)"]
+            for frame, count in leaves.most_common(top):
+                lines.append(f"{count:>9,}{count / total:>8.1%}  {frame}")
+            return lines
+        
+        stats = self._snapshot.statistics('lineno')
+        total = sum(stat.size for stat in stats)
+        lines = [f"peak traced {self._peak_bytes / 1024 / 1024:.1f} MB, "
+                 f"{total / 1024 / 1024:.1f} MB still allocated at exit"]
+        lines.append(f"{'KiB':>10}{'blocks':>9}  allocated at")
+        for stat in stats[:top]:
+            frame = stat.traceback[0]
+            lines.append(f"{stat.size / 1024:>10.1f}{stat.count:>9,}  {frame.filename}:{frame.lineno}")
+        return lines
@@ -0,0 +1,255 @@
+import time
+import random
+import asyncio
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Callable, Awaitable, Iterable, Iterator, Optional, Tuple, TypeVar
+
+from config import get_config
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying: rate limited, overloaded or transient server errors
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+# Statuses that mean the provider is pushing back on load, which shrinks concurrency
+THROTTLE_STATUS_CODES = {429, 529}
+
+RETRYABLE_ERROR_NAMES = {"APIConnectionError", "APITimeoutError"}
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at a per-minute rate"""
+    
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity or per_minute
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, amount: float) -> float:
+        """Take amount from the bucket and return how long to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            
+            # Requests larger than the bucket are allowed once it is full rather than never
+            amount = min(amount, self.capacity)
+            self.tokens -= amount
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+class AdaptiveConcurrency:
+    """AIMD concurrency limit: grows by one per window of successes, halves on throttling"""
+    
+    def __init__(self, initial: int, minimum: int = 1, maximum: int = 64, cooldown: float = 5.0):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+    
+    def try_acquire(self) -> bool:
+        with self._condition:
+            if self.in_flight < int(self.limit):
+                self.in_flight += 1
+                return True
+            return False
+    
+    def acquire(self) -> None:
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+    
+    async def aacquire(self) -> None:
+        # The limit is shared across threads and event loops, so poll instead of awaiting a loop-bound primitive
+        while not self.try_acquire():
+            await asyncio.sleep(0.05)
+    
+    def release(self, throttled: bool = False) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if throttled:
+                # Several in-flight requests usually hit the same throttle; only back off once per cooldown
+                if now - self._last_decrease >= self.cooldown:
+                    self.limit = max(self.minimum, self.limit / 2)
+                    self._last_decrease = now
+            else:
+                self.limit = min(self.maximum, self.limit + 1 / max(self.limit, 1.0))
+            self._condition.notify_all()
+
+def _status_code(error: Exception) -> Optional[int]:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+def is_retryable(error: Exception) -> bool:
+    return _status_code(error) in RETRYABLE_STATUS_CODES or type(error).__name__ in RETRYABLE_ERROR_NAMES
+
+def is_throttled(error: Exception) -> bool:
+    return _status_code(error) in THROTTLE_STATUS_CODES
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read retry-after-ms / retry-after from an SDK error's response headers"""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms:
+            return float(retry_after_ms) / 1000
+        
+        retry_after = headers.get("retry-after")
+        if not retry_after:
+            return None
+        try:
+            return float(retry_after)
+        except ValueError:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class RateLimiter:
+    """Client-side limits for one provider and model: requests/min, tokens/min and adaptive concurrency"""
+    
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0,
+                 max_concurrency: int = 8, min_concurrency: int = 1, max_retries: int = 5,
+                 backoff_base: float = 1.0, backoff_max: float = 60.0):
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self.concurrency = AdaptiveConcurrency(max_concurrency, minimum=min_concurrency, maximum=max_concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+    
+    def _admission_delay(self, estimated_tokens: int) -> float:
+        delay = 0.0
+        if self.request_bucket:
+            delay = max(delay, self.request_bucket.reserve(1))
+        if self.token_bucket:
+            delay = max(delay, self.token_bucket.reserve(estimated_tokens))
+        return delay
+    
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        # Full jitter exponential backoff
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+    
+    def call(self, func: Callable[[], T], estimated_tokens: int = 0) -> T:
+        """Run a blocking provider call under the limits, retrying retryable failures"""
+        attempt = 0
+        while True:
+            delay = self._admission_delay(estimated_tokens)
+            if delay:
+                time.sleep(delay)
+            
+            self.concurrency.acquire()
+            throttled = False
+            try:
+                return func()
+            except Exception as e:
+                throttled = is_throttled(e)
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+                wait = self._backoff(attempt, e)
+            finally:
+                self.concurrency.release(throttled)
+            
+            time.sleep(wait)
+            attempt += 1
+    
+    def stream(self, open_stream: Callable[[], Iterable[T]], estimated_tokens: int = 0) -> Iterator[T]:
+        """Open a stream under the limits and yield its items.
+
+        The concurrency slot is held until the stream is consumed, fails or is
+        closed, so streaming requests count against the limit for their whole
+        length. Retries cover opening the stream; a stream that fails midway is
+        not replayed.
+        """
+        attempt = 0
+        while True:
+            delay = self._admission_delay(estimated_tokens)
+            if delay:
+                time.sleep(delay)
+            
+            self.concurrency.acquire()
+            try:
+                stream = open_stream()
+                break
+            except Exception as e:
+                self.concurrency.release(is_throttled(e))
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+                wait = self._backoff(attempt, e)
+            
+            time.sleep(wait)
+            attempt += 1
+        
+        throttled = False
+        try:
+            yield from stream
+        except Exception as e:
+            throttled = is_throttled(e)
+            raise
+        finally:
+            self.concurrency.release(throttled)
+    
+    async def acall(self, func: Callable[[], Awaitable[T]], estimated_tokens: int = 0) -> T:
+        """Async variant of call"""
+        attempt = 0
+        while True:
+            delay = self._admission_delay(estimated_tokens)
+            if delay:
+                await asyncio.sleep(delay)
+            
+            await self.concurrency.aacquire()
+            throttled = False
+            try:
+                return await func()
+            except Exception as e:
+                throttled = is_throttled(e)
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+                wait = self._backoff(attempt, e)
+            finally:
+                self.concurrency.release(throttled)
+            
+            await asyncio.sleep(wait)
+            attempt += 1
+
+def estimate_request_tokens(messages: Any, max_tokens: int) -> int:
+    """Rough token cost of a request for the tokens/min bucket (about 4 characters per token)"""
+    prompt_chars = sum(len(str(msg.get("content", ""))) for msg in messages)
+    return prompt_chars // 4 + max_tokens
+
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+def get_rate_limiter(provider: str, model: str) -> RateLimiter:
+    """Get the shared limiter for a provider and model, configured from AgentConfig"""
+    with _limiters_lock:
+        limiter = _limiters.get((provider, model))
+        if limiter is None:
+            config = get_config()
+            limiter = RateLimiter(
+                requests_per_minute=config.rate_limit_requests_per_minute,
+                tokens_per_minute=config.rate_limit_tokens_per_minute,
+                max_concurrency=config.max_concurrency,
+                min_concurrency=config.min_concurrency,
+                max_retries=config.max_retries,
+                backoff_base=config.retry_backoff_base,
+                backoff_max=config.retry_backoff_max
+            )
+            _limiters[(provider, model)] = limiter
+        return limiter
@@ -0,0 +1,164 @@
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator
+
+from ai_providers import AIProvider
+from config import get_config
+
+def normalize_messages(messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Collapse whitespace so prompts that differ only in formatting share a cache entry"""
+    return [
+        {"role": msg["role"], "content": " ".join(str(msg["content"]).split())}
+        for msg in messages
+    ]
+
+class ResponseCache:
+    """SQLite-backed LLM response cache with TTL and size-based eviction"""
+    
+    def __init__(self, db_path: str, ttl_seconds: float = 7 * 24 * 3600, max_entries: int = 1000):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " provider TEXT NOT NULL,"
+            " model TEXT NOT NULL,"
+            " response TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses (accessed_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_created_at ON responses (created_at)")
+        self._conn.commit()
+    
+    @staticmethod
+    def make_key(provider: str, model: str, temperature: float, max_tokens: int,
+                 messages: List[Dict[str, str]]) -> str:
+        """Hash everything that determines a completion"""
+        payload = json.dumps({
+            "provider": provider,
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "messages": normalize_messages(messages)
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            response, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            return response
+    
+    def put(self, key: str, provider: str, model: str, response: str) -> None:
+        """Store a response, then drop expired and least-recently-used entries"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, provider, model, response, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, provider, model, response, now, now)
+            )
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+    
+    def clear(self) -> None:
+        """Remove every cached response"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+class CachedProvider(AIProvider):
+    """Wraps an AI provider and serves repeated requests from a ResponseCache"""
+    
+    def __init__(self, provider: AIProvider, cache: ResponseCache):
+        self.provider = provider
+        self.cache = cache
+    
+    def __getattr__(self, name: str) -> Any:
+        # Expose the wrapped provider's attributes (model, client, ...)
+        return getattr(self.provider, name)
+    
+    def _cache_key(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        config = get_config()
+        return self.cache.make_key(
+            self.provider.name,
+            self.provider.model,
+            kwargs.get('temperature', config.temperature),
+            kwargs.get('max_tokens', config.max_tokens),
+            messages
+        )
+    
+    def _store(self, key: str, response: str) -> None:
+        self.cache.put(key, self.provider.name, self.provider.model, response)
+    
+    def generate_response(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        key = self._cache_key(messages, **kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        response = self.provider.generate_response(messages, **kwargs)
+        self._store(key, response)
+        return response
+    
+    async def agenerate_response(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        key = self._cache_key(messages, **kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        response = await self.provider.agenerate_response(messages, **kwargs)
+        self._store(key, response)
+        return response
+    
+    async def aclose(self) -> None:
+        await self.provider.aclose()
+    
+    def stream_response(self, messages: List[Dict[str, str]], **kwargs) -> Iterator[str]:
+        key = self._cache_key(messages, **kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+        
+        chunks = []
+        for chunk in self.provider.stream_response(messages, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        
+        # Only complete streams are cached
+        self._store(key, "".join(chunks))
@@ -0,0 +1,220 @@
+import os
+import re
+import pickle
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Bundled taxonomy used when no external skills dictionary is configured
+DEFAULT_TAXONOMY_PATH = str(Path(__file__).parent / "skills_taxonomy.txt")
+
+# Bump when the automaton layout changes so serialized automatons are rebuilt
+AUTOMATON_FORMAT_VERSION = "2"
+
+# Marks a taxonomy name that is also an ordinary word (Rust, Spring, Communication)
+AMBIGUOUS_PREFIX = "~"
+
+# Labelled lines that list skills ("Skills: ...", "Tech stack: ..."), matched from a line start
+SKILLS_LABEL_RE = re.compile(
+    r'[^\S\n]*[\w /&+-]{0,40}?\b(skills|technologies|tech stack|tools|languages|frameworks|competencies)\b[^:\n]{0,20}:',
+    re.IGNORECASE
+)
+
+def load_taxonomy(file_path: str) -> List[Tuple[str, List[str]]]:
+    """Load a skills taxonomy file.
+
+    One skill per line: the canonical name followed by optional aliases, separated
+    by '|'. Blank lines and lines starting with '#' are ignored. Names keep their
+    AMBIGUOUS_PREFIX, which SkillsMatcher.build interprets.
+    """
+    taxonomy = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            names = [name.strip() for name in line.split('|') if name.strip()]
+            taxonomy.append((names[0], names[1:]))
+    
+    return taxonomy
+
+class AhoCorasick:
+    """Aho-Corasick automaton over lowercased patterns"""
+    
+    def __init__(self, patterns: List[Tuple[str, int]]):
+        # Node 0 is the root; each node has a goto table, a failure link and its outputs
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.outputs: List[List[Tuple[int, int]]] = [[]]
+        
+        for pattern, value in patterns:
+            self._add(pattern, value)
+        self._build_failure_links()
+    
+    def _add(self, pattern: str, value: int) -> None:
+        node = 0
+        for char in pattern:
+            next_node = self.goto[node].get(char)
+            if next_node is None:
+                next_node = len(self.goto)
+                self.goto[node][char] = next_node
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+            node = next_node
+        self.outputs[node].append((len(pattern), value))
+    
+    def _build_failure_links(self) -> None:
+        queue = list(self.goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                self.outputs[child].extend(self.outputs[self.fail[child]])
+    
+    def iter_matches(self, text: str):
+        """Yield (start, end, value) for every pattern occurrence in text"""
+        goto = self.goto
+        fail = self.fail
+        outputs = self.outputs
+        node = 0
+        
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length, value in outputs[node]:
+                yield index - length + 1, index + 1, value
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+def _starts_sentence(text: str, start: int) -> bool:
+    index = start - 1
+    while index >= 0 and text[index].isspace():
+        index -= 1
+    return index < 0 or text[index] in '.!?'
+
+def _in_skills_label_line(text: str, start: int) -> bool:
+    line_start = text.rfind('\n', 0, start) + 1
+    label = SKILLS_LABEL_RE.match(text, line_start)
+    return label is not None and label.end() <= start
+
+class SkillsMatcher:
+    """Matches a skills taxonomy against text in time linear in the text length"""
+    
+    def __init__(self, skills: List[str], pattern_skills: List[int], exact_names: List[Optional[str]],
+                 automaton: AhoCorasick, fingerprint: str):
+        self.skills = skills
+        # Per automaton pattern: the skill it names, and for ambiguous names the exact spelling
+        self.pattern_skills = pattern_skills
+        self.exact_names = exact_names
+        self.automaton = automaton
+        self.fingerprint = fingerprint
+    
+    @classmethod
+    def build(cls, taxonomy: List[Tuple[str, List[str]]], fingerprint: str = "") -> "SkillsMatcher":
+        """Build the automaton from (canonical, aliases) entries"""
+        skills = []
+        pattern_skills = []
+        exact_names = []
+        patterns = []
+        for index, (canonical, aliases) in enumerate(taxonomy):
+            skills.append(canonical.lstrip(AMBIGUOUS_PREFIX))
+            seen = set()
+            for name in [canonical, *aliases]:
+                ambiguous = name.startswith(AMBIGUOUS_PREFIX)
+                name = name.lstrip(AMBIGUOUS_PREFIX)
+                if name.lower() in seen:
+                    continue
+                seen.add(name.lower())
+                patterns.append((name.lower(), len(pattern_skills)))
+                pattern_skills.append(index)
+                exact_names.append(name if ambiguous else None)
+        
+        return cls(skills, pattern_skills, exact_names, AhoCorasick(patterns), fingerprint)
+    
+    @classmethod
+    def from_file(cls, file_path: Optional[str] = None, cache_dir: Optional[str] = None) -> "SkillsMatcher":
+        """Load a taxonomy file, reusing a serialized automaton from cache_dir when present"""
+        file_path = file_path or DEFAULT_TAXONOMY_PATH
+        with open(file_path, 'rb') as f:
+            fingerprint = hashlib.sha256(f.read()).hexdigest()
+        
+        cache_path = None
+        if cache_dir:
+            cache_path = Path(cache_dir) / f"{AUTOMATON_FORMAT_VERSION}-{fingerprint}.pickle"
+            try:
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+                pass
+        
+        matcher = cls.build(load_taxonomy(file_path), fingerprint)
+        
+        if cache_path:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(matcher, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        
+        return matcher
+    
+    def find_skills(self, text: str, skills_section: Optional[str] = None) -> List[str]:
+        """Return canonical skills found in text, in taxonomy order.
+
+        A match only counts when it is not embedded in a longer word, so "AI" does
+        not match "email" and "Git" does not match "digital". Ambiguous names
+        match in any case inside skills_section and "Skills: ..." lines, and
+        elsewhere only as spelled in the taxonomy and not at a sentence start.
+        """
+        found = set()
+        self._collect(text, found, skills_list=False)
+        if skills_section:
+            self._collect(skills_section, found, skills_list=True)
+        
+        return [self.skills[index] for index in sorted(found)]
+    
+    def _collect(self, text: str, found: set, skills_list: bool) -> None:
+        lowered = text.lower()
+        text_length = len(lowered)
+        
+        for start, end, pattern in self.automaton.iter_matches(lowered):
+            skill = self.pattern_skills[pattern]
+            if skill in found:
+                continue
+            if start > 0 and _is_word_char(lowered[start - 1]) and _is_word_char(lowered[start]):
+                continue
+            if end < text_length and _is_word_char(lowered[end]) and _is_word_char(lowered[end - 1]):
+                continue
+            
+            exact = self.exact_names[pattern]
+            if exact is not None and not skills_list:
+                # Lowercasing a few non-ASCII characters changes their length, so offsets would not map back
+                if text_length != len(text):
+                    continue
+                if not _in_skills_label_line(text, start) and (
+                        text[start:end] != exact or _starts_sentence(text, start)):
+                    continue
+            found.add(skill)
+
+_default_matcher: Optional[SkillsMatcher] = None
+
+def get_default_skills_matcher() -> SkillsMatcher:
+    """Get the matcher for the bundled taxonomy, built once per process and cached under the configured cache dir"""
+    global _default_matcher
+    if _default_matcher is None:
+        from config import get_config
+        
+        cache_dir = os.path.join(get_config().cache_dir, "skills")
+        _default_matcher = SkillsMatcher.from_file(DEFAULT_TAXONOMY_PATH, cache_dir=cache_dir)
+    return _default_matcher
@@ -0,0 +1,73 @@
+import asyncio
+from types import SimpleNamespace
+
+from ai_providers import AnthropicProvider, LocalProvider, PooledAsyncClientMixin
+
+RESUME = {"role": "system", "content": "RESUME CONTENT:\n" + "Built data pipelines. " * 50, "cache": True}
+
+class FakeClient:
+    def __init__(self):
+        self.closed = False
+    
+    async def close(self):
+        self.closed = True
+
+class FakeProvider(PooledAsyncClientMixin):
+    def __init__(self):
+        self._init_async_clients()
+    
+    def _create_async_client(self):
+        return FakeClient()
+
+def test_aclose_closes_the_running_loops_client():
+    provider = FakeProvider()
+    
+    async def use_and_close():
+        client = provider.async_client
+        assert provider.async_client is client
+        await provider.aclose()
+        return client
+    
+    first = asyncio.run(use_and_close())
+    second = asyncio.run(use_and_close())
+    
+    assert first.closed and second.closed
+    assert first is not second
+    assert len(provider._async_clients) == 0
+
+def test_local_provider_reports_cache_write_then_hits_for_a_shared_prefix():
+    provider = LocalProvider()
+    first = provider._usage([RESUME, {"role": "user", "content": "Analyze my resume"}], 10)
+    second = provider._usage([RESUME, {"role": "user", "content": "Write a cover letter"}], 10)
+    
+    prefix_tokens = len(RESUME["content"]) // 4
+    assert (first.cache_write_tokens, first.cached_tokens) == (prefix_tokens, 0)
+    assert (second.cache_write_tokens, second.cached_tokens) == (0, prefix_tokens)
+    assert second.cached_tokens <= second.input_tokens
+
+def test_local_provider_ignores_unmarked_prefixes():
+    provider = LocalProvider()
+    messages = [dict(RESUME, cache=False), {"role": "user", "content": "Analyze my resume"}]
+    provider._usage(messages, 10)
+    
+    assert provider._usage(messages, 10).cached_tokens == 0
+
+def test_anthropic_cache_marker_becomes_a_cache_control_breakpoint():
+    provider = AnthropicProvider(api_key="test-key")
+    params = provider._request_params([
+        RESUME,
+        {"role": "system", "content": "You are a career coach."},
+        {"role": "user", "content": "Analyze my resume"}
+    ])
+    
+    assert params["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in params["system"][1]
+    assert params["messages"] == [{"role": "user", "content": "Analyze my resume"}]
+
+def test_anthropic_usage_counts_cache_reads_and_writes_as_input():
+    usage = AnthropicProvider._usage(SimpleNamespace(
+        input_tokens=20, output_tokens=5, cache_read_input_tokens=300, cache_creation_input_tokens=0
+    ))
+    
+    assert usage.input_tokens == 320
+    assert usage.cached_tokens == 300
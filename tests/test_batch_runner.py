@@ -0,0 +1,73 @@
+import asyncio
+
+from batch_runner import BatchCheckpoint, BatchRunner, JobRow, load_job_queue
+
+class FakeProvider:
+    async def aclose(self):
+        pass
+
+class FakeAgent:
+    """Stands in for CareerAgent: answers instantly and can fail chosen companies"""
+    
+    def __init__(self, failing=()):
+        self.resume_data = {"skills": []}
+        self.output_log = None
+        self.ai_provider = FakeProvider()
+        self.failing = set(failing)
+        self.calls = []
+    
+    async def _answer(self, task, company):
+        self.calls.append((task, company))
+        if company in self.failing:
+            raise RuntimeError(f"{company} failed")
+        return f"{task} for {company}"
+    
+    async def aoptimize_resume_for_job(self, job_description):
+        return await self._answer("optimize", job_description)
+    
+    async def agenerate_cover_letter(self, job_description, company_name):
+        return await self._answer("cover_letter", company_name)
+
+ROWS = [JobRow(key=f"row-{name}", company=name, role="Engineer", job_description=name) for name in ("Acme", "Globex")]
+
+def test_run_writes_outputs_and_checkpoints_them(tmp_path):
+    runner = BatchRunner(FakeAgent(), str(tmp_path))
+    
+    stats = asyncio.run(runner.run(ROWS, ["optimize", "cover_letter"]))
+    
+    assert stats == {"completed": 4, "skipped": 0, "failed": 0}
+    assert runner.output_path(ROWS[0], "cover_letter").read_text(encoding="utf-8") == "cover_letter for Acme"
+    assert BatchCheckpoint(str(tmp_path / "checkpoint.jsonl")).completed == {
+        (row.key, task) for row in ROWS for task in ("optimize", "cover_letter")
+    }
+
+def test_resumed_run_skips_completed_work_and_retries_failures(tmp_path):
+    first = FakeAgent(failing={"Globex"})
+    stats = asyncio.run(BatchRunner(first, str(tmp_path)).run(ROWS, ["cover_letter"]))
+    assert stats == {"completed": 1, "skipped": 0, "failed": 1}
+    
+    second = FakeAgent()
+    stats = asyncio.run(BatchRunner(second, str(tmp_path)).run(ROWS, ["cover_letter"]))
+    
+    assert stats == {"completed": 1, "skipped": 1, "failed": 0}
+    assert second.calls == [("cover_letter", "Globex")]
+
+def test_checkpoint_ignores_a_truncated_last_line(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    path.write_text('{"key": "row-Acme", "task": "optimize", "output_path": "a.md"}\n{"key": "row-Glo', encoding="utf-8")
+    
+    assert BatchCheckpoint(str(path)).completed == {("row-Acme", "optimize")}
+
+def test_load_job_queue_reads_hn_posts(tmp_path):
+    queue = tmp_path / "queue.csv"
+    queue.write_text(
+        "score,id,created_at,author,emails,salary,urls,text\n"
+        "9,101,2024-01-01,pg,,$150k,https://acme.example/jobs,Acme | Data Engineer | Remote\n",
+        encoding="utf-8"
+    )
+    
+    [row] = load_job_queue(str(queue))
+    
+    assert (row.key, row.company) == ("101", "Acme")
+    assert row.urls == ["https://acme.example/jobs"]
+    assert "Salary: $150k" in row.job_description
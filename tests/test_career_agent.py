@@ -0,0 +1,60 @@
+import pytest
+
+import config
+from career_agent import CareerAgent
+
+JOB = "Senior Data Engineer\nBuild data pipelines in Python and SQL on AWS.\n"
+
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    resume = tmp_path / "resume.txt"
+    resume.write_text(
+        "Jane Doe\njane@example.com\nSkills\nPython, SQL, AWS\nExperience\n"
+        + "".join(f"- Led project {i} on internal tooling and reporting dashboards\n" for i in range(40))
+        + "- Built Python and SQL data pipelines on AWS\n",
+        encoding="utf-8"
+    )
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("RESUME_PATH", str(resume))
+    monkeypatch.setattr(config, "_config", None)
+    
+    def create(**settings):
+        for name, value in settings.items():
+            monkeypatch.setenv(name.upper(), str(value))
+        config._config = None
+        created = CareerAgent("local", use_cache=False)
+        created.load_resume()
+        return created
+    
+    yield create
+    config._config = None
+
+def test_optimize_prompt_keeps_the_full_resume_by_default(agent):
+    messages = agent()._optimization_messages(JOB)
+    
+    assert messages[0].get("cache")
+    assert "RESUME CONTENT:" in messages[0]["content"]
+
+def test_optimize_prompt_sends_only_matched_bullets_when_opted_in(agent):
+    default = agent()._optimization_messages(JOB)
+    bullets_only = agent(embedding_bullets_only=True, embedding_top_k=3)._optimization_messages(JOB)
+    
+    assert "MOST RELEVANT RESUME LINES:" in bullets_only[0]["content"]
+    assert "Built Python and SQL data pipelines on AWS" in bullets_only[0]["content"]
+    assert not bullets_only[0].get("cache")
+    assert len(bullets_only[0]["content"]) < len(default[0]["content"])
+
+def test_resume_context_is_an_identical_cacheable_prefix_across_tasks(agent):
+    career_agent = agent()
+    task_messages = [
+        career_agent._analysis_messages(),
+        career_agent._optimization_messages(JOB),
+        career_agent._cover_letter_messages(JOB, "Acme"),
+        career_agent._interview_prep_messages(JOB),
+        career_agent._skills_improvement_messages("Data Engineer")
+    ]
+    
+    prefixes = {messages[0]["content"] for messages in task_messages}
+    assert len(prefixes) == 1
+    assert all(messages[0].get("cache") for messages in task_messages)
+    assert all("Acme" not in messages[0]["content"] for messages in task_messages)
@@ -0,0 +1,108 @@
+import json
+
+import pytest
+
+from ai_providers import AIProvider
+from cassette import Cassette, CassetteMissError, CassetteProvider
+from token_budget import TokenBudget
+
+MESSAGES = [{"role": "system", "content": "You are a career coach."}, {"role": "user", "content": "Review my resume."}]
+
+class EchoProvider(AIProvider):
+    name = "anthropic"
+    model = "claude-3-sonnet-20240229"
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def generate_response(self, messages, **kwargs):
+        self.calls += 1
+        return f"response {self.calls}"
+    
+    def stream_response(self, messages, **kwargs):
+        response = self.generate_response(messages, **kwargs)
+        yield response[:4]
+        yield response[4:]
+
+def reopened(cassette):
+    cassette.close()
+    return Cassette(cassette.path)
+
+def test_replay_reports_the_recording_model(tmp_path):
+    path = str(tmp_path / "cassette.jsonl")
+    recorder = Cassette(path)
+    CassetteProvider(recorder, EchoProvider(), mode="record").generate_response(MESSAGES)
+    recorder.close()
+    
+    replay = CassetteProvider(Cassette(path), mode="replay")
+    
+    assert (replay.name, replay.model) == ("anthropic", "claude-3-sonnet-20240229")
+    budget = TokenBudget(replay.model, 4000)
+    assert budget.prompt_budget == TokenBudget(EchoProvider.model, 4000).prompt_budget
+
+def test_replays_a_recorded_response_without_the_provider(tmp_path):
+    recorder = Cassette(str(tmp_path / "cassette.jsonl"))
+    assert CassetteProvider(recorder, EchoProvider(), mode="record").generate_response(MESSAGES) == "response 1"
+    
+    replay = CassetteProvider(reopened(recorder), mode="replay")
+    # Whitespace-only prompt changes still hit
+    reformatted = [dict(msg, content=f"  {msg['content']}\n") for msg in MESSAGES]
+    
+    assert replay.generate_response(reformatted) == "response 1"
+    assert (replay.hits, replay.misses) == (1, 0)
+
+def test_replay_miss_raises(tmp_path):
+    replay = CassetteProvider(Cassette(str(tmp_path / "cassette.jsonl")), mode="replay")
+    
+    with pytest.raises(CassetteMissError):
+        replay.generate_response(MESSAGES)
+    with pytest.raises(CassetteMissError):
+        replay.generate_response(MESSAGES, max_tokens=10)
+    assert replay.misses == 2
+
+def test_auto_mode_records_misses_and_replays_hits(tmp_path):
+    provider = EchoProvider()
+    auto = CassetteProvider(Cassette(str(tmp_path / "cassette.jsonl")), provider, mode="auto")
+    
+    assert auto.generate_response(MESSAGES) == "response 1"
+    assert auto.generate_response(MESSAGES) == "response 1"
+    assert "".join(auto.stream_response(MESSAGES, temperature=0.0)) == "response 2"
+    assert "".join(auto.stream_response(MESSAGES, temperature=0.0)) == "response 2"
+    assert provider.calls == 2
+    assert (auto.hits, auto.misses) == (2, 2)
+
+def test_latest_recording_wins_after_reopening(tmp_path):
+    recorder = Cassette(str(tmp_path / "cassette.jsonl"))
+    record = CassetteProvider(recorder, EchoProvider(), mode="record")
+    record.generate_response(MESSAGES)
+    record.generate_response(MESSAGES)
+    
+    cassette = reopened(recorder)
+    
+    assert len(cassette) == 1
+    assert CassetteProvider(cassette, mode="replay").generate_response(MESSAGES) == "response 2"
+
+def test_message_contents_are_stored_once_and_restored(tmp_path):
+    recorder = Cassette(str(tmp_path / "cassette.jsonl"))
+    record = CassetteProvider(recorder, EchoProvider(), mode="record")
+    record.generate_response(MESSAGES)
+    record.generate_response(MESSAGES[:1] + [{"role": "user", "content": "Write a cover letter."}])
+    
+    cassette = reopened(recorder)
+    with open(cassette.path, encoding='utf-8') as f:
+        lines = [json.loads(line) for line in f]
+    
+    assert sum(1 for line in lines if line.get("content") == MESSAGES[0]["content"]) == 1
+    entry = cassette.get(record._key(MESSAGES))
+    assert cassette.messages(entry) == MESSAGES
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    recorder = Cassette(str(tmp_path / "cassette.jsonl"))
+    CassetteProvider(recorder, EchoProvider(), mode="record").generate_response(MESSAGES)
+    recorder.close()
+    with open(recorder.path, "a", encoding='utf-8') as f:
+        f.write('{"key": "abc", "resp')
+    
+    replay = CassetteProvider(Cassette(recorder.path), mode="replay")
+    
+    assert replay.generate_response(MESSAGES) == "response 1"
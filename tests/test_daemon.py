@@ -0,0 +1,75 @@
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+import config
+from ai_providers import AIProviderFactory
+from daemon import CareerAgentDaemon, DaemonClient
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "output"))
+    monkeypatch.setenv("LOCAL_LATENCY_MS", "0")
+    monkeypatch.setenv("LOCAL_TOKENS_PER_SECOND", "0")
+    monkeypatch.setattr(config, "_config", None)
+    AIProviderFactory.reset()
+    yield CareerAgentDaemon(socket_path=str(tmp_path / "daemon.sock"), provider_name="local")
+    config._config = None
+    AIProviderFactory.reset()
+
+def test_get_agent_reuses_agent_for_unchanged_resume(daemon, tmp_path):
+    resume = tmp_path / "resume.txt"
+    resume.write_text("Jane Doe\njane@example.com\nSkills\nPython, SQL\n", encoding="utf-8")
+    
+    first = daemon.get_agent(None, True, str(resume))
+    second = daemon.get_agent(None, True, str(resume))
+    
+    assert first is second
+    assert "Python" in second.resume_data["skills"]
+
+def test_get_agent_reloads_edited_resume(daemon, tmp_path):
+    resume = tmp_path / "resume.txt"
+    resume.write_text("Jane Doe\njane@example.com\nSkills\nPython, SQL\n", encoding="utf-8")
+    agent = daemon.get_agent(None, True, str(resume))
+    
+    resume.write_text("Jane Doe\njane@example.com\nSkills\nKubernetes, Terraform, Golang\n", encoding="utf-8")
+    # Make sure the edit is visible even on filesystems with coarse timestamps
+    stat = resume.stat()
+    os.utime(resume, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    reloaded = daemon.get_agent(None, True, str(resume))
+    
+    assert reloaded is agent
+    assert "Kubernetes" in reloaded.resume_data["skills"]
+    assert "Python" not in reloaded.resume_data["skills"]
+
+def test_served_socket_is_owner_only_and_clients_get_savings(daemon, tmp_path, monkeypatch, capsys):
+    resume = tmp_path / "resume.txt"
+    resume.write_text("Jane Doe\njane@example.com\nSkills\nPython, SQL\n", encoding="utf-8")
+    monkeypatch.setenv("RESUME_PATH", str(resume))
+    monkeypatch.setenv("RESPONSE_CACHE_ENABLED", "false")
+    server = threading.Thread(target=daemon.serve_forever, daemon=True)
+    server.start()
+    client = DaemonClient(daemon.socket_path)
+    deadline = time.monotonic() + 30
+    while not client.is_running():
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.05)
+    
+    try:
+        assert stat.S_IMODE(os.stat(daemon.socket_path).st_mode) == 0o600
+        
+        job = "Build data pipelines in Python.\nWe are an equal opportunity employer."
+        client.run_task("optimize_resume_for_job", {"job_description": job})
+        assert "Trimmed job description" in capsys.readouterr().out
+        
+        chunks = client.run_task("optimize_resume_for_job", {"job_description": job}, stream=True)
+        assert "Trimmed job description" in capsys.readouterr().out
+        assert "".join(chunks)
+    finally:
+        client.shutdown()
+        server.join(timeout=10)
@@ -0,0 +1,65 @@
+import pytest
+
+from document_parser import DocumentParser, LineClassifier, ResumeLineConsumer, ResumeParser
+
+RESUME = """Jane Doe
+jane@example.com
+
+Summary
+Data engineer who ships reliable pipelines.
+
+Professional Experience
+Senior Data Engineer, Acme Corp
+Built Python and SQL pipelines on AWS.
+
+Education
+Bachelor of Science in Computer Science
+
+Technical Skills
+Python, SQL, AWS
+"""
+
+def test_line_classifier_picks_the_highest_priority_section():
+    classifier = LineClassifier()
+    
+    assert classifier.section_for("professional experience") == "experience"
+    assert classifier.section_for("technical skills") == "skills"
+    assert classifier.section_for("about me and my long list of interests outside work") is None
+    assert classifier.is_degree("bachelor of science in computer science")
+    assert classifier.is_job("senior data engineer, acme corp")
+    assert not classifier.is_job("engineer")
+
+def test_consumer_builds_sections_education_and_experience_in_one_pass():
+    consumer = ResumeLineConsumer(keep_lines=True)
+    completed = [section for section in map(consumer.feed, RESUME.splitlines()) if section]
+    completed.append(consumer.finish())
+    
+    assert [name for name, _ in completed] == ["summary", "experience", "education", "skills"]
+    assert consumer.sections["skills"] == "Python, SQL, AWS"
+    assert "Bachelor of Science in Computer Science" in consumer.education
+    assert "Senior Data Engineer, Acme Corp" in consumer.experience
+    assert consumer.text == RESUME.strip()
+    assert consumer.line_count == len(RESUME.splitlines())
+
+def test_consumer_without_kept_lines_has_no_text():
+    consumer = ResumeLineConsumer()
+    consumer.feed("Jane Doe")
+    
+    assert consumer.lines is None
+    with pytest.raises(ValueError):
+        consumer.text
+
+def test_iter_lines_matches_parse_document(tmp_path):
+    resume = tmp_path / "resume.txt"
+    resume.write_text(RESUME, encoding="utf-8")
+    
+    assert "\n".join(DocumentParser.iter_lines(str(resume))).strip() == DocumentParser.parse_document(str(resume))
+
+def test_iter_sections_yields_each_section_once_complete(tmp_path):
+    resume = tmp_path / "resume.txt"
+    resume.write_text(RESUME, encoding="utf-8")
+    
+    sections = dict(ResumeParser().iter_sections(str(resume)))
+    
+    assert sections["experience"] == "Senior Data Engineer, Acme Corp\nBuilt Python and SQL pipelines on AWS."
+    assert sections["education"] == "Bachelor of Science in Computer Science"
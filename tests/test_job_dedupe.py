@@ -0,0 +1,60 @@
+import numpy as np
+
+from batch_runner import JobRow
+from job_dedupe import MinHasher, cluster_near_duplicates, dedupe_job_rows, normalize_url, shingles
+
+POSTING = (
+    "Acme is hiring a senior data engineer to build streaming pipelines in Python and SQL. "
+    "You will own our Kafka ingestion, dbt models and Airflow scheduling, and mentor two engineers. "
+    "Remote within US time zones, competitive salary and equity."
+)
+
+def test_normalize_url_drops_tracking_and_cosmetic_differences():
+    assert normalize_url("https://www.Acme.com/jobs/123/?utm_source=hn&id=7#apply") == "acme.com/jobs/123?id=7"
+    assert normalize_url("http://acme.com/jobs/123") == "acme.com/jobs/123"
+
+def test_truncated_url_shares_a_parent_path_feature():
+    full = shingles("", ["https://boards.greenhouse.io/acme/jobs/4012345"])
+    truncated = shingles("", ["https://boards.greenhouse.io/acme/jobs/40"])
+    
+    assert full & truncated == {"url:boards.greenhouse.io/acme/jobs/"}
+
+def test_minhash_estimates_jaccard_similarity():
+    first = {f"shingle {i}" for i in range(200)}
+    second = {f"shingle {i}" for i in range(100, 300)}
+    signatures = MinHasher().signatures([first, second, first, set()])
+    
+    assert np.array_equal(signatures[0], signatures[2])
+    assert abs(np.mean(signatures[0] == signatures[1]) - 1 / 3) < 0.15
+    assert (signatures[3] == np.iinfo(np.uint64).max).all()
+
+def test_clusters_near_duplicates_and_keeps_distinct_postings_apart():
+    texts = [
+        POSTING,
+        "Globex is looking for a frontend developer with React and TypeScript experience to build dashboards.",
+        POSTING.replace("two engineers", "three engineers") + " Apply today.",
+        "",
+        ""
+    ]
+    
+    assert cluster_near_duplicates(texts) == [[0, 2], [1], [3], [4]]
+
+def test_tracking_parameters_do_not_split_the_same_link():
+    clusters = cluster_near_duplicates(
+        ["", "", ""],
+        [["https://acme.com/jobs/123?utm_source=hn"], ["https://www.acme.com/jobs/123/"], ["https://acme.com/jobs/456"]]
+    )
+    
+    assert clusters == [[0, 1], [2]]
+
+def test_dedupe_job_rows_keeps_the_first_of_each_cluster():
+    rows = [
+        JobRow(key="hn-1", company="Acme", role="Data Engineer", job_description="", text=POSTING),
+        JobRow(key="target-1", company="Globex", role="Frontend Developer", job_description="", text="React dashboards"),
+        JobRow(key="hn-2", company="Acme", role="Data Engineer", job_description="", text=POSTING + " Apply today.")
+    ]
+    
+    kept, duplicates = dedupe_job_rows(rows)
+    
+    assert [row.key for row in kept] == ["hn-1", "target-1"]
+    assert [[row.key for row in cluster] for cluster in duplicates] == [["hn-1", "hn-2"]]
@@ -0,0 +1,17 @@
+import pytest
+
+from job_scoring import parse_salary
+
+@pytest.mark.parametrize("text, expected", [
+    ("$45/hr", (93600.0, 93600.0)),
+    ("$60-80 per hour", (124800.0, 166400.0)),
+    ("$55 hourly", (114400.0, 114400.0)),
+    ("$150-180K", (150000.0, 180000.0)),
+    ("$130-180", (130000.0, 180000.0)),
+    ("$120,000 - $150,000", (120000.0, 150000.0)),
+])
+def test_parse_salary_annualizes_hourly_rates(text, expected):
+    assert parse_salary(text) == expected
+
+def test_parse_salary_without_amounts():
+    assert parse_salary("Competitive pay and equity") is None
@@ -0,0 +1,75 @@
+import json
+import time
+
+import output_writer
+from output_writer import JsonlLog, get_jsonl_log, inputs_hash, save_output_file
+
+def read_records(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+def test_appends_are_buffered_until_max_buffered(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    log = JsonlLog(str(path), flush_interval=0, max_buffered=3)
+    
+    log.append({"task": "analyze", "n": 1})
+    log.append({"task": "analyze", "n": 2})
+    assert read_records(path) == []
+    
+    log.append({"task": "analyze", "n": 3})
+    assert [record["n"] for record in read_records(path)] == [1, 2, 3]
+    log.close()
+
+def test_sync_and_close_write_pending_records(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    log = JsonlLog(str(path), flush_interval=0)
+    
+    log.append({"n": 1})
+    log.sync()
+    assert read_records(path) == [{"n": 1}]
+    
+    log.append({"n": 2, "content": "Résumé ✓"})
+    log.close()
+    assert read_records(path) == [{"n": 1}, {"n": 2, "content": "Résumé ✓"}]
+
+def test_timer_flushes_idle_buffer(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    log = JsonlLog(str(path), flush_interval=0.05)
+    log.append({"n": 1})
+    
+    deadline = time.monotonic() + 5
+    while not read_records(path):
+        assert time.monotonic() < deadline, "record was never flushed"
+        time.sleep(0.02)
+    log.close()
+
+def test_reopening_appends_to_existing_records(tmp_path):
+    path = tmp_path / "nested" / "runs.jsonl"
+    first = JsonlLog(str(path), flush_interval=0)
+    first.append({"n": 1})
+    first.close()
+    
+    second = JsonlLog(str(path), flush_interval=0)
+    second.append({"n": 2})
+    second.close()
+    
+    assert read_records(path) == [{"n": 1}, {"n": 2}]
+
+def test_get_jsonl_log_shares_one_log_per_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(output_writer, "_logs", {})
+    log = get_jsonl_log("runs.jsonl", flush_interval=0)
+    
+    assert get_jsonl_log(str(tmp_path / "runs.jsonl")) is log
+    log.close()
+
+def test_inputs_hash_ignores_key_order():
+    assert inputs_hash([{"role": "user", "content": "hi"}]) == inputs_hash([{"content": "hi", "role": "user"}])
+    assert inputs_hash([{"role": "user", "content": "hi"}]) != inputs_hash([{"role": "user", "content": "hello"}])
+
+def test_save_output_file_writes_streamed_chunks(tmp_path):
+    path = save_output_file(str(tmp_path), iter(["# Title\n", "Body"]), "analysis.md")
+    
+    assert path.endswith("_analysis.md")
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == "# Title\nBody"
@@ -0,0 +1,110 @@
+import pytest
+
+import rate_limit
+from rate_limit import AdaptiveConcurrency, RateLimiter, TokenBucket
+
+class Clock:
+    """Stands in for the time module: monotonic() advances only through sleep()"""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def monotonic(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+class ThrottledError(Exception):
+    status_code = 429
+
+def test_token_bucket_waits_for_refill(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    bucket = TokenBucket(per_minute=60)
+    
+    assert bucket.reserve(60) == 0.0
+    assert bucket.reserve(1) == pytest.approx(1.0)
+    clock.now += 30
+    assert bucket.reserve(29) == 0.0
+
+def test_token_bucket_admits_oversized_requests_once_full(monkeypatch):
+    monkeypatch.setattr(rate_limit, "time", Clock())
+    bucket = TokenBucket(per_minute=60)
+    
+    assert bucket.reserve(500) == 0.0
+
+def test_adaptive_concurrency_grows_additively_and_halves_once_per_cooldown(monkeypatch):
+    clock = Clock()
+    clock.now = 100.0
+    monkeypatch.setattr(rate_limit, "time", clock)
+    concurrency = AdaptiveConcurrency(4, minimum=1, maximum=8)
+    
+    for _ in range(4):
+        assert concurrency.try_acquire()
+    assert not concurrency.try_acquire()
+    concurrency.release()
+    assert concurrency.limit == pytest.approx(4.25)
+    
+    concurrency.release(throttled=True)
+    concurrency.release(throttled=True)
+    assert concurrency.limit == pytest.approx(2.125)
+    assert concurrency.in_flight == 1
+
+def test_call_retries_throttled_requests_with_backoff(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    limiter = RateLimiter(max_retries=3, backoff_base=1.0)
+    attempts = []
+    
+    def flaky():
+        attempts.append(clock.now)
+        if len(attempts) < 3:
+            raise ThrottledError("slow down")
+        return "ok"
+    
+    assert limiter.call(flaky) == "ok"
+    assert len(attempts) == 3
+    assert len(clock.sleeps) == 2
+    assert limiter.concurrency.in_flight == 0
+
+def test_call_does_not_retry_client_errors(monkeypatch):
+    monkeypatch.setattr(rate_limit, "time", Clock())
+    limiter = RateLimiter(max_retries=3)
+    
+    def bad_request():
+        raise ValueError("bad request")
+    
+    with pytest.raises(ValueError):
+        limiter.call(bad_request)
+
+def test_stream_holds_its_concurrency_slot_until_consumed():
+    limiter = RateLimiter(max_concurrency=2)
+    
+    stream = limiter.stream(lambda: iter(["a", "b"]))
+    assert next(stream) == "a"
+    assert limiter.concurrency.in_flight == 1
+    
+    assert list(stream) == ["b"]
+    assert limiter.concurrency.in_flight == 0
+
+def test_stream_releases_its_slot_when_closed_early():
+    limiter = RateLimiter(max_concurrency=2)
+    
+    stream = limiter.stream(lambda: iter(["a", "b"]))
+    next(stream)
+    stream.close()
+    
+    assert limiter.concurrency.in_flight == 0
+
+def test_stream_releases_its_slot_when_opening_fails():
+    limiter = RateLimiter(max_concurrency=2, max_retries=0)
+    
+    def open_stream():
+        raise ValueError("bad request")
+    
+    with pytest.raises(ValueError):
+        list(limiter.stream(open_stream))
+    assert limiter.concurrency.in_flight == 0
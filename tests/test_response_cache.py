@@ -0,0 +1,83 @@
+import response_cache
+from ai_providers import AIProvider
+from response_cache import CachedProvider, ResponseCache
+
+MESSAGES = [{"role": "user", "content": "Review   my\nresume."}]
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+    
+    def time(self):
+        return self.now
+
+class CountingProvider(AIProvider):
+    name = "local"
+    model = "local-sim"
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def generate_response(self, messages, **kwargs):
+        self.calls += 1
+        return f"response {self.calls}"
+    
+    def stream_response(self, messages, **kwargs):
+        self.calls += 1
+        yield "part one, "
+        yield "part two"
+
+def test_keys_ignore_whitespace_but_not_settings():
+    key = ResponseCache.make_key("openai", "gpt-4", 0.7, 4000, MESSAGES)
+    
+    assert key == ResponseCache.make_key("openai", "gpt-4", 0.7, 4000, [{"role": "user", "content": "Review my resume."}])
+    assert key != ResponseCache.make_key("openai", "gpt-4", 0.2, 4000, MESSAGES)
+    assert key != ResponseCache.make_key("anthropic", "gpt-4", 0.7, 4000, MESSAGES)
+
+def test_entries_expire_after_the_ttl(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(response_cache, "time", clock)
+    cache = ResponseCache(str(tmp_path / "responses.sqlite3"), ttl_seconds=60)
+    cache.put("key", "local", "local-sim", "cached")
+    
+    clock.now += 59
+    assert cache.get("key") == "cached"
+    clock.now += 2
+    assert cache.get("key") is None
+    cache.close()
+
+def test_least_recently_used_entries_are_evicted(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(response_cache, "time", clock)
+    cache = ResponseCache(str(tmp_path / "responses.sqlite3"), max_entries=2)
+    for key in ("a", "b"):
+        clock.now += 1
+        cache.put(key, "local", "local-sim", key)
+    clock.now += 1
+    cache.get("a")
+    
+    clock.now += 1
+    cache.put("c", "local", "local-sim", "c")
+    
+    assert [cache.get(key) for key in ("a", "b", "c")] == ["a", None, "c"]
+    cache.close()
+
+def test_cached_provider_serves_repeated_requests(tmp_path):
+    provider = CountingProvider()
+    cached = CachedProvider(provider, ResponseCache(str(tmp_path / "responses.sqlite3")))
+    
+    assert cached.generate_response(MESSAGES) == "response 1"
+    assert cached.generate_response(MESSAGES) == "response 1"
+    assert provider.calls == 1
+    assert cached.model == "local-sim"
+
+def test_cached_provider_caches_only_complete_streams(tmp_path):
+    provider = CountingProvider()
+    cached = CachedProvider(provider, ResponseCache(str(tmp_path / "responses.sqlite3")))
+    
+    stream = cached.stream_response(MESSAGES)
+    next(stream)
+    stream.close()
+    assert list(cached.stream_response(MESSAGES)) == ["part one, ", "part two"]
+    assert list(cached.stream_response(MESSAGES)) == ["part one, part two"]
+    assert provider.calls == 2
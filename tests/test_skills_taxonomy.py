@@ -0,0 +1,59 @@
+from skills_taxonomy import DEFAULT_TAXONOMY_PATH, AhoCorasick, SkillsMatcher, load_taxonomy
+
+def default_matcher():
+    return SkillsMatcher.build(load_taxonomy(DEFAULT_TAXONOMY_PATH), "test")
+
+def test_common_english_words_are_not_skills():
+    text = ("I am writing to express my interest. Last spring I cleaned the rust off a swift boat, "
+            "and I excel at testing ideas and clear communication. Spring is a busy season.")
+    
+    assert default_matcher().find_skills(text) == []
+
+def test_ambiguous_names_match_in_a_skills_list():
+    skills = default_matcher().find_skills(
+        "Skills: Python, Rust, Swift, Spark, Excel, Spring, Express, communication"
+    )
+    
+    assert skills == ['Python', 'Rust', 'Swift', 'Express', 'Spring', 'Apache Spark', 'Excel', 'Communication']
+
+def test_ambiguous_names_match_as_spelled_in_prose():
+    skills = default_matcher().find_skills("Built services in Rust and Swift; reported in Excel.")
+    
+    assert skills == ['Rust', 'Swift', 'Excel']
+
+def test_ambiguous_names_match_in_any_case_in_the_skills_section():
+    skills = default_matcher().find_skills("Jane Doe\nSkills\nspring, rust", skills_section="spring, rust")
+    
+    assert skills == ['Rust', 'Spring']
+
+def test_specific_aliases_still_match():
+    skills = default_matcher().find_skills("Built APIs with Express.js and Spring Boot; wrote services in Rustlang.")
+    
+    assert {"Express", "Spring", "Rust"} <= set(skills)
+
+def test_matches_only_count_whole_words():
+    matcher = SkillsMatcher.build([("AI", []), ("Git", []), ("C++", ["CPP"]), ("Machine Learning", ["ML"])])
+    
+    skills = matcher.find_skills("Sent an email about digital ML work in C++ and git.")
+    
+    assert skills == ["Git", "C++", "Machine Learning"]
+
+def test_automaton_reports_overlapping_patterns():
+    automaton = AhoCorasick([("he", 0), ("she", 1), ("hers", 2)])
+    
+    assert sorted(automaton.iter_matches("ushers")) == [(1, 4, 1), (2, 4, 0), (2, 6, 2)]
+
+def test_from_file_reuses_the_pickled_automaton(tmp_path):
+    taxonomy = tmp_path / "skills.txt"
+    taxonomy.write_text("# languages\nPython | Python3\n\nKubernetes | K8s\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    
+    built = SkillsMatcher.from_file(str(taxonomy), cache_dir=str(cache_dir))
+    cached = SkillsMatcher.from_file(str(taxonomy), cache_dir=str(cache_dir))
+    
+    assert len(list(cache_dir.iterdir())) == 1
+    assert cached.fingerprint == built.fingerprint
+    assert cached.find_skills("Ran python3 services on k8s") == ["Python", "Kubernetes"]
+    
+    taxonomy.write_text("Go | Golang\n", encoding="utf-8")
+    assert SkillsMatcher.from_file(str(taxonomy), cache_dir=str(cache_dir)).find_skills("Golang") == ["Go"]
@@ -0,0 +1,22 @@
+from token_budget import TokenBudget, strip_boilerplate
+
+def test_strip_boilerplate_keeps_content_of_one_line_posting():
+    posting = ("Text: Acme is hiring a senior Python engineer to build data pipelines. "
+               "We are an equal opportunity employer. Remote within the US.")
+    
+    stripped = strip_boilerplate(posting)
+    
+    assert "senior Python engineer to build data pipelines." in stripped
+    assert "Remote within the US." in stripped
+    assert "equal opportunity" not in stripped.lower()
+
+def test_strip_boilerplate_drops_lines_that_are_only_boilerplate():
+    posting = "Build ML models\nWe are an Equal Opportunity Employer.\nPython and SQL"
+    
+    assert strip_boilerplate(posting) == "Build ML models\nPython and SQL"
+
+def test_trim_job_description_keeps_one_line_posting():
+    budget = TokenBudget("gpt-4", max_tokens=1000)
+    posting = "Text: Lead our Kubernetes platform team. EEO employer. Apply via our site."
+    
+    assert "Lead our Kubernetes platform team." in budget.trim_job_description(posting)
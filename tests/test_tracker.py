@@ -0,0 +1,63 @@
+import csv
+
+import tracker
+from tracker import CSV_FORMATS, Tracker
+
+def write_tracker_csv(path, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FORMATS['tracker'])
+        for company, link, follow_up in rows:
+            writer.writerow([company, 'Engineer', link, '', '', 'applied', '', follow_up, '', '', '', ''])
+
+def test_reimport_replaces_edited_rows_and_round_trips(tmp_path):
+    source = tmp_path / "tracker.csv"
+    write_tracker_csv(source, [
+        ("Acme", "https://acme.example/1", "2020-01-01"),
+        ("Globex", "https://globex.example/1", "2020-01-02"),
+        ("Initech", "https://initech.example/1", "")
+    ])
+    store = Tracker(str(tmp_path / "tracker.sqlite3"))
+    store.import_csv(str(source))
+    
+    write_tracker_csv(source, [
+        ("Acme", "https://acme.example/2", "2020-01-01"),
+        ("Globex", "https://globex.example/1", "2020-01-02"),
+        ("Initech", "https://initech.example/1", "")
+    ])
+    stats = store.import_csv(str(source))
+    
+    assert (stats["inserted"], stats["unchanged"], stats["deleted"]) == (1, 2, 1)
+    assert [row["link"] for row in store.due("2020-12-31")] == ["https://acme.example/2", "https://globex.example/1"]
+    exported = tmp_path / "exported.csv"
+    assert store.export_csv("tracker", str(exported)) == 3
+    assert exported.read_text(encoding="utf-8") == source.read_text(encoding="utf-8")
+    store.close()
+
+def test_duplicate_keys_do_not_depend_on_row_position(tmp_path):
+    source = tmp_path / "tracker.csv"
+    duplicate = ("Acme", "https://acme.example/1", "2020-01-05")
+    write_tracker_csv(source, [("Acme", "https://acme.example/1", "2020-01-01"), duplicate])
+    store = Tracker(str(tmp_path / "tracker.sqlite3"))
+    store.import_csv(str(source))
+    
+    write_tracker_csv(source, [
+        ("Globex", "https://globex.example/1", ""),
+        ("Acme", "https://acme.example/1", "2020-01-01"),
+        duplicate
+    ])
+    stats = store.import_csv(str(source))
+    
+    assert (stats["inserted"], stats["unchanged"], stats["deleted"]) == (1, 2, 0)
+    store.close()
+
+def test_paths_fall_back_to_dotenv(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("TRACKER_DB_PATH", raising=False)
+    assert tracker.get_db_path() == tracker.DEFAULT_DB_PATH
+    
+    (tmp_path / ".env").write_text("tracker_db_path=data/jobs.sqlite3\n", encoding="utf-8")
+    assert tracker.get_db_path() == "data/jobs.sqlite3"
+    
+    monkeypatch.setenv("TRACKER_DB_PATH", "env.sqlite3")
+    assert tracker.get_db_path() == "env.sqlite3"
@@ -0,0 +1,195 @@
+import re
+import threading
+from typing import Dict, List, Any
+
+# Context windows by model name prefix; the longest matching prefix wins
+CONTEXT_WINDOWS = {
+    "gpt-4.1": 1047576,
+    "gpt-4o": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4-32k": 32768,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+    "o1": 200000,
+    "o3": 200000,
+    "o4": 200000,
+    "claude": 200000
+}
+
+# Used for models missing from CONTEXT_WINDOWS
+DEFAULT_CONTEXT_WINDOW = 8192
+
+# Chat formatting overhead per message, roughly
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Tokens held back from the window for estimation error
+SAFETY_MARGIN_TOKENS = 256
+
+TRUNCATION_MARKER = "\n[... truncated to fit the token budget ...]"
+
+# Lines in job postings that carry no information about the role itself
+BOILERPLATE_PATTERNS = [
+    r'equal (employment )?opportunity',
+    r'\beeo\b',
+    r'without regard to (race|age|sex|gender|religion)',
+    r'regardless of (race|age|sex|gender|religion)',
+    r'reasonable accommodation',
+    r'e-verify',
+    r'affirmative action',
+    r'(privacy|cookie) (notice|policy)',
+    r'pay transparency',
+    r'background check',
+    r'recruit(ment|ing) agenc(y|ies)',
+    r'unsolicited (resume|application)s?',
+    r'follow us on',
+    r'share this job',
+    r'click (the )?apply',
+    r'all rights reserved'
+]
+
+_BOILERPLATE_RE = re.compile('|'.join(BOILERPLATE_PATTERNS), re.IGNORECASE)
+
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+_encodings: Dict[str, Any] = {}
+_encodings_lock = threading.Lock()
+
+def _get_encoding(model: str):
+    """Get the tiktoken encoding for a model, or None when tiktoken is unavailable.
+
+    tiktoken downloads its BPE files on first use, so failures (no network, not
+    installed) are remembered and the character estimate is used instead.
+    """
+    with _encodings_lock:
+        if model in _encodings:
+            return _encodings[model]
+        
+        try:
+            import tiktoken
+            
+            try:
+                encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                # Non-OpenAI models: cl100k_base is a close enough estimate
+                encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            encoding = None
+        
+        _encodings[model] = encoding
+        return encoding
+
+def context_window(model: str) -> int:
+    """Context window size for a model"""
+    matches = [prefix for prefix in CONTEXT_WINDOWS if model.startswith(prefix)]
+    if not matches:
+        return DEFAULT_CONTEXT_WINDOW
+    return CONTEXT_WINDOWS[max(matches, key=len)]
+
+def dedupe_lines(text: str) -> str:
+    """Drop repeated lines (ignoring case and spacing) and runs of blank lines"""
+    seen = set()
+    kept = []
+    for line in text.splitlines():
+        normalized = ' '.join(line.lower().split())
+        if not normalized:
+            if kept and kept[-1]:
+                kept.append('')
+            continue
+        if normalized in seen:
+            continue
+        seen.add(normalized)
+        kept.append(line.rstrip())
+    
+    return '\n'.join(kept).strip()
+
+def dedupe_items(items: List[str]) -> List[str]:
+    """Drop repeated entries (ignoring case and spacing), keeping the first occurrence"""
+    seen = set()
+    kept = []
+    for item in items:
+        normalized = ' '.join(item.lower().split())
+        if normalized and normalized not in seen:
+            seen.add(normalized)
+            kept.append(item)
+    return kept
+
+def strip_boilerplate(text: str) -> str:
+    """Remove legal and application boilerplate sentences from a job posting.
+
+    Matching is per sentence, so a posting flattened onto one line (as in
+    batch queue CSVs) loses only its boilerplate; a line is dropped only when
+    every sentence on it is boilerplate.
+    """
+    lines = []
+    for line in text.splitlines():
+        if not _BOILERPLATE_RE.search(line):
+            lines.append(line)
+            continue
+        kept = [sentence for sentence in _SENTENCE_SPLIT_RE.split(line) if not _BOILERPLATE_RE.search(sentence)]
+        if any(sentence.strip() for sentence in kept):
+            lines.append(' '.join(kept))
+    return '\n'.join(lines)
+
+class TokenBudget:
+    """Estimates prompt size for a model and trims prompts to fit its budget"""
+    
+    def __init__(self, model: str, max_tokens: int, prompt_budget: int = 0,
+                 job_description_max_tokens: int = 0):
+        self.model = model
+        self.encoding = _get_encoding(model)
+        if prompt_budget <= 0:
+            prompt_budget = context_window(model) - max_tokens - SAFETY_MARGIN_TOKENS
+        self.prompt_budget = max(prompt_budget, 0)
+        self.job_description_max_tokens = job_description_max_tokens
+    
+    def count(self, text: str) -> int:
+        """Number of tokens in text (about 4 characters per token without tiktoken)"""
+        if self.encoding is not None:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        return (len(text) + 3) // 4
+    
+    def count_messages(self, messages: List[Dict[str, Any]]) -> int:
+        return sum(self.count(str(msg["content"])) + MESSAGE_OVERHEAD_TOKENS for msg in messages)
+    
+    def truncate(self, text: str, max_tokens: int, keep_tail: float = 0.0) -> str:
+        """Cut text to max_tokens, marking the cut.
+
+        The beginning is kept; keep_tail is the share of the budget spent on the
+        end of the text instead, so trailing instructions survive.
+        """
+        if self.count(text) <= max_tokens:
+            return text
+        
+        keep = max(max_tokens - self.count(TRUNCATION_MARKER), 0)
+        tail_keep = int(keep * keep_tail)
+        head_keep = keep - tail_keep
+        if self.encoding is not None:
+            tokens = self.encoding.encode(text, disallowed_special=())
+            head = self.encoding.decode(tokens[:head_keep])
+            tail = self.encoding.decode(tokens[len(tokens) - tail_keep:]) if tail_keep else ""
+        else:
+            head = text[:head_keep * 4]
+            tail = text[len(text) - tail_keep * 4:] if tail_keep else ""
+        return head.rstrip() + TRUNCATION_MARKER + ("\n" + tail.lstrip() if tail else "")
+    
+    def trim_job_description(self, text: str) -> str:
+        """Strip boilerplate and repeated lines, then cap the length"""
+        trimmed = dedupe_lines(strip_boilerplate(text))
+        if self.job_description_max_tokens > 0:
+            trimmed = self.truncate(trimmed, self.job_description_max_tokens)
+        return trimmed
+    
+    def fit_messages(self, messages: List[Dict[str, Any]], trim_order: List[int]) -> List[Dict[str, Any]]:
+        """Truncate messages, lowest priority first (indexes in trim_order), until the total fits.
+
+        The middle of a message is cut so both its opening context and its
+        closing instructions are kept.
+        """
+        messages = [dict(msg) for msg in messages]
+        for index in trim_order:
+            excess = self.count_messages(messages) - self.prompt_budget
+            if excess <= 0:
+                break
+            content = messages[index]["content"]
+            messages[index]["content"] = self.truncate(content, max(self.count(content) - excess, 0), keep_tail=0.25)
+        return messages
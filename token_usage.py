@@ -0,0 +1,89 @@
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional
+
+@dataclass
+class TokenUsage:
+    """Token counts reported by a provider for one request"""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    # Prompt tokens served from the provider's prompt cache (included in input_tokens)
+    cached_tokens: int = 0
+    # Prompt tokens written to the provider's prompt cache (included in input_tokens)
+    cache_write_tokens: int = 0
+    
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        return TokenUsage(
+            self.input_tokens + other.input_tokens,
+            self.output_tokens + other.output_tokens,
+            self.cached_tokens + other.cached_tokens,
+            self.cache_write_tokens + other.cache_write_tokens
+        )
+    
+    @property
+    def cache_hit_rate(self) -> float:
+        return self.cached_tokens / self.input_tokens if self.input_tokens else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+    
+    def summary(self) -> str:
+        """One-line description for display"""
+        text = f"{self.input_tokens:,} in"
+        if self.cached_tokens:
+            text += f" ({self.cached_tokens:,} cached, {self.cache_hit_rate:.0%})"
+        text += f" · {self.output_tokens:,} out"
+        return text
+
+class UsageMeter:
+    """Process-wide running total of provider token usage"""
+    
+    def __init__(self):
+        self.total = TokenUsage()
+        self.requests = 0
+        self._lock = threading.Lock()
+    
+    def add(self, usage: TokenUsage) -> None:
+        with self._lock:
+            self.total = self.total + usage
+            self.requests += 1
+
+usage_meter = UsageMeter()
+
+# Usage of the most recent request made from the current thread or task
+_last_usage: ContextVar[Optional[TokenUsage]] = ContextVar("last_usage", default=None)
+
+def record_usage(usage: TokenUsage) -> None:
+    """Record a completed request's usage; called by providers once the response is complete"""
+    _last_usage.set(usage)
+    usage_meter.add(usage)
+
+def get_last_usage() -> Optional[TokenUsage]:
+    return _last_usage.get()
+
+def reset_last_usage() -> None:
+    _last_usage.set(None)
+
+# Prompt trimming notices of the current thread or task, while collect_savings() is active
+_savings_notices: ContextVar[Optional[List[str]]] = ContextVar("savings_notices", default=None)
+
+def report_savings(label: str, before: int, after: int) -> None:
+    """Report tokens saved by trimming part of a prompt: printed, or collected by collect_savings()"""
+    if before <= after:
+        return
+    message = f"✂️  Trimmed {label}: saved {before - after:,} tokens ({before:,} → {after:,})"
+    notices = _savings_notices.get()
+    if notices is None:
+        print(message)
+    else:
+        notices.append(message)
+
+def collect_savings() -> List[str]:
+    """Collect savings notices of the current thread or task into the returned list instead of printing them.
+
+    The daemon uses this to send them to the client that made the request.
+    """
+    notices: List[str] = []
+    _savings_notices.set(notices)
+    return notices
@@ -0,0 +1,230 @@
+import os
+import json
+import time
+import random
+import threading
+import functools
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict
+from typing import List, Dict, Any, Optional, Callable
+
+@dataclass
+class Span:
+    """One timed operation; times are wall-clock nanoseconds since the epoch"""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+    
+    def record_error(self, error: BaseException) -> None:
+        self.error = f"{type(error).__name__}: {error}"
+
+class _NoopSpan:
+    """Stands in for a Span while tracing is off, so call sites need no checks"""
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+    
+    def record_error(self, error: BaseException) -> None:
+        pass
+    
+    def __enter__(self) -> "_NoopSpan":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+_NOOP_SPAN = _NoopSpan()
+
+# Innermost open span in the current thread or task; new spans become its children
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+def _random_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+class _SpanContext:
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+    
+    def __enter__(self) -> Span:
+        self.span = self.tracer.start_span(self.name, **self.attributes)
+        self.token = _current_span.set(self.span)
+        return self.span
+    
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        _current_span.reset(self.token)
+        if exc is not None:
+            self.span.record_error(exc)
+        self.tracer.end_span(self.span)
+
+class Tracer:
+    """Collects spans in memory while enabled; disabled, every call is a cheap no-op"""
+    
+    def __init__(self):
+        self.enabled = False
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+    
+    def enable(self) -> None:
+        self.enabled = True
+    
+    def span(self, name: str, **attributes: Any):
+        """Context manager timing a block as a child of the current span"""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _SpanContext(self, name, attributes)
+    
+    def start_span(self, name: str, **attributes: Any) -> Span:
+        """Open a span without making it current, for work that outlives a block such as a stream"""
+        if not self.enabled:
+            return _NOOP_SPAN
+        parent = _current_span.get()
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent else _random_id(128),
+            span_id=_random_id(64),
+            parent_id=parent.span_id if parent else None,
+            start_ns=time.time_ns(),
+            attributes=attributes
+        )
+    
+    def end_span(self, span: Span) -> None:
+        if not isinstance(span, Span):
+            return
+        span.end_ns = time.time_ns()
+        with self._lock:
+            self.spans.append(span)
+    
+    def export_jsonl(self, path: str) -> None:
+        """One span per line, in the order they finished"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            for span in list(self.spans):
+                f.write(json.dumps(asdict(span), ensure_ascii=False, default=str) + "\n")
+    
+    def export_otlp_json(self, path: str, service_name: str = "career-agent") -> None:
+        """OpenTelemetry OTLP/JSON trace file, loadable by collectors and trace viewers"""
+        def attribute(key: str, value: Any) -> Dict[str, Any]:
+            if isinstance(value, bool):
+                return {"key": key, "value": {"boolValue": value}}
+            if isinstance(value, int):
+                return {"key": key, "value": {"intValue": str(value)}}
+            if isinstance(value, float):
+                return {"key": key, "value": {"doubleValue": value}}
+            return {"key": key, "value": {"stringValue": str(value)}}
+        
+        spans = []
+        for span in list(self.spans):
+            otlp_span = {
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 1,
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [attribute(key, value) for key, value in span.attributes.items()],
+                # STATUS_CODE_ERROR = 2, STATUS_CODE_OK = 1
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1}
+            }
+            if span.parent_id:
+                otlp_span["parentSpanId"] = span.parent_id
+            spans.append(otlp_span)
+        
+        document = {"resourceSpans": [{
+            "resource": {"attributes": [attribute("service.name", service_name)]},
+            "scopeSpans": [{"scope": {"name": "career-agent.tracing"}, "spans": spans}]
+        }]}
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(document, f)
+    
+    def export(self, path: str) -> None:
+        """Export by file name: *.jsonl as span lines, anything else as OTLP/JSON"""
+        if path.endswith('.jsonl'):
+            self.export_jsonl(path)
+        else:
+            self.export_otlp_json(path)
+    
+    def flame_lines(self, width: int = 30) -> List[str]:
+        """Indented timing tree with bars scaled to the slowest root.
+
+        Siblings with the same name are merged (e.g. "pdf.page ×3"), so the
+        breakdown stays readable for batch runs with many identical spans.
+        """
+        spans = list(self.spans)
+        children: Dict[Optional[str], List[Span]] = {}
+        known = {span.span_id for span in spans}
+        for span in spans:
+            parent = span.parent_id if span.parent_id in known else None
+            children.setdefault(parent, []).append(span)
+        
+        roots = children.get(None, [])
+        if not roots:
+            return []
+        scale = max(span.duration_ms for span in roots) or 1.0
+        
+        lines = []
+        
+        def walk(group: List[Span], depth: int) -> None:
+            merged: Dict[str, List[Span]] = {}
+            for span in sorted(group, key=lambda s: s.start_ns):
+                merged.setdefault(span.name, []).append(span)
+            
+            for name, members in merged.items():
+                total = sum(span.duration_ms for span in members)
+                label = f"{name} ×{len(members)}" if len(members) > 1 else name
+                details = _describe(members)
+                bar = "█" * max(1, round(width * min(total / scale, 1.0)))
+                errors = sum(1 for span in members if span.error)
+                suffix = f"  [{errors} failed]" if errors else ""
+                lines.append(
+                    f"{'  ' * depth}{label:<{max(44 - 2 * depth, 10)}} {total:>10.1f} ms  {bar}"
+                    f"{'  ' + details if details else ''}{suffix}"
+                )
+                walk([child for span in members for child in children.get(span.span_id, [])], depth + 1)
+        
+        walk(roots, 0)
+        return lines
+
+def _describe(spans: List[Span]) -> str:
+    """Summed numeric attributes worth showing next to a span's time"""
+    totals: Dict[str, float] = {}
+    for span in spans:
+        for key in ('ttft_ms', 'input_tokens', 'output_tokens', 'cached_tokens', 'pages', 'chars', 'lines', 'sections'):
+            value = span.attributes.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                totals[key] = totals.get(key, 0) + value
+    if 'ttft_ms' in totals and len(spans) > 1:
+        totals['ttft_ms'] /= len(spans)
+    return " ".join(f"{key}={value:,.0f}" for key, value in totals.items())
+
+tracer = Tracer()
+
+def span(name: str, **attributes: Any):
+    """Time a block under the process-wide tracer"""
+    return tracer.span(name, **attributes)
+
+def traced(name: str) -> Callable:
+    """Decorator timing every call of a function as a span"""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
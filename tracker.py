@@ -0,0 +1,276 @@
+import os
+import re
+import csv
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from datetime import date
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from job_queue import record_identity, unique_key
+
+# Job search CSVs the tracker knows how to import and export, by source name
+CSV_FORMATS = {
+    'tracker': ['company', 'role', 'job_link', 'location', 'remote', 'status', 'date_applied',
+                'follow_up_date', 'contact_name', 'contact_email', 'contact_link', 'notes'],
+    'target': ['company', 'role', 'target_tier', 'url', 'fit_reason', 'next_action', 'status', 'notes'],
+    'hn': ['score', 'id', 'created_at', 'author', 'emails', 'salary', 'urls', 'text']
+}
+
+# Database and CSVs used when TRACKER_DB_PATH / TRACKER_CSV_PATHS are not set
+DEFAULT_DB_PATH = os.path.join("job-search", "tracker.sqlite3")
+DEFAULT_CSV_PATHS = [
+    os.path.join("job-search", "application_tracker.csv"),
+    os.path.join("job-search", "ai_world_target_queue.csv"),
+    os.path.join("job-search", "hn_candidate_queue.csv")
+]
+
+# Holds values past the last header column, which hand-edited rows sometimes have
+EXTRA_VALUES_KEY = '_extra'
+
+# Statuses that need no follow-up
+CLOSED_STATUSES = {'rejected', 'closed', 'withdrawn', 'not qualified', 'declined', 'offer accepted'}
+
+# Legal suffixes ignored when matching company names
+COMPANY_SUFFIXES = {'inc', 'incorporated', 'llc', 'ltd', 'limited', 'corp', 'corporation', 'co', 'gmbh', 'plc'}
+
+def _setting(name: str) -> Optional[str]:
+    """A setting from the environment, else from .env (as AgentConfig reads it), else None.
+
+    Only python-dotenv is loaded, not the full AgentConfig, so tracker
+    commands stay fast to start.
+    """
+    value = os.environ.get(name)
+    if value is None and os.path.exists(".env"):
+        from dotenv import dotenv_values
+        
+        values = {key.upper(): value for key, value in dotenv_values(".env").items()}
+        value = values.get(name)
+    return value or None
+
+def get_db_path() -> str:
+    """Tracker database path: TRACKER_DB_PATH (environment or .env) or the job search default"""
+    return _setting("TRACKER_DB_PATH") or DEFAULT_DB_PATH
+
+def get_csv_paths() -> List[str]:
+    """CSVs imported by default: TRACKER_CSV_PATHS (separated by os.pathsep) or the job search queues"""
+    paths = _setting("TRACKER_CSV_PATHS")
+    return [path for path in paths.split(os.pathsep) if path] if paths else list(DEFAULT_CSV_PATHS)
+
+def normalize_company(name: str) -> str:
+    """Match key for a company name: lowercase words without punctuation or legal suffixes"""
+    words = re.sub(r'[^a-z0-9]+', ' ', name.lower()).split()
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+def detect_format(columns: List[str]) -> str:
+    """Name of the CSV format whose columns a header contains"""
+    for source, expected in CSV_FORMATS.items():
+        if set(expected) <= set(columns):
+            return source
+    raise ValueError(f"Unrecognized job search CSV columns: {', '.join(columns)}")
+
+def _row_fields(record: Dict[str, str]) -> Dict[str, str]:
+    """Indexed fields for a CSV record"""
+    key, company, role = record_identity(record)
+    return {
+        'key': key,
+        'company': company,
+        'role': role,
+        'status': (record.get('status') or '').strip(),
+        'link': (record.get('job_link') or record.get('url') or '').strip(),
+        'follow_up_date': (record.get('follow_up_date') or '').strip() or None
+    }
+
+class Tracker:
+    """SQLite application tracker with indexed lookups by company, status and follow-up date"""
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS applications ("
+            " id INTEGER PRIMARY KEY,"
+            " source TEXT NOT NULL,"
+            " source_key TEXT NOT NULL,"
+            " company TEXT NOT NULL,"
+            " company_norm TEXT NOT NULL,"
+            " role TEXT NOT NULL,"
+            " status TEXT NOT NULL COLLATE NOCASE,"
+            " link TEXT NOT NULL,"
+            " follow_up_date TEXT,"
+            " data TEXT NOT NULL,"
+            " row_hash TEXT NOT NULL,"
+            " position INTEGER NOT NULL DEFAULT 0,"
+            " updated_at REAL NOT NULL,"
+            " UNIQUE (source, source_key));"
+            "CREATE INDEX IF NOT EXISTS idx_applications_company ON applications (company_norm);"
+            "CREATE INDEX IF NOT EXISTS idx_applications_status ON applications (status);"
+            "CREATE INDEX IF NOT EXISTS idx_applications_follow_up ON applications (follow_up_date);"
+            "CREATE TABLE IF NOT EXISTS sources ("
+            " source TEXT PRIMARY KEY,"
+            " path TEXT NOT NULL,"
+            " columns TEXT NOT NULL,"
+            " file_hash TEXT NOT NULL,"
+            " imported_at REAL NOT NULL);"
+        )
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(applications)")}
+        if "position" not in columns:
+            # Databases from before rows kept their CSV position export in id order until reimported
+            self._conn.execute("ALTER TABLE applications ADD COLUMN position INTEGER NOT NULL DEFAULT 0")
+        self._conn.commit()
+    
+    def import_csv(self, csv_path: str) -> Dict[str, int]:
+        """Import a job search CSV incrementally.
+
+        An unchanged file is skipped outright; otherwise only new rows and rows
+        whose contents changed are written, and rows no longer in the CSV are
+        deleted, so the source exports back out as the file it was imported from.
+        """
+        with open(csv_path, 'rb') as f:
+            file_hash = hashlib.sha256(f.read()).hexdigest()
+        
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.DictReader(f, restkey=EXTRA_VALUES_KEY)
+            columns = list(reader.fieldnames or [])
+            records = list(reader)
+        source = detect_format(columns)
+        
+        stats = {"source": source, "inserted": 0, "updated": 0, "unchanged": 0, "deleted": 0}
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT file_hash FROM sources WHERE source = ?", (source,)
+            ).fetchone()
+            if previous and previous["file_hash"] == file_hash:
+                stats["unchanged"] = len(records)
+                return stats
+            
+            existing = {row["source_key"]: (row["row_hash"], row["position"]) for row in self._conn.execute(
+                "SELECT source_key, row_hash, position FROM applications WHERE source = ?", (source,)
+            )}
+            
+            now = time.time()
+            seen_keys = set()
+            changes = []
+            moved = []
+            for position, record in enumerate(records):
+                fields = _row_fields(record)
+                key = unique_key(fields['key'], record, seen_keys)
+                
+                data = json.dumps(record, ensure_ascii=False, sort_keys=True)
+                row_hash = hashlib.sha1(data.encode('utf-8')).hexdigest()
+                if key in existing and existing[key][0] == row_hash:
+                    stats["unchanged"] += 1
+                    if existing[key][1] != position:
+                        moved.append((position, source, key))
+                    continue
+                stats["updated" if key in existing else "inserted"] += 1
+                changes.append((
+                    source, key, fields['company'], normalize_company(fields['company']), fields['role'],
+                    fields['status'], fields['link'], fields['follow_up_date'], data, row_hash, position, now
+                ))
+            
+            self._conn.executemany(
+                "INSERT INTO applications (source, source_key, company, company_norm, role, status, link,"
+                " follow_up_date, data, row_hash, position, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (source, source_key) DO UPDATE SET"
+                " company = excluded.company, company_norm = excluded.company_norm, role = excluded.role,"
+                " status = excluded.status, link = excluded.link, follow_up_date = excluded.follow_up_date,"
+                " data = excluded.data, row_hash = excluded.row_hash, position = excluded.position,"
+                " updated_at = excluded.updated_at",
+                changes
+            )
+            self._conn.executemany(
+                "UPDATE applications SET position = ? WHERE source = ? AND source_key = ?", moved
+            )
+            removed = [(source, key) for key in existing if key not in seen_keys]
+            self._conn.executemany("DELETE FROM applications WHERE source = ? AND source_key = ?", removed)
+            stats["deleted"] = len(removed)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sources (source, path, columns, file_hash, imported_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (source, str(csv_path), json.dumps(columns), file_hash, now)
+            )
+            self._conn.commit()
+        
+        return stats
+    
+    def export_csv(self, source: str, csv_path: str) -> int:
+        """Write a source back out in its original CSV format, in import order"""
+        with self._lock:
+            imported = self._conn.execute(
+                "SELECT columns FROM sources WHERE source = ?", (source,)
+            ).fetchone()
+            columns = json.loads(imported["columns"]) if imported else CSV_FORMATS[source]
+            rows = self._conn.execute(
+                "SELECT data FROM applications WHERE source = ? ORDER BY position, id", (source,)
+            ).fetchall()
+        
+        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for row in rows:
+                record = json.loads(row["data"])
+                writer.writerow([record.get(column) or '' for column in columns] + record.get(EXTRA_VALUES_KEY, []))
+        
+        return len(rows)
+    
+    def _query(self, sql: str, params: Tuple = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params).fetchall()]
+    
+    def due(self, on_or_before: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Open applications whose follow-up date has arrived"""
+        on_or_before = on_or_before or date.today().isoformat()
+        closed = sorted(CLOSED_STATUSES)
+        placeholders = ', '.join('?' for _ in closed)
+        return self._query(
+            "SELECT source, company, role, status, link, follow_up_date FROM applications"
+            " WHERE follow_up_date IS NOT NULL AND follow_up_date <= ?"
+            f" AND status NOT IN ({placeholders})"
+            " ORDER BY follow_up_date, company",
+            (on_or_before, *closed)
+        )
+    
+    def by_status(self, status: str) -> List[Dict[str, Any]]:
+        """Applications with a status (case-insensitive)"""
+        return self._query(
+            "SELECT source, company, role, status, link, follow_up_date FROM applications"
+            " WHERE status = ? ORDER BY company, role",
+            (status,)
+        )
+    
+    def status_counts(self) -> List[Dict[str, Any]]:
+        return self._query(
+            "SELECT status, COUNT(*) AS count FROM applications GROUP BY status ORDER BY count DESC"
+        )
+    
+    def by_company(self, company: str) -> List[Dict[str, Any]]:
+        """Every row for a company, across sources, to check whether it was already contacted"""
+        return self._query(
+            "SELECT source, company, role, status, link, follow_up_date FROM applications"
+            " WHERE company_norm = ? ORDER BY source, role",
+            (normalize_company(company),)
+        )
+    
+    def duplicates(self) -> List[Dict[str, Any]]:
+        """Companies that appear in more than one row, with their sources and statuses"""
+        return self._query(
+            "SELECT MIN(company) AS company, COUNT(*) AS count,"
+            " GROUP_CONCAT(DISTINCT source) AS sources, GROUP_CONCAT(DISTINCT status) AS statuses"
+            " FROM applications WHERE company_norm != ''"
+            " GROUP BY company_norm HAVING COUNT(*) > 1 ORDER BY count DESC, company"
+        )
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()